@@ -0,0 +1,77 @@
+# benchmarks/bench_cauda.py
+"""
+Chamadas em cauda (`return f(...)`): trampolim no executor de closures e
+TAIL_CALL no VM, contra o backend Python (recursão de verdade na pilha do
+Python) e contra o mesmo cálculo escrito com `while`.
+
+Mede recursão direta (conta) e mútua (par/impar) numa profundidade que ainda
+cabe na pilha e em 1M, onde só os executores com chamada em cauda terminam.
+
+Uso: python benchmarks/bench_cauda.py [--profundidades 100000 1000000]
+"""
+
+import argparse
+
+from common import cronometrar
+from src.parser.parser import Parser
+from src.executor import transpile
+from src.executor.bytecode import compile_module
+from src.executor.closures import compile_program
+from src.executor.runtime import NocSysRuntimeError
+from src.executor.vm import VM
+
+CARGAS = {
+    'direta': '''
+        func conta(n, acc) {{ if (n == 0) {{ return acc; }} return conta(n - 1, acc + 1); }}
+        print(conta({n}, 0));
+    ''',
+    'mútua': '''
+        func par(n) {{ if (n == 0) {{ return true; }} return impar(n - 1); }}
+        func impar(n) {{ if (n == 0) {{ return false; }} return par(n - 1); }}
+        print(par({n}));
+    ''',
+    'while': '''
+        var n = {n}; var acc = 0;
+        while (n > 0) {{ n = n - 1; acc = acc + 1; }}
+        print(acc);
+    ''',
+}
+
+
+def descartar(texto):
+    pass
+
+
+def executores(program):
+    closures = compile_program(program, descartar)
+    module = compile_module(program)
+    code = transpile.compile_program(program)
+    return {
+        'closures': closures.run,
+        'VM': lambda: VM(module, descartar).run(),
+        'python': lambda: transpile.execute(code, descartar),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--profundidades', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--repeticoes', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'carga':<8} | {'profundidade':>12} | {'closures (s)':>12} | {'VM (s)':>8} | "
+          f"{'python (s)':>10}")
+    for n in args.profundidades:
+        for nome, source in CARGAS.items():
+            tempos = []
+            for executar in executores(Parser(source.format(n=n)).parse()).values():
+                try:
+                    tempo, _ = cronometrar(executar, repeticoes=args.repeticoes)
+                    tempos.append(f"{tempo:.3f}")
+                except NocSysRuntimeError:
+                    tempos.append('estouro')
+            print(f"{nome:<8} | {n:>12} | {tempos[0]:>12} | {tempos[1]:>8} | {tempos[2]:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+# benchmarks/bench_executor.py
+"""
+Executor de closures (src/executor/closures.py) contra o interpretador
+ingênuo que percorre a AST (src/executor/walker.py).
+
+Cargas:
+- fib: fibonacci recursivo (chamadas de função, if, return);
+- laco: laços while aninhados com aritmética e variáveis locais/globais.
+
+O tempo do executor de closures inclui a compilação da AST; o parse fica de
+fora nos dois.
+
+Uso: python benchmarks/bench_executor.py [--fib 24] [--laco 300]
+"""
+
+import argparse
+
+from common import cronometrar
+from src.parser.parser import Parser
+from src.executor.closures import compile_program
+from src.executor.walker import TreeWalker
+
+FIB = '''
+func fib(n) {{
+    if (n < 2) {{ return n; }}
+    return fib(n - 1) + fib(n - 2);
+}}
+print(fib({n}));
+'''
+
+LACO = '''
+var total = 0;
+func passo(i, j) {{ return (i * j) // 3 - j; }}
+var i = 0;
+while (i < {n}) {{
+    var j = 0;
+    while (j < {n}) {{
+        var t = i * 2 + j;
+        if (t > j * 3) {{ total = total + passo(i, j); }} else {{ total = total - 1; }}
+        j = j + 1;
+    }}
+    i = i + 1;
+}}
+print(total);
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fib', type=int, default=24)
+    parser.add_argument('--laco', type=int, default=300, help='lado do laço duplo')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    cargas = {
+        f'fib({args.fib})': FIB.format(n=args.fib),
+        f'laço {args.laco}x{args.laco}': LACO.format(n=args.laco),
+    }
+    print(f"{'carga':<14} | {'walker (s)':>10} | {'closures (s)':>12} | {'compilação (ms)':>15} | {'ganho':>6}")
+    for nome, source in cargas.items():
+        program = Parser(source).parse()
+        saida_walker, saida_closures = [], []
+        tempo_walker, _ = cronometrar(lambda: TreeWalker(saida_walker.append).run(program),
+                                      repeticoes=args.repeticoes)
+        tempo_compilacao, _ = cronometrar(lambda: compile_program(program, saida_closures.append),
+                                          repeticoes=args.repeticoes)
+        tempo_closures, _ = cronometrar(
+            lambda: compile_program(program, saida_closures.append).run(),
+            repeticoes=args.repeticoes)
+        assert saida_walker[-1] == saida_closures[-1]
+        print(f"{nome:<14} | {tempo_walker:>10.3f} | {tempo_closures:>12.3f} | "
+              f"{tempo_compilacao * 1000:>15.3f} | {tempo_walker / tempo_closures:>5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+# benchmarks/bench_expressoes.py
+"""
+Parse de código com muitas expressões (precedence climbing).
+
+Mede o parse a partir de um TokenBuffer e, para isolar o Parser, a partir de
+uma lista de Tokens já materializados (sem o custo de criar cada Token).
+Também conta as chamadas de função Python por token.
+
+Uso: python benchmarks/bench_expressoes.py [--mb 1]
+"""
+
+import argparse
+import cProfile
+import pstats
+
+from common import gerar_expressoes, cronometrar
+from src.lexer.buffer import TokenBuffer
+from src.parser.parser import Parser
+
+
+class ListaDeTokens:
+    """Tokens já prontos, com a mesma interface `reader()` do TokenBuffer."""
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def reader(self):
+        proximo = iter(self.tokens).__next__
+        eof = self.tokens[-1]
+
+        def next_token():
+            try:
+                return proximo()
+            except StopIteration:
+                return eof
+
+        return next_token
+
+
+def chamadas_por_token(tokens, n_tokens):
+    perfil = cProfile.Profile()
+    perfil.runcall(lambda: Parser(tokens=tokens).parse())
+    return pstats.Stats(perfil).total_calls / n_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mb', type=float, default=1.0, help='tamanho da entrada em MB')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    source = gerar_expressoes(int(args.mb * 1024 * 1024))
+    buffer = TokenBuffer.from_source(source)
+    n_tokens = len(buffer)
+    print(f"Entrada: {len(source) / 1024 / 1024:.1f} MB, {n_tokens} tokens")
+
+    lista = ListaDeTokens(list(buffer))
+
+    for nome, tokens in (('TokenBuffer', buffer), ('lista de Tokens', lista)):
+        tempo, _ = cronometrar(lambda: Parser(tokens=tokens).parse(), repeticoes=args.repeticoes)
+        print(f"{nome:<16} | {tempo:6.2f} s | {n_tokens / tempo:>12,.0f} tokens/s")
+    print(f"chamadas Python por token: {chamadas_por_token(lista, n_tokens):.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_folding.py
+"""
+Dobra de constantes (src/optimizer/folding.py): nós eliminados, custo da
+passada e execução com e sem dobra nos executores de closures e Python.
+
+A carga imita código gerado: constantes escritas por extenso e identidades
+(`* 1`, `+ 0`, `- -x`) dentro de um laço.
+
+Uso: python benchmarks/bench_folding.py [--laco 200000] [--kb 256]
+"""
+
+import argparse
+
+from common import gerar_programa, cronometrar
+from src.parser.parser import Parser
+from src.optimizer import fold_constants
+from src.executor import transpile
+from src.executor.closures import compile_program
+
+LACO = '''
+var total = 0.0; var i = 0;
+while (i < {n} * 1) {{
+    var area = 2 * 3.14159 * 1 * (i + 0);
+    total = total + area * (60 * 60 * 24) / (1000 * 1000) - - (2 ** 10 - 1024);
+    i = - -i + 1 + 0;
+}}
+print(total);
+'''
+
+
+def descartar(texto):
+    pass
+
+
+def executor_closures(program):
+    return compile_program(program, descartar).run
+
+
+def executor_python(program):
+    code = transpile.compile_program(program)
+    return lambda: transpile.execute(code, descartar)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--laco', type=int, default=200_000)
+    parser.add_argument('--kb', type=float, default=256.0, help='programa gerado para medir a passada')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    program = Parser(gerar_programa(int(args.kb * 1024))).parse()
+    t_fold, (_, stats) = cronometrar(fold_constants, program, repeticoes=args.repeticoes)
+    print(f"programa de {args.kb:.0f} KB: {stats.nodes_before} nós, {stats.eliminated} eliminados, "
+          f"passada em {t_fold * 1000:.1f} ms")
+
+    original = Parser(LACO.format(n=args.laco)).parse()
+    dobrado, stats = fold_constants(original)
+    print(f"laço {args.laco}: {stats.nodes_before} -> {stats.nodes_after} nós "
+          f"({stats.folded} dobras, {stats.identities} identidades)")
+    print(f"{'backend':<10} | {'original (s)':>12} | {'dobrado (s)':>11} | {'ganho':>6}")
+    for nome, preparar in (('closures', executor_closures), ('python', executor_python)):
+        t_original, _ = cronometrar(preparar(original), repeticoes=args.repeticoes)
+        t_dobrado, _ = cronometrar(preparar(dobrado), repeticoes=args.repeticoes)
+        print(f"{nome:<10} | {t_original:>12.3f} | {t_dobrado:>11.3f} | "
+              f"{t_original / t_dobrado:>5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
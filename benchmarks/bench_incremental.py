@@ -0,0 +1,70 @@
+# benchmarks/bench_incremental.py
+"""
+Latência do reparse incremental para edições de um caractere.
+
+Gera um programa com ~50 mil linhas e aplica edições de um caractere em
+posições aleatórias (trocar um dígito, inserir um espaço, inserir uma quebra
+de linha), comparando `incremental.reparse` com o parse completo.
+
+Uso: python benchmarks/bench_incremental.py [--linhas 50000] [--edicoes 200]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from common import UNIDADE, gerar_programa, cronometrar
+from src.parser.parser import Parser
+from src.parser.incremental import TextEdit, parse, reparse
+
+
+def edicao_aleatoria(source, rnd):
+    """Edição de um caractere que mantém o programa válido."""
+    while True:
+        pos = rnd.randrange(len(source))
+        char = source[pos]
+        tipo = rnd.choice(('digito', 'espaco', 'linha'))
+        if tipo == 'digito' and char.isdigit():
+            return TextEdit(pos, pos + 1, str((int(char) + 1) % 10))
+        if tipo == 'espaco' and char == ' ':
+            return TextEdit(pos, pos, ' ')
+        if tipo == 'linha' and char == ';':
+            return TextEdit(pos + 1, pos + 1, '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--linhas', type=int, default=50_000)
+    parser.add_argument('--edicoes', type=int, default=200)
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    unidades = args.linhas // UNIDADE.count('\n') + 1
+    source = gerar_programa(len(UNIDADE.format(i=unidades)) * unidades)
+    print(f"Entrada: {source.count(chr(10))} linhas, {len(source) / 1024 / 1024:.1f} MB")
+
+    tempo_completo, _ = cronometrar(lambda: Parser(source).parse())
+    print(f"parse completo        | {tempo_completo * 1000:9.1f} ms")
+    tempo_inicial, program = cronometrar(lambda: parse(source))
+    print(f"parse com trechos     | {tempo_inicial * 1000:9.1f} ms")
+
+    rnd = random.Random(args.semente)
+    tempos = []
+    for _ in range(args.edicoes):
+        edit = edicao_aleatoria(source, rnd)
+        inicio = time.perf_counter()
+        program, source = reparse(program, source, edit)
+        tempos.append(time.perf_counter() - inicio)
+
+    tempos.sort()
+    p95 = tempos[int(len(tempos) * 0.95) - 1]
+    print(f"reparse (mediana)     | {statistics.median(tempos) * 1000:9.2f} ms")
+    print(f"reparse (p95)         | {p95 * 1000:9.2f} ms")
+    print(f"reparse (máximo)      | {tempos[-1] * 1000:9.2f} ms")
+
+    assert program == Parser(source).parse(), "reparse divergiu do parse completo"
+
+
+if __name__ == '__main__':
+    main()
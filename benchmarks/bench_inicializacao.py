@@ -0,0 +1,66 @@
+# benchmarks/bench_inicializacao.py
+"""
+Mede a latência do import do lexer até o primeiro token em processos novos,
+com o cache de tabelas desligado, frio (diretório vazio) e quente. Mostra
+também só o trecho Lexer() + next_token(), onde as tabelas são carregadas.
+
+Uso: python benchmarks/bench_inicializacao.py [--repeticoes 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from common import RAIZ
+
+PROGRAMA = (
+    "import time\n"
+    "inicio = time.perf_counter()\n"
+    "from src.lexer.lexer import Lexer\n"
+    "importado = time.perf_counter()\n"
+    "Lexer('var x = 1;').next_token()\n"
+    "fim = time.perf_counter()\n"
+    "print(fim - inicio, fim - importado)\n"
+)
+
+
+def medir(env):
+    """Retorna (import até o primeiro token, só o primeiro token) em ms."""
+    saida = subprocess.run([sys.executable, '-c', PROGRAMA], cwd=RAIZ, env=env,
+                           capture_output=True, text=True, check=True)
+    total, primeiro = saida.stdout.split()
+    return float(total) * 1000, float(primeiro) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeticoes', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        base = dict(os.environ, NOCSYS_CACHE_DIR=diretorio)
+        sem_cache = dict(base, NOCSYS_NO_CACHE='1')
+
+        def frio():
+            for nome in os.listdir(diretorio):
+                os.unlink(os.path.join(diretorio, nome))
+            return medir(base)
+
+        cenarios = [
+            ('sem cache', lambda: medir(sem_cache)),
+            ('cache frio', frio),
+            ('cache quente', lambda: medir(base)),
+        ]
+        print(f"{'cenário':<13} | {'import -> 1º token':>18} | {'Lexer() + 1º token':>18}")
+        for nome, rodar in cenarios:
+            medidas = [rodar() for _ in range(args.repeticoes)]
+            total = statistics.median(m[0] for m in medidas)
+            primeiro = statistics.median(m[1] for m in medidas)
+            print(f"{nome:<13} | {total:15.1f} ms | {primeiro:15.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
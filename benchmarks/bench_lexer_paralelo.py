@@ -0,0 +1,53 @@
+# benchmarks/bench_lexer_paralelo.py
+"""
+Ganho do lexer paralelo (src/lexer/parallel.py) sobre a passada sequencial.
+
+Gera um programa sintético de ~100 MB, lexa sequencialmente para um
+TokenBuffer e depois com `lex_parallel` usando 2, 4, ... processos (até o
+número de núcleos), conferindo que as colunas são idênticas.
+
+Uso: python benchmarks/bench_lexer_paralelo.py [--mb 100] [--max-workers N]
+"""
+
+import argparse
+import os
+
+from common import gerar_programa, cronometrar
+from src.lexer.buffer import TokenBuffer
+from src.lexer.lexer import Lexer
+from src.lexer.parallel import lex_parallel, split_points
+
+
+def colunas(buffer):
+    return (buffer.kinds, buffer.starts, buffer.lengths, buffer.lines, buffer.columns)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mb', type=float, default=100.0, help='tamanho da entrada em MB')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    source = gerar_programa(int(args.mb * 1024 * 1024))
+    print(f"Entrada: {len(source) / (1024 * 1024):.1f} MB, {os.cpu_count()} núcleos")
+
+    tempo, _ = cronometrar(split_points, source, 64)
+    print(f"Busca de 63 cortes: {tempo * 1000:.1f} ms")
+
+    base, esperado = cronometrar(lambda: TokenBuffer.from_source(source, lexer=Lexer(source)))
+    print(f"{'workers':>8} | {'tempo (s)':>9} | {'MB/s':>6} | {'ganho':>5}")
+    print(f"{'seq.':>8} | {base:>9.2f} | {args.mb / base:>6.1f} | {1:>4.2f}x")
+
+    workers = 2
+    while True:
+        workers = min(workers, args.max_workers)
+        tempo, buffer = cronometrar(lex_parallel, source, workers)
+        assert colunas(buffer) == colunas(esperado)
+        print(f"{workers:>8} | {tempo:>9.2f} | {args.mb / tempo:>6.1f} | {base / tempo:>4.2f}x")
+        if workers >= args.max_workers:
+            break
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_lote.py
+"""
+Vazão da compilação em lote (src/batch.py) conforme o número de workers.
+
+Gera um diretório temporário com muitos arquivos .noc sintéticos e compila
+todos com 1, 2, 4, ... processos (até o número de núcleos), mostrando
+arquivos/s, MB/s e o ganho sobre 1 worker.
+
+Uso: python benchmarks/bench_lote.py [--arquivos 2000] [--kb 8] [--max-workers N]
+"""
+
+import argparse
+import os
+import tempfile
+
+from common import gerar_programa, cronometrar
+from src.batch import coletar_arquivos, compilar_lote
+
+
+def contagens_de_workers(maximo: int):
+    workers = 1
+    while workers < maximo:
+        yield workers
+        workers *= 2
+    yield maximo
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--arquivos', type=int, default=2000)
+    parser.add_argument('--kb', type=float, default=8.0, help='tamanho de cada arquivo em KB')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    source = gerar_programa(int(args.kb * 1024))
+    with tempfile.TemporaryDirectory() as raiz:
+        for i in range(args.arquivos):
+            with open(os.path.join(raiz, f'arquivo_{i:05d}.noc'), 'w', encoding='utf-8') as f:
+                f.write(source)
+        arquivos = coletar_arquivos([raiz])
+        mb = len(source) * len(arquivos) / (1024 * 1024)
+        print(f"{len(arquivos)} arquivos, {mb:.1f} MB, {os.cpu_count()} núcleos")
+        print(f"{'workers':>8} | {'tempo (s)':>9} | {'arquivos/s':>10} | {'MB/s':>6} | {'ganho':>5}")
+
+        base = None
+        for workers in contagens_de_workers(args.max_workers):
+            tempo, resultados = cronometrar(compilar_lote, arquivos, workers,
+                                            repeticoes=args.repeticoes)
+            assert all(r['ok'] for r in resultados)
+            base = base or tempo
+            print(f"{workers:>8} | {tempo:>9.2f} | {len(arquivos) / tempo:>10.0f} | "
+                  f"{mb / tempo:>6.1f} | {base / tempo:>4.2f}x")
+
+
+if __name__ == '__main__':
+    main()
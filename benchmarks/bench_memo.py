@@ -0,0 +1,66 @@
+# benchmarks/bench_memo.py
+"""
+Memoização de funções puras no executor de closures (`memoize=N`).
+
+Fibonacci recursivo (o `fibonacci_recursivo` de examples/fibonacci.pys,
+escrito em NocSys): sem cache o número de chamadas cresce como fib(n), com
+cache cada n é calculado uma vez e o tempo fica linear.
+
+Uso: python benchmarks/bench_memo.py [--sem-cache 15 20 25] [--com-cache 25 500 1000 2000]
+"""
+
+import argparse
+
+from common import cronometrar
+from src.parser.parser import Parser
+from src.executor.closures import compile_program
+
+FIB = '''
+func fibonacci_recursivo(n) {{
+    if (n <= 0) {{ return 0; }}
+    if (n == 1) {{ return 1; }}
+    return fibonacci_recursivo(n - 1) + fibonacci_recursivo(n - 2);
+}}
+print(fibonacci_recursivo({n}));
+'''
+
+
+def descartar(texto):
+    pass
+
+
+def medir(n: int, memoize: int, repeticoes: int):
+    program = Parser(FIB.format(n=n)).parse()
+
+    def executar():
+        compiled = compile_program(program, descartar, memoize)
+        compiled.run()
+        return compiled.caches.get('fibonacci_recursivo')
+    return cronometrar(executar, repeticoes=repeticoes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sem-cache', type=int, nargs='+', default=[15, 20, 25])
+    parser.add_argument('--com-cache', type=int, nargs='+', default=[25, 500, 1000, 2000])
+    parser.add_argument('--tamanho', type=int, default=4096, help='entradas do cache por função')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'n':>6} | {'cache':>5} | {'tempo (ms)':>11} | {'chamadas':>9} | {'acertos':>8}")
+    a, b = 1, 1  # chamadas de fib sem cache: 2 * fib(n + 1) - 1
+    chamadas = {}
+    for n in range(max(args.sem_cache) + 1):
+        chamadas[n] = 2 * a - 1
+        a, b = b, a + b
+    for n in args.sem_cache:
+        tempo, _ = medir(n, 0, args.repeticoes)
+        print(f"{n:>6} | {'não':>5} | {tempo * 1000:>11.2f} | {chamadas[n]:>9} | {0:>8}")
+    for n in args.com_cache:
+        tempo, cache = medir(n, args.tamanho, args.repeticoes)
+        print(f"{n:>6} | {'sim':>5} | {tempo * 1000:>11.2f} | {cache.hits + cache.misses:>9} | "
+              f"{cache.hits:>8}")
+
+
+if __name__ == '__main__':
+    main()
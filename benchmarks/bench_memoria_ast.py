@@ -0,0 +1,85 @@
+# benchmarks/bench_memoria_ast.py
+"""
+Memória da AST por 100 mil nós.
+
+Compara a AST de objetos (classes de src/parser/ast.py, com os Tokens que
+elas referenciam) com a AST em arena (src/parser/arena.py: arrays tipados
+que apontam para um TokenBuffer). A memória é medida com tracemalloc: o que
+continua alocado depois do parse, com a entrada e o buffer já prontos; a
+última linha soma as colunas do TokenBuffer, que a arena mantém vivo.
+
+Uso: python benchmarks/bench_memoria_ast.py [--mb 2]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from common import gerar_programa
+from src.lexer.buffer import TokenBuffer
+from src.parser.parser import Parser
+from src.parser.arena import AstArena
+
+
+def medir(construir):
+    """(bytes retidos, resultado) de `construir()`."""
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    resultado = construir()
+    gc.collect()
+    depois = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return depois - antes, resultado
+
+
+def contar_nos(program):
+    """Quantidade de nós da AST de objetos (percurso com pilha explícita)."""
+    total = 0
+    pilha = [program]
+    while pilha:
+        node = pilha.pop()
+        total += 1
+        for name in node.__dataclass_fields__:
+            value = getattr(node, name)
+            if isinstance(value, list):
+                pilha.extend(value)
+            elif hasattr(value, '__dataclass_fields__') and not hasattr(value, 'kind'):
+                pilha.append(value)
+    return total
+
+
+def tamanho_buffer(buffer):
+    colunas = (buffer.types, buffer.kinds, buffer.starts, buffer.lengths,
+               buffer.lines, buffer.columns)
+    return sum(coluna.itemsize * len(coluna) for coluna in colunas)
+
+
+def linha(nome, tamanho, nos):
+    print(f"{nome:<19} | {tamanho / 1024 / 1024:7.1f} MB | "
+          f"{tamanho / nos * 100_000 / 1024 / 1024:6.2f} MB por 100k nós")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mb', type=float, default=2.0, help='tamanho da entrada em MB')
+    args = parser.parse_args()
+
+    source = gerar_programa(int(args.mb * 1024 * 1024))
+    buffer = TokenBuffer.from_source(source)
+
+    tamanho, program = medir(lambda: Parser(tokens=buffer).parse())
+    nos = contar_nos(program)
+    del program
+    print(f"Entrada: {len(source) / 1024 / 1024:.1f} MB, {len(buffer)} tokens, {nos} nós")
+    linha('objetos', tamanho, nos)
+
+    tamanho, arena = medir(lambda: AstArena.from_buffer(buffer))
+    assert len(arena) == nos
+    linha('arena', tamanho, nos)
+    # O TokenBuffer já existia antes da medição; a arena depende dele
+    linha('arena + TokenBuffer', tamanho + tamanho_buffer(buffer), nos)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+# benchmarks/bench_parser.py
+"""
+Throughput do Parser num programa sintético grande.
+
+Mede o parse completo (lexer + parser) e o parse a partir de um TokenBuffer
+já tokenizado, que isola o custo do parser.
+
+Uso: python benchmarks/bench_parser.py [--mb 2]
+"""
+
+import argparse
+
+from common import gerar_programa, cronometrar
+from src.lexer.buffer import TokenBuffer
+from src.parser.parser import Parser
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mb', type=float, default=2.0, help='tamanho da entrada em MB')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    source = gerar_programa(int(args.mb * 1024 * 1024))
+    buffer = TokenBuffer.from_source(source)
+    n_tokens = len(buffer)
+    print(f"Entrada: {len(source) / 1024 / 1024:.1f} MB, {n_tokens} tokens")
+
+    cenarios = [
+        ('lexer + parser', lambda: Parser(source).parse()),
+        ('só parser', lambda: Parser(tokens=buffer).parse()),
+    ]
+    for nome, rodar in cenarios:
+        tempo, _ = cronometrar(rodar, repeticoes=args.repeticoes)
+        print(f"{nome:<15} | {tempo:6.2f} s | {n_tokens / tempo:>12,.0f} tokens/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# benchmarks/bench_relex.py
+"""
+Relex incremental do TokenBuffer a partir dos checkpoints do lexer.
+
+Aplica edições de um caractere em posições aleatórias de um arquivo grande e
+mede quantos tokens são relidos e quanto tempo leva o relex, comparando com
+tokenizar o arquivo inteiro de novo.
+
+Uso: python benchmarks/bench_relex.py [--linhas 50000] [--edicoes 200]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from common import UNIDADE, gerar_programa, cronometrar
+from src.lexer.buffer import TokenBuffer, TextEdit
+
+
+def edicao_aleatoria(source, rnd):
+    """Edição de um caractere: trocar um dígito, inserir um espaço ou uma quebra de linha."""
+    while True:
+        pos = rnd.randrange(len(source))
+        char = source[pos]
+        tipo = rnd.choice(('digito', 'espaco', 'linha'))
+        if tipo == 'digito' and char.isdigit():
+            return TextEdit(pos, pos + 1, str((int(char) + 1) % 10))
+        if tipo == 'espaco' and char == ' ':
+            return TextEdit(pos, pos, ' ')
+        if tipo == 'linha' and char == ';':
+            return TextEdit(pos + 1, pos + 1, '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--linhas', type=int, default=50_000)
+    parser.add_argument('--edicoes', type=int, default=200)
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    unidades = args.linhas // UNIDADE.count('\n') + 1
+    source = gerar_programa(len(UNIDADE.format(i=unidades)) * unidades)
+
+    tempo_completo, buffer = cronometrar(lambda: TokenBuffer.from_source(source))
+    print(f"Entrada: {source.count(chr(10))} linhas, {len(buffer)} tokens, "
+          f"{len(buffer.checkpoints)} checkpoints")
+    print(f"tokenização completa  | {tempo_completo * 1000:9.1f} ms")
+
+    rnd = random.Random(args.semente)
+    tempos, relidos = [], []
+    for _ in range(args.edicoes):
+        edit = edicao_aleatoria(source, rnd)
+        inicio = time.perf_counter()
+        patch = buffer.relex(edit)
+        tempos.append(time.perf_counter() - inicio)
+        relidos.append(patch.relexed)
+        source = edit.apply(source)
+
+    print(f"relex (mediana)       | {statistics.median(tempos) * 1000:9.2f} ms")
+    print(f"relex (máximo)        | {max(tempos) * 1000:9.2f} ms")
+    print(f"tokens relidos        | mediana {statistics.median(relidos):.0f}, máximo {max(relidos)}")
+
+    novo = TokenBuffer.from_source(source)
+    assert list(buffer.starts) == list(novo.starts) and list(buffer.lines) == list(novo.lines)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+# benchmarks/bench_resolver.py
+"""
+Resolução de escopo (src/optimizer/resolver.py): custo da passada e quanto
+custa achar o valor de cada variável por nome numa cadeia de dicts (como o
+interpretador ingênuo) contra `escopos[-1 - profundidade][slot]`.
+
+A comparação percorre todas as referências do programa gerado, cada uma
+procurada a partir de uma cadeia de escopos com a mesma profundidade que ela
+tem no código.
+
+Uso: python benchmarks/bench_resolver.py [--kb 256] [--voltas 20]
+"""
+
+import argparse
+
+from common import gerar_programa, cronometrar
+from src.parser.parser import Parser
+from src.parser.ast import VarExpr
+from src.optimizer import resolve_scopes
+from src.optimizer.nodes import children
+from src.executor.walker import Environment
+
+
+def referencias(program):
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        if type(node) is VarExpr:
+            yield node
+        stack.extend(children(node))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--kb', type=float, default=256.0)
+    parser.add_argument('--voltas', type=int, default=20)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    program = Parser(gerar_programa(int(args.kb * 1024))).parse()
+    t_resolver, resolution = cronometrar(resolve_scopes, program, repeticoes=args.repeticoes)
+    usos = [(node.name.value, resolution.location(node)) for node in referencias(program)]
+    usos = [(nome, local) for nome, local in usos if local is not None]
+    print(f"programa de {args.kb:.0f} KB: {len(resolution.scopes)} escopos, "
+          f"{len(resolution.locations)} posições, {len(resolution.shadowed)} sombreados, "
+          f"{len(resolution.undeclared)} não declarados; passada em {t_resolver * 1000:.1f} ms")
+
+    # Cadeias de escopos de mesma profundidade para os dois jeitos de procurar
+    profundidade = max(depth for _, (depth, _) in usos) + 1
+    slots = max(slot for _, (_, slot) in usos) + 1
+    ambientes = [Environment()]
+    listas = [[0] * slots]
+    for _ in range(profundidade - 1):
+        ambientes.append(Environment(ambientes[-1]))
+        listas.append([0] * slots)
+    por_nome = [(nome, ambientes[-1 - depth]) for nome, (depth, _) in usos]
+    for nome, dono in por_nome:
+        dono.values[nome] = 0
+    interno = ambientes[-1]
+
+    def procurar_por_nome():
+        for _ in range(args.voltas):
+            for nome, _ in por_nome:
+                interno.find(nome).values[nome]
+
+    def indexar():
+        for _ in range(args.voltas):
+            for _, (depth, slot) in usos:
+                listas[-1 - depth][slot]
+
+    t_nome, _ = cronometrar(procurar_por_nome, repeticoes=args.repeticoes)
+    t_slot, _ = cronometrar(indexar, repeticoes=args.repeticoes)
+    total = len(usos) * args.voltas
+    print(f"{total} acessos: por nome {t_nome * 1e9 / total:.0f} ns, "
+          f"por (profundidade, slot) {t_slot * 1e9 / total:.0f} ns "
+          f"({t_nome / t_slot:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
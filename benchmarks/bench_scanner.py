@@ -0,0 +1,40 @@
+# benchmarks/bench_scanner.py
+"""
+Compara o AFD único do lexer (compilado da especificação em spec.py) com o
+motor antigo, que roda os quatro AFDs separadamente para cada token.
+
+Uso: python benchmarks/bench_scanner.py [--mb 4] [--sem-antigo]
+"""
+
+import argparse
+
+from common import gerar_programa, cronometrar
+from src.lexer.lexer import Lexer
+
+
+def tokenizar(source: str, use_scanner: bool) -> int:
+    return len(Lexer(source, use_scanner=use_scanner).get_all_tokens())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mb', type=float, default=4.0, help='tamanho da entrada em MB')
+    parser.add_argument('--sem-antigo', action='store_true',
+                        help='não mede o motor antigo (lento em entradas grandes)')
+    args = parser.parse_args()
+
+    source = gerar_programa(int(args.mb * 1024 * 1024))
+    print(f"Entrada: {len(source) / 1024 / 1024:.1f} MB")
+
+    motores = [('AFD único (spec)', True)]
+    if not args.sem_antigo:
+        motores.append(('AFDs separados', False))
+
+    for nome, use_scanner in motores:
+        tempo, n_tokens = cronometrar(tokenizar, source, use_scanner)
+        print(f"{nome:<20} | {n_tokens:>9} tokens | {tempo:8.2f} s | "
+              f"{n_tokens / tempo:>12,.0f} tokens/s")
+
+
+if __name__ == '__main__':
+    main()
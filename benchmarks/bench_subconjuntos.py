@@ -0,0 +1,81 @@
+# benchmarks/bench_subconjuntos.py
+"""
+Compara nfa_to_dfa (conjuntos Python) com nfa_to_dfa_bitset (máscaras de bits)
+em AFNs sintéticos com milhares de estados.
+
+O AFN gerado reconhece "alguma das N palavras no fim da entrada":
+(a|b|c|d)* seguido da união de N palavras, montado com as transições-ε da
+construção de Thompson. Todo estado do AFD contém o laço e as cabeças de
+todas as palavras, então os conjuntos são grandes e o fecho-ε é recalculado
+muitas vezes pela versão com conjuntos.
+
+Uso: python benchmarks/bench_subconjuntos.py [--palavras 500 1000 2000]
+"""
+
+import argparse
+import random
+
+from common import cronometrar
+from src.lexer.afn_to_afd import NFA, EPSILON, nfa_to_dfa, nfa_to_dfa_bitset
+
+ALFABETO = 'abcd'
+
+
+def gerar_afn(palavras: int, tamanho: int = 6, semente: int = 42) -> NFA:
+    rng = random.Random(semente)
+    transitions = {}
+    contador = [1]  # o estado 0 é o inicial
+
+    def novo():
+        contador[0] += 1
+        return contador[0] - 1
+
+    def epsilon(origem, destino):
+        transitions.setdefault((origem, EPSILON), set()).add(destino)
+
+    def caractere(c):
+        origem, destino = novo(), novo()
+        transitions[(origem, c)] = {destino}
+        return origem, destino
+
+    # (a|b|c|d)*
+    laco_inicio, laco_fim = novo(), novo()
+    epsilon(0, laco_inicio)
+    for c in ALFABETO:
+        origem, destino = caractere(c)
+        epsilon(laco_inicio, origem)
+        epsilon(destino, laco_fim)
+    epsilon(laco_fim, laco_inicio)
+
+    # ... seguido de uma das palavras
+    accept_tokens = {}
+    for p in range(palavras):
+        anterior = laco_inicio
+        for _ in range(tamanho):
+            origem, destino = caractere(rng.choice(ALFABETO))
+            epsilon(anterior, origem)
+            anterior = destino
+        accept_tokens[anterior] = f"P{p}"
+
+    return NFA(range(contador[0]), set(ALFABETO), transitions, 0,
+               set(accept_tokens), accept_tokens=accept_tokens)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--palavras', type=int, nargs='+', default=[250, 500, 1000])
+    args = parser.parse_args()
+
+    print(f"{'palavras':>8} | {'estados AFN':>11} | {'estados AFD':>11} | "
+          f"{'conjuntos':>10} | {'bitset':>10} | {'ganho':>6}")
+    for n in args.palavras:
+        nfa = gerar_afn(n)
+        t_antigo, dfa = cronometrar(nfa_to_dfa, nfa)
+        t_novo, dfa_bits = cronometrar(nfa_to_dfa_bitset, nfa)
+        assert len(dfa.states) == len(dfa_bits.states)
+        print(f"{n:>8} | {len(nfa.states):>11} | {len(dfa_bits.states):>11} | "
+              f"{t_antigo:>9.2f}s | {t_novo:>9.2f}s | {t_antigo / t_novo:>5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# benchmarks/bench_token_buffer.py
+"""
+Memória de uma lista de objetos Token (Lexer.get_all_tokens) comparada com
+o TokenBuffer em colunas, medida com tracemalloc.
+
+Uso: python benchmarks/bench_token_buffer.py [--mb 4]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from common import gerar_programa, cronometrar
+from src.lexer.lexer import Lexer
+from src.lexer.buffer import TokenBuffer
+
+
+def medir_memoria(construir):
+    gc.collect()
+    tracemalloc.start()
+    resultado = construir()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return atual, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--mb', type=float, default=4.0, help='tamanho da entrada em MB')
+    args = parser.parse_args()
+
+    source = gerar_programa(int(args.mb * 1024 * 1024))
+    print(f"Entrada: {len(source) / 1024 / 1024:.1f} MB")
+
+    cenarios = [
+        ('list[Token]', lambda: Lexer(source).get_all_tokens()),
+        ('TokenBuffer', lambda: TokenBuffer.from_source(source)),
+    ]
+    for nome, construir in cenarios:
+        memoria, tokens = medir_memoria(construir)
+        tempo, _ = cronometrar(construir)
+        n = len(tokens)
+        print(f"{nome:<12} | {n:>9} tokens | {memoria / 1024 / 1024:8.1f} MB | "
+              f"{memoria / n:6.1f} bytes/token | {tempo:6.2f} s")
+        del tokens
+
+
+if __name__ == '__main__':
+    main()
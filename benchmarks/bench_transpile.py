@@ -0,0 +1,77 @@
+# benchmarks/bench_transpile.py
+"""
+Backend Python (src/executor/transpile.py) contra o executor de closures e o
+VM de bytecode.
+
+Mede a execução (sem parse nem geração de código) de fibonacci recursivo e
+de um laço, e o custo de obter o code object: geração + compile(), cache em
+disco (marshal) e cache em memória.
+
+Uso: python benchmarks/bench_transpile.py [--fib 25] [--laco 300000]
+"""
+
+import argparse
+import os
+import tempfile
+
+from common import gerar_programa, cronometrar
+from src.parser.parser import Parser
+from src.executor import transpile
+from src.executor.bytecode import compile_module
+from src.executor.closures import compile_program
+from src.executor.vm import VM
+
+FIB = '''
+func fib(n) {{ if (n < 2) {{ return n; }} return fib(n - 1) + fib(n - 2); }}
+print(fib({n}));
+'''
+
+LACO = '''
+var total = 0; var i = 0;
+while (i < {n}) {{ var t = i * 2 + 1; if (t > 100) {{ total = total + t // 3; }} i = i + 1; }}
+print(total);
+'''
+
+
+def descartar(texto):
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--fib', type=int, default=25)
+    parser.add_argument('--laco', type=int, default=300_000)
+    parser.add_argument('--kb', type=float, default=256.0, help='programa gerado para o cache')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'carga':<14} | {'closures (s)':>12} | {'VM (s)':>8} | {'Python (s)':>10} | {'ganho':>6}")
+    for nome, source in ((f'fib({args.fib})', FIB.format(n=args.fib)),
+                         (f'laço {args.laco}', LACO.format(n=args.laco))):
+        program = Parser(source).parse()
+        closures = compile_program(program, descartar)
+        module = compile_module(program)
+        code = transpile.compile_program(program)
+        t_closures, _ = cronometrar(closures.run, repeticoes=args.repeticoes)
+        t_vm, _ = cronometrar(lambda: VM(module, descartar).run(), repeticoes=args.repeticoes)
+        t_python, _ = cronometrar(transpile.execute, code, descartar, repeticoes=args.repeticoes)
+        print(f"{nome:<14} | {t_closures:>12.3f} | {t_vm:>8.3f} | {t_python:>10.3f} | "
+              f"{t_closures / t_python:>5.1f}x")
+
+    source = gerar_programa(int(args.kb * 1024))
+    with tempfile.TemporaryDirectory() as raiz:
+        os.environ['NOCSYS_CACHE_DIR'] = raiz
+        print(f"Code object de {len(source) / 1024:.0f} KB de source:")
+        t_gerar, _ = cronometrar(lambda: transpile.compile_program(Parser(source).parse()))
+        transpile.load_cached(source)
+        t_disco, _ = cronometrar(lambda: (transpile._memory_cache.clear(),
+                                          transpile.load_cached(source)),
+                                 repeticoes=args.repeticoes)
+        t_memoria, _ = cronometrar(transpile.load_cached, source, repeticoes=args.repeticoes)
+        print(f"  lexer + parser + geração + compile() {t_gerar * 1000:>9.1f} ms")
+        print(f"  cache em disco                       {t_disco * 1000:>9.1f} ms")
+        print(f"  cache em memória                     {t_memoria * 1000:>9.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
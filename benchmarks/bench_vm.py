@@ -0,0 +1,82 @@
+# benchmarks/bench_vm.py
+"""
+Bytecode + VM (src/executor/bytecode.py, vm.py) em cargas no estilo de
+exemplo.noc.
+
+1. Ponta a ponta num programa gerado por `gerar_programa` (declarações de
+   função, chamadas, if/else, print): source -> saída com o executor de
+   closures, com bytecode + VM e com o módulo já serializado (Module.loads
+   + VM, sem lexer nem parser — o caminho de `load_cached`).
+2. Instruções por segundo do VM em fibonacci recursivo e num laço.
+
+Uso: python benchmarks/bench_vm.py [--kb 512] [--fib 22]
+"""
+
+import argparse
+
+from common import gerar_programa, cronometrar
+from src.parser.parser import Parser
+from src.executor.bytecode import Module, compile_module
+from src.executor.closures import compile_program
+from src.executor.vm import VM
+
+FIB = '''
+func fib(n) {{ if (n < 2) {{ return n; }} return fib(n - 1) + fib(n - 2); }}
+print(fib({n}));
+'''
+
+LACO = '''
+var total = 0; var i = 0;
+while (i < {n}) {{ var t = i * 2 + 1; if (t > 100) {{ total = total + t // 3; }} i = i + 1; }}
+print(total);
+'''
+
+
+def closures(source, saida):
+    compile_program(Parser(source).parse(), saida.append).run()
+
+
+def bytecode(source, saida):
+    VM(compile_module(Parser(source).parse()), saida.append).run()
+
+
+def serializado(data, saida):
+    VM(Module.loads(data), saida.append).run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--kb', type=float, default=512.0, help='tamanho do programa gerado')
+    parser.add_argument('--fib', type=int, default=22)
+    parser.add_argument('--laco', type=int, default=200_000)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    source = gerar_programa(int(args.kb * 1024))
+    data = compile_module(Parser(source).parse()).dumps()
+    print(f"Ponta a ponta: {len(source) / 1024:.0f} KB de source, módulo com {len(data) / 1024:.0f} KB")
+    saidas = []
+    for nome, func, entrada in (('closures', closures, source),
+                                ('bytecode + VM', bytecode, source),
+                                ('módulo serializado', serializado, data)):
+        saida = []
+        tempo, _ = cronometrar(lambda: func(entrada, saida), repeticoes=args.repeticoes)
+        saidas.append(saida[-1])
+        print(f"  {nome:<20} {tempo * 1000:>9.1f} ms")
+    assert len(set(saidas)) == 1
+
+    print("Instruções por segundo:")
+    for nome, programa in ((f'fib({args.fib})', FIB.format(n=args.fib)),
+                           (f'laço {args.laco}', LACO.format(n=args.laco))):
+        module = compile_module(Parser(programa).parse())
+        vm = VM(module, lambda texto: None)
+        tempo, _ = cronometrar(vm.run, repeticoes=args.repeticoes)
+        tempo_closures, _ = cronometrar(
+            lambda: compile_program(Parser(programa).parse(), lambda texto: None).run(),
+            repeticoes=args.repeticoes)
+        print(f"  {nome:<14} {vm.instructions:>10} instruções em {tempo:.3f} s = "
+              f"{vm.instructions / tempo / 1e6:.2f} M/s (closures: {tempo_closures:.3f} s)")
+
+
+if __name__ == '__main__':
+    main()
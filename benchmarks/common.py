@@ -0,0 +1,73 @@
+# benchmarks/common.py
+"""Utilitários compartilhados pelos benchmarks (geração de código sintético)."""
+
+import os
+import sys
+import time
+
+# Permite rodar os scripts direto da raiz: python benchmarks/bench_x.py
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+UNIDADE = '''func calcular_area_{i}(raio) {{
+    var pi = 3.14159;
+    var area = pi * raio * raio;
+
+    if (area > 100.0) {{
+        print("Area grande");
+    }} else {{
+        print("Area pequena");
+    }}
+
+    return area;
+}}
+
+var resultado_{i} = calcular_area_{i}({i});
+print(resultado_{i});
+'''
+
+
+def gerar_programa(tamanho_bytes: int) -> str:
+    """Gera um programa NocSys válido com aproximadamente `tamanho_bytes` caracteres."""
+    partes = []
+    total = 0
+    i = 0
+    while total < tamanho_bytes:
+        parte = UNIDADE.format(i=i)
+        partes.append(parte)
+        total += len(parte)
+        i += 1
+    return ''.join(partes)
+
+
+UNIDADE_EXPRESSOES = '''var e_{i} = (a + b * {i} - c / 4) * (d + 1) > x - -y * 3;
+var f_{i} = a * b + c * d - e / f + g * (h - i) * {i} + -j;
+print((e_{i} + f_{i}) * (e_{i} - f_{i}) / 2 + ((a + b) * (c + d)) * {i});
+'''
+
+
+def gerar_expressoes(tamanho_bytes: int) -> str:
+    """Programa feito só de declarações com expressões aritméticas longas."""
+    partes = []
+    total = 0
+    i = 0
+    while total < tamanho_bytes:
+        parte = UNIDADE_EXPRESSOES.format(i=i)
+        partes.append(parte)
+        total += len(parte)
+        i += 1
+    return ''.join(partes)
+
+
+def cronometrar(func, *args, repeticoes: int = 1):
+    """Executa `func(*args)` e retorna (melhor tempo em segundos, último resultado)."""
+    melhor = None
+    resultado = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = func(*args)
+        decorrido = time.perf_counter() - inicio
+        if melhor is None or decorrido < melhor:
+            melhor = decorrido
+    return melhor, resultado
@@ -2,6 +2,7 @@
 
 from src.lexer.lexer import Lexer
 from src.parser.parser import Parser, ParserError
+from src.executor import NocSysRuntimeError, compile_program
 
 
 def mostrar_tokens(source_code: str):
@@ -42,6 +43,11 @@ def main():
             print("AST raiz não é Program (algo estranho aconteceu).")
             print(ast)
 
+        print("\n=== EXECUÇÃO ===")
+        compile_program(ast).run()
+
+    except NocSysRuntimeError as e:
+        print(f"\n{e}")
     except ParserError as e:
         print(f"\nErro de parser: {e}")
     except SyntaxError as e:
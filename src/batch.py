@@ -0,0 +1,136 @@
+# src/batch.py
+"""
+Compilação em lote: lex + parse de muitos arquivos num pool de processos.
+
+Uso:
+    python -m src.batch examples/ 'projeto/**/*.noc' -j 8 -o relatorio.json
+
+Cada entrada é um diretório (procurado recursivamente por `--padrao`), um
+glob ou um arquivo. Os arquivos são ordenados e distribuídos entre os
+processos com `ProcessPoolExecutor.map`, que devolve os resultados na ordem
+de entrada — então o relatório sai sempre na mesma ordem, qualquer que seja
+o número de workers. Erros de leitura, de lexer (`SyntaxError`) e de parser
+(`ParserError`) ficam registrados no resultado do arquivo, sem interromper o
+lote. O código de saída é 1 se algum arquivo falhou.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from src.lexer.buffer import TokenBuffer
+from src.parser.parser import Parser
+
+PADRAO = '*.noc'
+
+
+def coletar_arquivos(entradas: Iterable[str], padrao: str = PADRAO) -> List[str]:
+    """Expande diretórios e globs; devolve os caminhos sem repetição, ordenados."""
+    arquivos = set()
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            encontrados = glob.glob(os.path.join(entrada, '**', padrao), recursive=True)
+        elif glob.has_magic(entrada):
+            encontrados = glob.glob(entrada, recursive=True)
+        else:
+            encontrados = [entrada]
+        arquivos.update(os.path.normpath(caminho) for caminho in encontrados
+                        if not os.path.isdir(caminho))
+    return sorted(arquivos)
+
+
+def compilar_arquivo(caminho: str) -> Dict:
+    """Lex + parse de um arquivo; devolve o resultado (nunca levanta exceção)."""
+    resultado = {
+        'arquivo': caminho,
+        'ok': False,
+        'erro': None,
+        'tokens': None,
+        'declaracoes': None,
+        'tempo_lex_ms': None,
+        'tempo_parse_ms': None,
+    }
+    etapa = 'leitura'
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            source = f.read()
+
+        etapa = 'lexer'
+        inicio = time.perf_counter()
+        buffer = TokenBuffer.from_source(source)
+        resultado['tempo_lex_ms'] = (time.perf_counter() - inicio) * 1000
+        resultado['tokens'] = len(buffer)
+
+        etapa = 'parser'
+        inicio = time.perf_counter()
+        programa = Parser(tokens=buffer).parse()
+        resultado['tempo_parse_ms'] = (time.perf_counter() - inicio) * 1000
+        resultado['declaracoes'] = len(programa.declarations)
+        resultado['ok'] = True
+    except (SyntaxError, OSError, UnicodeDecodeError, RecursionError) as e:
+        resultado['erro'] = {
+            'etapa': etapa,
+            'tipo': type(e).__name__,
+            'mensagem': str(e),
+        }
+    return resultado
+
+
+def compilar_lote(arquivos: List[str], workers: Optional[int] = None) -> List[Dict]:
+    """
+    Compila `arquivos` com `workers` processos (padrão: os.cpu_count()).
+    Com 1 worker roda no próprio processo. Os resultados vêm na ordem de `arquivos`.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(arquivos) <= 1:
+        return [compilar_arquivo(caminho) for caminho in arquivos]
+    # Lotes de vários arquivos por tarefa diluem o custo de IPC de arquivos pequenos
+    chunksize = max(1, len(arquivos) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(compilar_arquivo, arquivos, chunksize=chunksize))
+
+
+def relatorio(resultados: List[Dict], workers: int, tempo_total: float) -> Dict:
+    erros = sum(1 for r in resultados if not r['ok'])
+    return {
+        'arquivos': len(resultados),
+        'ok': len(resultados) - erros,
+        'erros': erros,
+        'workers': workers,
+        'tempo_total_ms': tempo_total * 1000,
+        'resultados': resultados,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='Compila (lex + parse) arquivos NocSys em lote.')
+    parser.add_argument('entradas', nargs='+', help='diretórios, globs ou arquivos')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='número de processos (padrão: núcleos da máquina)')
+    parser.add_argument('--padrao', default=PADRAO,
+                        help=f'padrão dos arquivos nos diretórios (padrão: {PADRAO})')
+    parser.add_argument('-o', '--saida', help='arquivo do relatório JSON (padrão: stdout)')
+    args = parser.parse_args(argv)
+
+    arquivos = coletar_arquivos(args.entradas, args.padrao)
+    inicio = time.perf_counter()
+    resultados = compilar_lote(arquivos, args.workers)
+    dados = relatorio(resultados, args.workers, time.perf_counter() - inicio)
+
+    texto = json.dumps(dados, ensure_ascii=False, indent=2)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            f.write(texto + '\n')
+    else:
+        print(texto)
+    return 1 if dados['erros'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
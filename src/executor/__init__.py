@@ -0,0 +1,24 @@
+"""
+Pacote de execução de programas NocSys.
+
+Este pacote contém:
+- runtime.py: Semântica compartilhada (operadores, valores, print, erros de execução).
+- walker.py: Interpretador ingênuo que percorre a AST (referência e base dos benchmarks).
+- closures.py: Compilador da AST para closures Python, compiladas uma vez e executadas sem despacho.
+- memo.py: Cache LRU (com contadores de acertos/falhas) para memoizar funções puras.
+- bytecode.py: Compilador da AST para bytecode compacto (array('i'), constantes por função, slots),
+  serializável e com cache em disco chaveado pelo source.
+- vm.py: Máquina de pilha que executa o bytecode, sem recursão no Python.
+- transpile.py: Tradução para `ast` do Python + compile(), com cache de code objects e
+  erros mapeados de volta para linha/coluna NocSys.
+"""
+
+from .runtime import NocSysRuntimeError
+from .closures import ClosureCompiler, compile_program, run
+
+__all__ = [
+    'NocSysRuntimeError',
+    'ClosureCompiler',
+    'compile_program',
+    'run',
+]
@@ -0,0 +1,525 @@
+# src/executor/bytecode.py
+"""
+Compilador de AST para bytecode compacto.
+
+Cada função (e o código de topo, `<programa>`) vira um `CodeObject`:
+
+    code       array('i') de pares (opcode, operando) — largura fixa, pc += 2
+    constants  pool de constantes da função (sem repetição)
+    lines      linha de origem de cada instrução (0 = sem posição), array('i')
+    columns    coluna de origem de cada instrução, array('i')
+    nparams    parâmetros (ocupam os primeiros slots)
+    nlocals    total de slots de variáveis locais
+
+Variáveis locais são slots resolvidos na compilação (cada declaração de um
+bloco ganha o seu, então sombreamento não colide); variáveis globais também
+são índices, numa tabela do módulo. Funções são chamadas pelo índice em
+`Module.functions`. A semântica é a de `closures.py`/`runtime.py`.
+
+Um `Module` é serializável (`dumps`/`loads`, marshal com cabeçalho e CRC);
+`load_cached(source)` guarda o módulo em disco chaveado pelo hash do source,
+então execuções repetidas do mesmo script pulam lexer e parser.
+"""
+
+from __future__ import annotations
+import hashlib
+import marshal
+import os
+import zlib
+from array import array
+from enum import IntEnum
+from typing import Dict, List, Optional
+
+from src.lexer.cache import cache_dir, cache_enabled
+from src.lexer.tokens import TokenType
+from src.parser.ast import (
+    Program, VarDecl, FuncDecl,
+    Block, AssignStmt, IfStmt, WhileStmt,
+    ReturnStmt, PrintStmt, ExprStmt,
+    BinaryExpr, UnaryExpr, LiteralExpr,
+    VarExpr, CallExpr
+)
+from .runtime import NocSysRuntimeError, error_at, literal_value
+
+FORMAT_VERSION = 1
+MAGIC = b'NOCSYSBC'
+
+
+class Op(IntEnum):
+    LOAD_LOCAL = 0
+    LOAD_CONST = 1
+    STORE_LOCAL = 2
+    JUMP_IF_FALSE = 3
+    JUMP = 4
+    ADD = 5
+    SUB = 6
+    MUL = 7
+    LT = 8
+    LE = 9
+    GT = 10
+    GE = 11
+    EQ = 12
+    NE = 13
+    CALL = 14
+    RETURN = 15
+    LOAD_GLOBAL = 16
+    STORE_GLOBAL = 17
+    DIV = 18
+    FLOOR_DIV = 19
+    POW = 20
+    NEG = 21
+    POS = 22
+    POP = 23
+    PRINT = 24
+    DECLARE_GLOBAL = 25
+    RETURN_NONE = 26
+    ERROR = 27      # operando: índice da mensagem nas constantes
+    TAIL_CALL = 28  # `return f(...)`: chama reaproveitando o frame atual
+
+
+BINARY_OPCODES = {
+    int(TokenType.PLUS): Op.ADD,
+    int(TokenType.MINUS): Op.SUB,
+    int(TokenType.MULTIPLY): Op.MUL,
+    int(TokenType.DIVIDE): Op.DIV,
+    int(TokenType.FLOOR_DIV): Op.FLOOR_DIV,
+    int(TokenType.POWER): Op.POW,
+    int(TokenType.EQUAL): Op.EQ,
+    int(TokenType.NOT_EQUAL): Op.NE,
+    int(TokenType.LESS): Op.LT,
+    int(TokenType.LESS_EQUAL): Op.LE,
+    int(TokenType.GREATER): Op.GT,
+    int(TokenType.GREATER_EQUAL): Op.GE,
+}
+
+UNARY_OPCODES = {
+    int(TokenType.PLUS): Op.POS,
+    int(TokenType.MINUS): Op.NEG,
+}
+
+# Texto do operador, para mensagens de erro do VM
+OP_SYMBOLS = {
+    Op.ADD: '+', Op.SUB: '-', Op.MUL: '*', Op.DIV: '/', Op.FLOOR_DIV: '//', Op.POW: '**',
+    Op.EQ: '==', Op.NE: '!=', Op.LT: '<', Op.LE: '<=', Op.GT: '>', Op.GE: '>=',
+    Op.NEG: '-', Op.POS: '+',
+}
+
+SWAP = int(TokenType.SWAP)
+
+
+class CodeObject:
+    __slots__ = ('name', 'nparams', 'nlocals', 'code', 'constants', 'lines', 'columns')
+
+    def __init__(self, name: str, nparams: int = 0):
+        self.name = name
+        self.nparams = nparams
+        self.nlocals = nparams
+        self.code = array('i')
+        self.constants: List = []
+        self.lines = array('i')
+        self.columns = array('i')
+
+    def to_tuple(self):
+        return (self.name, self.nparams, self.nlocals, self.code.tobytes(),
+                tuple(self.constants), self.lines.tobytes(), self.columns.tobytes())
+
+    @classmethod
+    def from_tuple(cls, data) -> 'CodeObject':
+        name, nparams, nlocals, code, constants, lines, columns = data
+        obj = cls(name, nparams)
+        obj.nlocals = nlocals
+        obj.code.frombytes(code)
+        obj.constants = list(constants)
+        obj.lines.frombytes(lines)
+        obj.columns.frombytes(columns)
+        return obj
+
+    def disassemble(self) -> List[str]:
+        """Listagem legível (pc, opcode, operando), para depuração."""
+        code = self.code
+        return [f"{pc:5d} {Op(code[pc]).name:<15} {code[pc + 1]}"
+                for pc in range(0, len(code), 2)]
+
+
+class Module:
+    def __init__(self, main: CodeObject, functions: List[CodeObject], global_names: List[str]):
+        self.main = main
+        self.functions = functions
+        self.global_names = global_names
+
+    def dumps(self) -> bytes:
+        body = marshal.dumps({
+            'version': FORMAT_VERSION,
+            'main': self.main.to_tuple(),
+            'functions': tuple(f.to_tuple() for f in self.functions),
+            'globals': tuple(self.global_names),
+        })
+        return MAGIC + zlib.crc32(body).to_bytes(4, 'big') + body
+
+    @classmethod
+    def loads(cls, data: bytes) -> 'Module':
+        """Lê um módulo gravado por `dumps`; ValueError se o formato não confere."""
+        header = len(MAGIC) + 4
+        if len(data) < header or not data.startswith(MAGIC):
+            raise ValueError("não é um módulo de bytecode NocSys")
+        body = data[header:]
+        if zlib.crc32(body).to_bytes(4, 'big') != data[len(MAGIC):header]:
+            raise ValueError("módulo de bytecode corrompido")
+        try:
+            payload = marshal.loads(body)
+        except (EOFError, TypeError) as e:
+            raise ValueError("módulo de bytecode corrompido") from e
+        if payload.get('version') != FORMAT_VERSION:
+            raise ValueError("versão de bytecode diferente")
+        return cls(CodeObject.from_tuple(payload['main']),
+                   [CodeObject.from_tuple(f) for f in payload['functions']],
+                   list(payload['globals']))
+
+
+class BytecodeCompiler:
+    def __init__(self):
+        self.functions: List[CodeObject] = []
+        self._function_ids: Dict[str, int] = {}
+        self.global_names: List[str] = []
+        self._global_ids: Dict[str, int] = {}
+        # Estado da função sendo compilada
+        self._code: Optional[CodeObject] = None
+        self._constant_ids: Dict = {}
+        self._scopes: List[Dict[str, int]] = []
+        self._in_function = False
+
+    def compile(self, program: Program) -> Module:
+        declarations = [d for d in program.declarations if isinstance(d, FuncDecl)]
+        for decl in declarations:
+            name = decl.name.value
+            if name in self._function_ids:
+                raise error_at(decl.name, f"função '{name}' já declarada")
+            self._function_ids[name] = len(self.functions)
+            self.functions.append(CodeObject(name, len(decl.params)))
+
+        for decl in declarations:
+            self._func_decl(decl)
+
+        main = self._begin(CodeObject('<programa>'), scopes=[], in_function=False)
+        for decl in program.declarations:
+            if not isinstance(decl, FuncDecl):
+                self._statement(decl)
+        self._emit(Op.RETURN_NONE)
+        self._code = None
+        return Module(main, self.functions, self.global_names)
+
+    def _begin(self, code: CodeObject, scopes, in_function: bool) -> CodeObject:
+        self._code = code
+        self._constant_ids = {}
+        self._scopes = scopes
+        self._in_function = in_function
+        return code
+
+    def _func_decl(self, node: FuncDecl):
+        code = self.functions[self._function_ids[node.name.value]]
+        params = {}
+        for slot, param in enumerate(node.params):
+            params[param.name.value] = slot
+        self._begin(code, scopes=[params], in_function=True)
+        self._block(node.body)
+        self._emit(Op.RETURN_NONE)
+
+    # ==========================
+    # Emissão
+    # ==========================
+    def _emit(self, op: int, arg: int = 0, token=None) -> int:
+        """Acrescenta uma instrução; devolve o pc dela."""
+        code = self._code
+        pc = len(code.code)
+        code.code.append(op)
+        code.code.append(arg)
+        code.lines.append(token.line if token is not None else 0)
+        code.columns.append(token.column if token is not None else 0)
+        return pc
+
+    def _patch(self, pc: int, target: int):
+        self._code.code[pc + 1] = target
+
+    def _here(self) -> int:
+        return len(self._code.code)
+
+    def _constant(self, value) -> int:
+        # type(value) na chave separa True de 1 e 1 de 1.0; repr separa 0.0 de -0.0
+        key = (type(value), repr(value) if type(value) is float else value)
+        index = self._constant_ids.get(key)
+        if index is None:
+            index = len(self._code.constants)
+            self._constant_ids[key] = index
+            self._code.constants.append(value)
+        return index
+
+    def _error(self, message: str, token):
+        self._emit(Op.ERROR, self._constant(message), token)
+
+    # ==========================
+    # Escopo
+    # ==========================
+    def _global(self, name: str) -> int:
+        index = self._global_ids.get(name)
+        if index is None:
+            index = len(self.global_names)
+            self._global_ids[name] = index
+            self.global_names.append(name)
+        return index
+
+    def _declare(self, name: str) -> Optional[int]:
+        """Slot local da variável declarada agora (None = global)."""
+        if not self._scopes:
+            return None
+        scope = self._scopes[-1]
+        slot = scope.get(name)
+        if slot is None:
+            slot = scope[name] = self._code.nlocals
+            self._code.nlocals += 1
+        return slot
+
+    def _resolve(self, name: str) -> Optional[int]:
+        for scope in reversed(self._scopes):
+            slot = scope.get(name)
+            if slot is not None:
+                return slot
+        return None
+
+    def _load(self, name_tok):
+        slot = self._resolve(name_tok.value)
+        if slot is not None:
+            self._emit(Op.LOAD_LOCAL, slot)
+        else:
+            self._emit(Op.LOAD_GLOBAL, self._global(name_tok.value), name_tok)
+
+    def _store(self, name_tok):
+        slot = self._resolve(name_tok.value)
+        if slot is not None:
+            self._emit(Op.STORE_LOCAL, slot)
+        else:
+            self._emit(Op.STORE_GLOBAL, self._global(name_tok.value), name_tok)
+
+    # ==========================
+    # Statements
+    # ==========================
+    def _statement(self, node):
+        method = self._STATEMENTS.get(type(node))
+        if method is None:
+            if isinstance(node, FuncDecl):
+                raise error_at(node.name, "funções só podem ser declaradas no topo do programa")
+            raise NocSysRuntimeError(f"nó desconhecido: {type(node).__name__}")
+        method(self, node)
+
+    def _block(self, node: Block):
+        self._scopes.append({})
+        try:
+            for statement in node.statements:
+                self._statement(statement)
+        finally:
+            self._scopes.pop()
+
+    def _var_decl(self, node: VarDecl):
+        if node.init_expr is None:
+            self._emit(Op.LOAD_CONST, self._constant(None))
+        else:
+            self._expression(node.init_expr)
+        slot = self._declare(node.name.value)
+        if slot is None:
+            self._emit(Op.DECLARE_GLOBAL, self._global(node.name.value))
+        else:
+            self._emit(Op.STORE_LOCAL, slot)
+
+    def _assign_stmt(self, node: AssignStmt):
+        self._expression(node.value)
+        self._store(node.target.name)
+
+    def _if_stmt(self, node: IfStmt):
+        self._expression(node.condition)
+        jump_else = self._emit(Op.JUMP_IF_FALSE)
+        self._block(node.then_branch)
+        if node.else_branch is None:
+            self._patch(jump_else, self._here())
+            return
+        jump_end = self._emit(Op.JUMP)
+        self._patch(jump_else, self._here())
+        self._block(node.else_branch)
+        self._patch(jump_end, self._here())
+
+    def _while_stmt(self, node: WhileStmt):
+        start = self._here()
+        self._expression(node.condition)
+        jump_end = self._emit(Op.JUMP_IF_FALSE)
+        self._block(node.body)
+        self._emit(Op.JUMP, start)
+        self._patch(jump_end, self._here())
+
+    def _return_stmt(self, node: ReturnStmt):
+        if not self._in_function:
+            # o valor é calculado antes do erro, como no TreeWalker
+            if node.value is not None:
+                self._expression(node.value)
+                self._emit(Op.POP)
+            self._error("'return' fora de função", None)
+            return
+        value = node.value
+        index = self._valid_call(value) if type(value) is CallExpr else None
+        if value is None:
+            self._emit(Op.RETURN_NONE)
+        elif index is not None:
+            for arg in value.args:
+                self._expression(arg)
+            self._emit(Op.TAIL_CALL, index, value.callee)
+        else:
+            self._expression(value)
+            self._emit(Op.RETURN)
+
+    def _print_stmt(self, node: PrintStmt):
+        self._expression(node.value)
+        self._emit(Op.PRINT)
+
+    def _expr_stmt(self, node: ExprStmt):
+        expr = node.expr
+        if type(expr) is LiteralExpr:
+            return
+        if type(expr) is BinaryExpr and expr.op.kind == SWAP:
+            if type(expr.left) is not VarExpr or type(expr.right) is not VarExpr:
+                self._error("'<->' só troca duas variáveis", expr.op)
+                return
+            # pilha [a, b]: a recebe b, depois b recebe a
+            self._load(expr.left.name)
+            self._load(expr.right.name)
+            self._store(expr.left.name)
+            self._store(expr.right.name)
+            return
+        self._expression(expr)
+        self._emit(Op.POP)
+
+    # ==========================
+    # Expressões
+    # ==========================
+    def _expression(self, node):
+        method = self._EXPRESSIONS.get(type(node))
+        if method is None:
+            raise NocSysRuntimeError(f"expressão desconhecida: {type(node).__name__}")
+        method(self, node)
+
+    def _literal(self, node: LiteralExpr):
+        self._emit(Op.LOAD_CONST, self._constant(literal_value(node.value)))
+
+    def _variable(self, node: VarExpr):
+        self._load(node.name)
+
+    def _binary(self, node: BinaryExpr):
+        if node.op.kind == SWAP:
+            self._error("'<->' é uma instrução, não uma expressão", node.op)
+            return
+        self._expression(node.left)
+        self._expression(node.right)
+        self._emit(BINARY_OPCODES[node.op.kind], 0, node.op)
+
+    def _unary(self, node: UnaryExpr):
+        self._expression(node.right)
+        self._emit(UNARY_OPCODES[node.op.kind], 0, node.op)
+
+    def _valid_call(self, node: CallExpr) -> Optional[int]:
+        """Índice da função chamada, ou None se a chamada dá erro (nome ou aridade)."""
+        index = self._function_ids.get(node.callee.value)
+        if index is None or self.functions[index].nparams != len(node.args):
+            return None
+        return index
+
+    def _call(self, node: CallExpr):
+        callee = node.callee
+        index = self._function_ids.get(callee.value)
+        if index is None:
+            self._error(f"função '{callee.value}' não declarada", callee)
+            return
+        nparams = self.functions[index].nparams
+        if len(node.args) != nparams:
+            self._error(f"função '{callee.value}' espera {nparams} "
+                        f"argumento(s), recebeu {len(node.args)}", callee)
+            return
+        for arg in node.args:
+            self._expression(arg)
+        self._emit(Op.CALL, index, callee)
+
+    # ==========================
+    # Tabelas de despacho (usadas só na compilação)
+    # ==========================
+    _STATEMENTS = {
+        VarDecl: _var_decl,
+        AssignStmt: _assign_stmt,
+        IfStmt: _if_stmt,
+        WhileStmt: _while_stmt,
+        ReturnStmt: _return_stmt,
+        PrintStmt: _print_stmt,
+        ExprStmt: _expr_stmt,
+        Block: _block,
+    }
+
+    _EXPRESSIONS = {
+        LiteralExpr: _literal,
+        VarExpr: _variable,
+        BinaryExpr: _binary,
+        UnaryExpr: _unary,
+        CallExpr: _call,
+    }
+
+
+def compile_module(program: Program) -> Module:
+    return BytecodeCompiler().compile(program)
+
+
+# ==========================
+# Cache em disco
+# ==========================
+def source_key(source: str) -> str:
+    data = f"{FORMAT_VERSION}\n{source}".encode('utf-8')
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def cache_path(key: str) -> str:
+    return os.path.join(cache_dir(), f"bytecode-{key}.bin")
+
+
+def load_cached(source: str) -> Module:
+    """
+    Módulo compilado de `source`: lido do cache em disco se existir (sem
+    lexer nem parser), senão compilado e gravado. Falhas do cache são
+    ignoradas; erros de sintaxe do source sobem normalmente.
+    """
+    from src.parser.parser import Parser  # só necessário quando o cache falha
+
+    if not cache_enabled():
+        return compile_module(Parser(source).parse())
+
+    path = cache_path(source_key(source))
+    try:
+        with open(path, 'rb') as f:
+            return Module.loads(f.read())
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    module = compile_module(Parser(source).parse())
+    save_atomic(path, module.dumps())
+    return module
+
+
+def save_atomic(path: str, data: bytes) -> bool:
+    """Grava de forma atômica (arquivo temporário + rename). Falhas são ignoradas."""
+    import tempfile
+
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.bytecode-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        return False
+    return True
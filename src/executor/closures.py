@@ -0,0 +1,594 @@
+# src/executor/closures.py
+"""
+Executor que compila a AST em closures Python.
+
+Uma passada única sobre o Program transforma cada nó numa função aninhada
+`f(frame)`: o despacho por tipo de nó, a resolução de escopo e a escolha do
+operador acontecem uma vez, na compilação. Na execução só sobram chamadas
+entre closures, sem `isinstance` nem procura de nomes em cadeia.
+
+- Variáveis locais ficam num dict por chamada (`frame`). Cada declaração
+  recebe uma chave fixa na compilação (o nome, ou `nome@profundidade` em
+  blocos aninhados, para que variáveis sombreadas não colidam).
+- Nomes que não são locais em nenhum escopo visível são globais (dict do
+  programa), procurados por nome.
+- Statements devolvem None, ou `(valor,)` quando executam um `return`.
+- Chamadas apontam direto para a função compilada (funções são declaradas
+  antes de o programa rodar, como em `TreeWalker`).
+- `return f(...)` não chama `f`: devolve um `_TailCall` e quem fez a chamada
+  original continua num laço (trampolim). Recursão em cauda, direta ou
+  mútua, roda em pilha constante.
+- Com `memoize=N`, chamadas a funções puras (optimizer/purity.py) passam por
+  um cache LRU de até N resultados por função (memo.py).
+
+A semântica é a de `walker.TreeWalker`; os dois produzem a mesma saída.
+"""
+
+from __future__ import annotations
+import sys
+from typing import Dict, List, Optional
+
+from src.parser.ast import (
+    Program, VarDecl, FuncDecl,
+    Block, AssignStmt, IfStmt, WhileStmt,
+    ReturnStmt, PrintStmt, ExprStmt,
+    BinaryExpr, UnaryExpr, LiteralExpr,
+    VarExpr, CallExpr
+)
+from src.lexer.tokens import TokenType
+from .runtime import (
+    NocSysRuntimeError, error_at, format_value, literal_value,
+    BINARY_OPERATORS, UNARY_OPERATORS, OPERATOR_ERRORS, operation_error,
+    RECURSION_LIMIT,
+)
+from .memo import LRUCache, MISSING, memo_key
+
+SWAP = int(TokenType.SWAP)
+
+_RETURN_NONE = (None,)
+
+
+def _nothing(frame):
+    return None
+
+
+def _fail(token, message: str):
+    """Closure que só acusa o erro quando executada (como o TreeWalker)."""
+    def fail(frame):
+        raise error_at(token, message)
+    return fail
+
+
+class _Function:
+    """Função compilada; `body` é preenchido depois (chamadas podem vir antes)."""
+    __slots__ = ('name', 'params', 'body', 'tail')
+
+    def __init__(self, name: str, params):
+        self.name = name
+        self.params = params
+        self.body = _nothing
+        self.tail = False  # tem `return f(...)`: pode devolver _TailCall
+
+
+class _TailCall:
+    """Resultado de `return f(...)`: a chamada que ainda falta fazer."""
+    __slots__ = ('function', 'frame')
+
+    def __init__(self, function: _Function, frame: dict):
+        self.function = function
+        self.frame = frame
+
+
+def _trampoline(result):
+    """Faz as chamadas em cauda pendentes; devolve o valor final da chamada."""
+    while type(result) is _TailCall:
+        result = result.function.body(result.frame)
+    return None if result is None else result[0]
+
+
+class CompiledProgram:
+    def __init__(self, statements, globals_: dict, functions: Dict[str, _Function],
+                 caches: Dict[str, LRUCache] = None):
+        self.statements = statements
+        self.globals = globals_
+        self.functions = functions
+        self.caches = caches or {}  # função pura -> cache de resultados
+
+    def run(self) -> dict:
+        """Executa o programa; devolve as variáveis globais."""
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, RECURSION_LIMIT))
+        frame = {}
+        try:
+            for statement in self.statements:
+                statement(frame)
+        except RecursionError:
+            raise NocSysRuntimeError("limite de recursão excedido") from None
+        finally:
+            sys.setrecursionlimit(limit)
+        return self.globals
+
+
+class ClosureCompiler:
+    def __init__(self, output=None, memoize: int = 0):
+        self.output = output if output is not None else print
+        self.memoize = memoize  # tamanho do cache por função pura (0 = sem cache)
+        self.globals: dict = {}
+        self.functions: Dict[str, _Function] = {}
+        self.caches: Dict[str, LRUCache] = {}
+        # Escopos locais visíveis (nome -> chave no frame); vazio = topo do programa
+        self._scopes: List[Dict[str, str]] = []
+        self._in_function = False
+
+    def compile(self, program: Program) -> CompiledProgram:
+        for decl in program.declarations:
+            if isinstance(decl, FuncDecl):
+                name = decl.name.value
+                if name in self.functions:
+                    raise error_at(decl.name, f"função '{name}' já declarada")
+                self.functions[name] = _Function(name, tuple(p.name.value for p in decl.params))
+        if self.memoize:
+            from src.optimizer.purity import pure_functions
+            self.caches = {name: LRUCache(self.memoize) for name in pure_functions(program)}
+        for decl in program.declarations:
+            if isinstance(decl, FuncDecl):
+                self.functions[decl.name.value].tail = self._has_tail_call(decl.body)
+
+        statements = []
+        for decl in program.declarations:
+            if isinstance(decl, FuncDecl):
+                self._func_decl(decl)
+            else:
+                statement, _ = self._statement(decl)
+                if statement is not _nothing:
+                    statements.append(statement)
+        return CompiledProgram(statements, self.globals, self.functions, self.caches)
+
+    def _func_decl(self, node: FuncDecl):
+        function = self.functions[node.name.value]
+        self._scopes = [{name: name for name in function.params}]
+        self._in_function = True
+        try:
+            function.body, _ = self._block(node.body)
+        finally:
+            self._scopes = []
+            self._in_function = False
+
+    def _tail_target(self, node) -> Optional[_Function]:
+        """Função chamada por `return node` se der para fazer chamada em cauda."""
+        if type(node) is not CallExpr:
+            return None
+        function = self.functions.get(node.callee.value)
+        if (function is None or len(function.params) != len(node.args)
+                or function.name in self.caches):
+            # erros continuam na chamada normal; funções com cache passam pelo cache
+            return None
+        return function
+
+    def _has_tail_call(self, node) -> bool:
+        kind = type(node)
+        if kind is ReturnStmt:
+            return self._tail_target(node.value) is not None
+        if kind is Block:
+            return any(self._has_tail_call(statement) for statement in node.statements)
+        if kind is IfStmt:
+            return self._has_tail_call(node.then_branch) or (
+                node.else_branch is not None and self._has_tail_call(node.else_branch))
+        if kind is WhileStmt:
+            return self._has_tail_call(node.body)
+        return False
+
+    # ==========================
+    # Escopo
+    # ==========================
+    def _declare(self, name: str) -> Optional[str]:
+        """Chave local da variável declarada agora (None = global)."""
+        if not self._scopes:
+            return None
+        depth = len(self._scopes)
+        key = name if depth == 1 else f"{name}@{depth}"
+        self._scopes[-1][name] = key
+        return key
+
+    def _resolve(self, name: str) -> Optional[str]:
+        for scope in reversed(self._scopes):
+            key = scope.get(name)
+            if key is not None:
+                return key
+        return None
+
+    def _getter(self, name_tok):
+        name = name_tok.value
+        key = self._resolve(name)
+        if key is not None:
+            def get_local(frame):
+                return frame[key]
+            return get_local
+
+        globals_ = self.globals
+
+        def get_global(frame):
+            try:
+                return globals_[name]
+            except KeyError:
+                raise error_at(name_tok, f"variável '{name}' não declarada") from None
+        return get_global
+
+    def _setter(self, name_tok):
+        name = name_tok.value
+        key = self._resolve(name)
+        if key is not None:
+            def set_local(frame, value):
+                frame[key] = value
+            return set_local
+
+        globals_ = self.globals
+
+        def set_global(frame, value):
+            if name not in globals_:
+                raise error_at(name_tok, f"variável '{name}' não declarada")
+            globals_[name] = value
+        return set_global
+
+    # ==========================
+    # Statements: cada um devolve (closure, pode_retornar)
+    # ==========================
+    def _statement(self, node):
+        method = self._STATEMENTS.get(type(node))
+        if method is None:
+            if isinstance(node, FuncDecl):
+                raise error_at(node.name, "funções só podem ser declaradas no topo do programa")
+            raise NocSysRuntimeError(f"nó desconhecido: {type(node).__name__}")
+        return method(self, node)
+
+    def _block(self, node: Block):
+        self._scopes.append({})
+        try:
+            compiled = [self._statement(statement) for statement in node.statements]
+        finally:
+            self._scopes.pop()
+        statements = tuple(s for s, _ in compiled if s is not _nothing)
+        may_return = any(r for _, r in compiled)
+
+        if not statements:
+            return _nothing, False
+        if len(statements) == 1:
+            return statements[0], may_return
+        if not may_return:
+            def block(frame):
+                for statement in statements:
+                    statement(frame)
+            return block, False
+
+        def block_with_return(frame):
+            for statement in statements:
+                result = statement(frame)
+                if result is not None:
+                    return result
+        return block_with_return, True
+
+    def _var_decl(self, node: VarDecl):
+        init = _nothing if node.init_expr is None else self._expression(node.init_expr)
+        key = self._declare(node.name.value)
+        if key is None:
+            globals_ = self.globals
+            name = node.name.value
+
+            def declare_global(frame):
+                globals_[name] = init(frame)
+            return declare_global, False
+
+        def declare_local(frame):
+            frame[key] = init(frame)
+        return declare_local, False
+
+    def _assign_stmt(self, node: AssignStmt):
+        value = self._expression(node.value)
+        name_tok = node.target.name
+        key = self._resolve(name_tok.value)
+        if key is not None:
+            def assign_local(frame):
+                frame[key] = value(frame)
+            return assign_local, False
+
+        setter = self._setter(name_tok)
+
+        def assign_global(frame):
+            setter(frame, value(frame))
+        return assign_global, False
+
+    def _if_stmt(self, node: IfStmt):
+        condition = self._expression(node.condition)
+        then_branch, then_returns = self._block(node.then_branch)
+        if node.else_branch is None:
+            def if_then(frame):
+                if condition(frame):
+                    return then_branch(frame)
+            return if_then, then_returns
+
+        else_branch, else_returns = self._block(node.else_branch)
+
+        def if_else(frame):
+            if condition(frame):
+                return then_branch(frame)
+            return else_branch(frame)
+        return if_else, then_returns or else_returns
+
+    def _while_stmt(self, node: WhileStmt):
+        condition = self._expression(node.condition)
+        body, may_return = self._block(node.body)
+        if not may_return:
+            def loop(frame):
+                while condition(frame):
+                    body(frame)
+            return loop, False
+
+        def loop_with_return(frame):
+            while condition(frame):
+                result = body(frame)
+                if result is not None:
+                    return result
+        return loop_with_return, True
+
+    def _return_stmt(self, node: ReturnStmt):
+        if not self._in_function:
+            # o valor é calculado antes do erro, como no TreeWalker
+            value = _nothing if node.value is None else self._expression(node.value)
+
+            def return_outside(frame):
+                value(frame)
+                raise NocSysRuntimeError("'return' fora de função")
+            return return_outside, False
+        if node.value is None:
+            return (lambda frame: _RETURN_NONE), True
+        function = self._tail_target(node.value)
+        if function is not None:
+            return self._tail_call(node.value, function), True
+        value = self._expression(node.value)
+
+        def return_value(frame):
+            return (value(frame),)
+        return return_value, True
+
+    def _print_stmt(self, node: PrintStmt):
+        value = self._expression(node.value)
+        output = self.output
+
+        def print_value(frame):
+            output(format_value(value(frame)))
+        return print_value, False
+
+    def _expr_stmt(self, node: ExprStmt):
+        expr = node.expr
+        if type(expr) is LiteralExpr:
+            # ';' sozinho (e literais soltos) não fazem nada
+            return _nothing, False
+        if type(expr) is BinaryExpr and expr.op.kind == SWAP:
+            return self._swap(expr), False
+        value = self._expression(expr)
+
+        def evaluate(frame):
+            value(frame)
+        return evaluate, False
+
+    def _swap(self, expr: BinaryExpr):
+        if type(expr.left) is not VarExpr or type(expr.right) is not VarExpr:
+            return _fail(expr.op, "'<->' só troca duas variáveis")
+        get_left, get_right = self._getter(expr.left.name), self._getter(expr.right.name)
+        set_left, set_right = self._setter(expr.left.name), self._setter(expr.right.name)
+
+        def swap(frame):
+            left = get_left(frame)
+            right = get_right(frame)
+            set_left(frame, right)
+            set_right(frame, left)
+        return swap
+
+    # ==========================
+    # Expressões: cada uma devolve uma closure f(frame) -> valor
+    # ==========================
+    def _expression(self, node):
+        method = self._EXPRESSIONS.get(type(node))
+        if method is None:
+            raise NocSysRuntimeError(f"expressão desconhecida: {type(node).__name__}")
+        return method(self, node)
+
+    def _literal(self, node: LiteralExpr):
+        value = literal_value(node.value)
+
+        def constant(frame):
+            return value
+        return constant
+
+    def _variable(self, node: VarExpr):
+        return self._getter(node.name)
+
+    def _binary(self, node: BinaryExpr):
+        op_tok = node.op
+        if op_tok.kind == SWAP:
+            return _fail(op_tok, "'<->' é uma instrução, não uma expressão")
+        operation = BINARY_OPERATORS[op_tok.kind]
+        left = self._expression(node.left)
+
+        if type(node.right) is LiteralExpr:
+            # operando constante à direita (n - 1, i < 10): uma chamada a menos
+            constant = literal_value(node.right.value)
+
+            def binary_constant(frame):
+                value = left(frame)
+                try:
+                    return operation(value, constant)
+                except OPERATOR_ERRORS as e:
+                    raise operation_error(op_tok, e, value, constant) from None
+            return binary_constant
+
+        right = self._expression(node.right)
+
+        def binary(frame):
+            a = left(frame)
+            b = right(frame)
+            try:
+                return operation(a, b)
+            except OPERATOR_ERRORS as e:
+                raise operation_error(op_tok, e, a, b) from None
+        return binary
+
+    def _unary(self, node: UnaryExpr):
+        op_tok = node.op
+        operation = UNARY_OPERATORS[op_tok.kind]
+        right = self._expression(node.right)
+
+        def unary(frame):
+            value = right(frame)
+            try:
+                return operation(value)
+            except OPERATOR_ERRORS as e:
+                raise operation_error(op_tok, e, value) from None
+        return unary
+
+    def _call(self, node: CallExpr):
+        callee = node.callee
+        function = self.functions.get(callee.value)
+        if function is None:
+            return _fail(callee, f"função '{callee.value}' não declarada")
+        params = function.params
+        if len(node.args) != len(params):
+            return _fail(callee, f"função '{callee.value}' espera {len(params)} "
+                                 f"argumento(s), recebeu {len(node.args)}")
+
+        args = tuple(self._expression(arg) for arg in node.args)
+        cache = self.caches.get(callee.value)
+        if cache is not None:
+            return self._memoized_call(function, args, cache)
+        if function.tail:
+            return self._trampoline_call(function, args)
+        # Aridades comuns sem laço nem zip
+        if not args:
+            def call0(frame):
+                result = function.body({})
+                return None if result is None else result[0]
+            return call0
+        if len(args) == 1:
+            (p0,), (a0,) = params, args
+
+            def call1(frame):
+                result = function.body({p0: a0(frame)})
+                return None if result is None else result[0]
+            return call1
+        if len(args) == 2:
+            (p0, p1), (a0, a1) = params, args
+
+            def call2(frame):
+                result = function.body({p0: a0(frame), p1: a1(frame)})
+                return None if result is None else result[0]
+            return call2
+
+        def call(frame):
+            result = function.body({p: a(frame) for p, a in zip(params, args)})
+            return None if result is None else result[0]
+        return call
+
+    def _trampoline_call(self, function: _Function, args):
+        params = function.params
+        if not args:
+            def trampoline_call0(frame):
+                return _trampoline(function.body({}))
+            return trampoline_call0
+        if len(args) == 1:
+            (p0,), (a0,) = params, args
+
+            def trampoline_call1(frame):
+                return _trampoline(function.body({p0: a0(frame)}))
+            return trampoline_call1
+        if len(args) == 2:
+            (p0, p1), (a0, a1) = params, args
+
+            def trampoline_call2(frame):
+                return _trampoline(function.body({p0: a0(frame), p1: a1(frame)}))
+            return trampoline_call2
+
+        def trampoline_call(frame):
+            return _trampoline(function.body({p: a(frame) for p, a in zip(params, args)}))
+        return trampoline_call
+
+    def _tail_call(self, node: CallExpr, function: _Function):
+        """`return f(...)`: só monta o frame de `f`; quem chamou faz a chamada."""
+        params = function.params
+        args = tuple(self._expression(arg) for arg in node.args)
+        if not args:
+            def tail_call0(frame):
+                return _TailCall(function, {})
+            return tail_call0
+        if len(args) == 1:
+            (p0,), (a0,) = params, args
+
+            def tail_call1(frame):
+                return _TailCall(function, {p0: a0(frame)})
+            return tail_call1
+        if len(args) == 2:
+            (p0, p1), (a0, a1) = params, args
+
+            def tail_call2(frame):
+                return _TailCall(function, {p0: a0(frame), p1: a1(frame)})
+            return tail_call2
+
+        def tail_call(frame):
+            return _TailCall(function, {p: a(frame) for p, a in zip(params, args)})
+        return tail_call
+
+    def _memoized_call(self, function: _Function, args, cache: LRUCache):
+        params = function.params
+        get, put = cache.get, cache.put
+        if len(args) == 1:
+            (p0,), (a0,) = params, args
+
+            def memoized_call1(frame):
+                value = a0(frame)
+                key = (value,) if type(value) is int else memo_key((value,))
+                result = get(key)
+                if result is MISSING:
+                    result = _trampoline(function.body({p0: value}))
+                    put(key, result)
+                return result
+            return memoized_call1
+
+        def memoized_call(frame):
+            values = tuple(a(frame) for a in args)
+            key = memo_key(values)
+            result = get(key)
+            if result is MISSING:
+                result = _trampoline(function.body(dict(zip(params, values))))
+                put(key, result)
+            return result
+        return memoized_call
+
+    # ==========================
+    # Tabelas de despacho (usadas só na compilação)
+    # ==========================
+    _STATEMENTS = {
+        VarDecl: _var_decl,
+        AssignStmt: _assign_stmt,
+        IfStmt: _if_stmt,
+        WhileStmt: _while_stmt,
+        ReturnStmt: _return_stmt,
+        PrintStmt: _print_stmt,
+        ExprStmt: _expr_stmt,
+        Block: _block,
+    }
+
+    _EXPRESSIONS = {
+        LiteralExpr: _literal,
+        VarExpr: _variable,
+        BinaryExpr: _binary,
+        UnaryExpr: _unary,
+        CallExpr: _call,
+    }
+
+
+def compile_program(program: Program, output=None, memoize: int = 0) -> CompiledProgram:
+    return ClosureCompiler(output, memoize).compile(program)
+
+
+def run(program: Program, output=None, memoize: int = 0) -> dict:
+    """Compila e executa `program`; devolve as variáveis globais."""
+    return compile_program(program, output, memoize).run()
@@ -0,0 +1,63 @@
+# src/executor/memo.py
+"""
+Cache LRU de resultados de funções puras (ver optimizer/purity.py).
+
+A chave são os valores dos argumentos. Como em Python `1 == 1.0 == True` e
+`0.0 == -0.0`, argumentos que não são int nem str entram na chave com o tipo
+(e floats pelo repr), para que `f(1)`, `f(1.0)`, `f(true)` e `f(-0.0)` não
+compartilhem resultado.
+"""
+
+from collections import OrderedDict
+
+MISSING = object()
+
+
+def memo_key(args: tuple):
+    """Chave do cache para os argumentos de uma chamada."""
+    for value in args:
+        if type(value) is not int and type(value) is not str:
+            return tuple((type(v), repr(v) if type(v) is float else v) for v in args)
+    return args
+
+
+class LRUCache:
+    """Resultados por chave, descartando o menos usado quando passa de `maxsize`."""
+    __slots__ = ('maxsize', 'hits', 'misses', '_data')
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("maxsize deve ser positivo")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key):
+        """Resultado guardado, ou MISSING."""
+        data = self._data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            return MISSING
+        data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        data = self._data
+        data[key] = value
+        if len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = 0
+
+    def __repr__(self) -> str:
+        return (f"LRUCache(maxsize={self.maxsize}, size={len(self)}, "
+                f"hits={self.hits}, misses={self.misses})")
@@ -0,0 +1,156 @@
+# src/executor/runtime.py
+"""
+Semântica de execução compartilhada pelos executores de NocSys.
+
+Tudo o que define o comportamento de um programa (e que não depende de como
+ele é executado) fica aqui, para que os backends se comportem igual:
+
+- valores são os do Python: int, float, str, bool e None ("nada");
+- `+ - * / // **` e as comparações são os operadores do Python (`/` é
+  divisão real, `//` divisão inteira); operandos inválidos, divisão por zero
+  e resultados complexos viram `NocSysRuntimeError` com linha/coluna do
+  operador;
+- `print` escreve `true`/`false` para booleanos e `nada` para None;
+- strings literais perdem as aspas e têm os escapes (`\\n`, `\\t`, `\\"`, ...)
+  decodificados.
+"""
+
+import operator
+import re
+
+from src.lexer.tokens import TokenType
+
+# Acima do limite padrão do Python: cada chamada NocSys usa alguns quadros
+RECURSION_LIMIT = 200_000
+
+
+class NocSysRuntimeError(RuntimeError):
+    """Erro de execução, com a posição do token de origem quando conhecida."""
+    def __init__(self, message: str, line=None, column=None):
+        self.message = message
+        self.line = line
+        self.column = column
+        where = f" na linha {line}, coluna {column}" if line is not None else ""
+        super().__init__(f"Erro de execução: {message}{where}")
+
+
+def error_at(token, message: str) -> NocSysRuntimeError:
+    if token is None:
+        return NocSysRuntimeError(message)
+    return NocSysRuntimeError(message, token.line, token.column)
+
+
+# ==========================
+# Valores
+# ==========================
+TYPE_NAMES = {int: 'inteiro', float: 'real', str: 'texto', bool: 'booleano', type(None): 'nada'}
+
+
+def type_name(value) -> str:
+    return TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def format_value(value) -> str:
+    """Texto escrito por `print`."""
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if value is None:
+        return 'nada'
+    if type(value) is int:
+        try:
+            return str(value)
+        except ValueError:
+            # mais dígitos que sys.get_int_max_str_digits() (4300 por padrão)
+            return _long_int_str(value)
+    return str(value)
+
+
+_DIGITS_PER_CHUNK = 4000
+
+
+def _long_int_str(value: int) -> str:
+    """Decimal de um inteiro longo, em pedaços que o str() do Python aceita."""
+    sign = '-' if value < 0 else ''
+    value = abs(value)
+    chunks = []
+    base = 10 ** _DIGITS_PER_CHUNK
+    while value >= base:
+        value, chunk = divmod(value, base)
+        chunks.append(f"{chunk:0{_DIGITS_PER_CHUNK}d}")
+    chunks.append(str(value))
+    return sign + ''.join(reversed(chunks))
+
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+
+
+def decode_string(lexeme: str) -> str:
+    """Valor de um literal STRING: sem as aspas e com os escapes resolvidos."""
+    return _ESCAPE_RE.sub(lambda m: _ESCAPES.get(m.group(1), m.group(1)), lexeme[1:-1])
+
+
+def encode_string(text: str) -> str:
+    """Lexema STRING que `decode_string` transforma de volta em `text`."""
+    return '"' + text.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def literal_value(value):
+    """Valor de execução de um LiteralExpr (o parser deixa as aspas nas strings)."""
+    if type(value) is str:
+        return decode_string(value)
+    return value
+
+
+# ==========================
+# Operadores
+# ==========================
+def power(left, right):
+    result = left ** right
+    if type(result) is complex:
+        raise ValueError("resultado complexo")
+    return result
+
+
+BINARY_OPERATORS = {
+    int(TokenType.PLUS): operator.add,
+    int(TokenType.MINUS): operator.sub,
+    int(TokenType.MULTIPLY): operator.mul,
+    int(TokenType.DIVIDE): operator.truediv,
+    int(TokenType.FLOOR_DIV): operator.floordiv,
+    int(TokenType.POWER): power,
+    int(TokenType.EQUAL): operator.eq,
+    int(TokenType.NOT_EQUAL): operator.ne,
+    int(TokenType.LESS): operator.lt,
+    int(TokenType.LESS_EQUAL): operator.le,
+    int(TokenType.GREATER): operator.gt,
+    int(TokenType.GREATER_EQUAL): operator.ge,
+}
+
+UNARY_OPERATORS = {
+    int(TokenType.PLUS): operator.pos,
+    int(TokenType.MINUS): operator.neg,
+}
+
+# Exceções do Python que um operador pode levantar com operandos NocSys
+OPERATOR_ERRORS = (TypeError, ZeroDivisionError, OverflowError, ValueError)
+
+
+def operation_error(token, error: Exception, *operands) -> NocSysRuntimeError:
+    """Traduz a exceção de um operador para NocSysRuntimeError na posição do token."""
+    if isinstance(error, ZeroDivisionError):
+        return error_at(token, "divisão por zero")
+    if isinstance(error, OverflowError):
+        return error_at(token, f"resultado grande demais em '{token.value}'")
+    if isinstance(error, ValueError):
+        return error_at(token, f"resultado complexo em '{token.value}'")
+    return error_at(token, invalid_operation(token.value, [type_name(value) for value in operands]))
+
+
+def invalid_operation(symbol: str, types) -> str:
+    """Mensagem de operandos inválidos (`types` vazio quando não são conhecidos)."""
+    if not types:
+        return f"operação '{symbol}' inválida"
+    return f"operação '{symbol}' inválida para {' e '.join(types)}"
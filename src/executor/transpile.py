@@ -0,0 +1,527 @@
+# src/executor/transpile.py
+"""
+Backend que traduz o Program para uma árvore `ast` do Python e a compila com
+`compile()`: o bytecode e o interpretador especializado do CPython fazem o
+trabalho.
+
+Mapeamento da semântica (a mesma de `runtime.py` e dos outros backends):
+
+- nomes ganham prefixos que não colidem entre si nem com os auxiliares:
+  `v_x` para globais e parâmetros, `v3_x` para variáveis de um bloco na
+  profundidade 3 dentro de função, `b2_x` para blocos aninhados no topo do
+  programa e `f_nome` para funções; blocos não existem no Python, então o
+  sombreamento vira nomes diferentes;
+- globais atribuídas dentro de função entram num `global`; atribuir uma
+  global exige que ela exista, o que o código gerado confere lendo o nome
+  depois de avaliar o valor (`v_x = (valor, v_x)[0]`);
+- funções são definidas antes do código de topo (podem ser chamadas antes
+  da declaração); `**` e `print` chamam os auxiliares de `runtime.py`, e
+  `*` passa por um auxiliar que guarda os operandos para a mensagem de erro;
+- `a <-> b;` vira `v_a, v_b = v_b, v_a`;
+- erros que o TreeWalker só acusa ao executar (`return` fora de função,
+  `<->` mal usado, chamada inválida) viram chamadas a `_nocsys_error`.
+
+Cada nó gerado carrega a linha/coluna do token NocSys correspondente; quando
+a execução falha, a posição da instrução que falhou (`co_positions`) é a do
+token, e a exceção vira `NocSysRuntimeError` com ela.
+
+Os code objects ficam em cache, em memória e em disco (marshal), chaveados
+pelo hash do source e pela versão do Python.
+"""
+
+from __future__ import annotations
+import ast
+import hashlib
+import importlib.util
+import marshal
+import os
+import re
+import sys
+import zlib
+from types import CodeType
+from typing import Dict, List, Optional
+
+from src.lexer.cache import cache_dir, cache_enabled
+from src.lexer.lexer import Token
+from src.lexer.tokens import TokenType
+from src.parser.ast import (
+    Program, VarDecl, FuncDecl,
+    Block, AssignStmt, IfStmt, WhileStmt,
+    ReturnStmt, PrintStmt, ExprStmt,
+    BinaryExpr, UnaryExpr, LiteralExpr,
+    VarExpr, CallExpr
+)
+from .bytecode import save_atomic
+from .runtime import (
+    NocSysRuntimeError, error_at, format_value, literal_value, power,
+    OPERATOR_ERRORS, operation_error, invalid_operation, RECURSION_LIMIT, TYPE_NAMES,
+)
+
+FORMAT_VERSION = 2
+MAGIC = b'NOCSYSPY'
+FILENAME = '<nocsys>'
+
+# Nome do global gerado com (linha, coluna, operador) de cada operador do programa
+OPERATORS_TABLE = '_nocsys_operators'
+
+SWAP = int(TokenType.SWAP)
+POWER = int(TokenType.POWER)
+MULTIPLY = int(TokenType.MULTIPLY)
+
+_BINARY = {
+    int(TokenType.PLUS): ast.Add,
+    int(TokenType.MINUS): ast.Sub,
+    int(TokenType.DIVIDE): ast.Div,
+    int(TokenType.FLOOR_DIV): ast.FloorDiv,
+}
+
+_COMPARE = {
+    int(TokenType.EQUAL): ast.Eq,
+    int(TokenType.NOT_EQUAL): ast.NotEq,
+    int(TokenType.LESS): ast.Lt,
+    int(TokenType.LESS_EQUAL): ast.LtE,
+    int(TokenType.GREATER): ast.Gt,
+    int(TokenType.GREATER_EQUAL): ast.GtE,
+}
+
+_UNARY = {
+    int(TokenType.PLUS): ast.UAdd,
+    int(TokenType.MINUS): ast.USub,
+}
+
+
+def _at(node, token: Token):
+    """Posiciona o nó Python no token NocSys (colunas do ast começam em 0)."""
+    node.lineno = node.end_lineno = token.line
+    node.col_offset = token.column - 1
+    node.end_col_offset = node.col_offset + len(str(token.value))
+    return node
+
+
+def _name(identifier: str, token: Optional[Token] = None, store: bool = False):
+    node = ast.Name(id=identifier, ctx=ast.Store() if store else ast.Load())
+    return _at(node, token) if token is not None else node
+
+
+def _helper_call(helper: str, args, token: Optional[Token] = None):
+    node = ast.Call(func=_name(helper, token), args=args, keywords=[])
+    return _at(node, token) if token is not None else node
+
+
+def _error_call(message: str, token: Optional[Token] = None):
+    """Chamada que levanta o erro quando executada (sem token: erro sem posição)."""
+    line, column = (None, None) if token is None else (token.line, token.column)
+    return _helper_call('_nocsys_error', [ast.Constant(message), ast.Constant(line),
+                                          ast.Constant(column)], token)
+
+
+class PythonTranspiler:
+    def __init__(self):
+        self.functions: Dict[str, FuncDecl] = {}
+        self._scopes: List[Dict[str, str]] = []
+        self._in_function = False
+        self._assigned_globals: set = set()
+        self._operators: List[tuple] = []
+
+    def transpile(self, program: Program) -> ast.Module:
+        declarations = [d for d in program.declarations if isinstance(d, FuncDecl)]
+        for decl in declarations:
+            name = decl.name.value
+            if name in self.functions:
+                raise error_at(decl.name, f"função '{name}' já declarada")
+            self.functions[name] = decl
+
+        body = [self._func_decl(decl) for decl in declarations]
+        self._scopes, self._in_function = [], False
+        for decl in program.declarations:
+            if not isinstance(decl, FuncDecl):
+                body.extend(self._statement(decl))
+
+        table = ast.Assign(targets=[_name(OPERATORS_TABLE, store=True)],
+                           value=ast.Constant(tuple(self._operators)))
+        module = ast.Module(body=[table] + body, type_ignores=[])
+        return ast.fix_missing_locations(module)
+
+    def _func_decl(self, node: FuncDecl) -> ast.FunctionDef:
+        params = {p.name.value: f"v_{p.name.value}" for p in node.params}
+        self._scopes, self._in_function = [params], True
+        self._assigned_globals = set()
+        body = self._block(node.body)
+        if self._assigned_globals:
+            body.insert(0, ast.Global(names=sorted(self._assigned_globals)))
+        arguments = ast.arguments(
+            posonlyargs=[], args=[_at(ast.arg(arg=params[p.name.value]), p.name) for p in node.params],
+            vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[])
+        return _at(ast.FunctionDef(name=f"f_{node.name.value}", args=arguments, body=body or [ast.Pass()],
+                                   decorator_list=[], returns=None, type_comment=None), node.name)
+
+    # ==========================
+    # Escopo
+    # ==========================
+    def _declare(self, name: str) -> str:
+        if not self._scopes:
+            return f"v_{name}"
+        depth = len(self._scopes)
+        prefix = f"v{depth}" if self._in_function else f"b{depth}"
+        identifier = self._scopes[-1][name] = f"{prefix}_{name}"
+        return identifier
+
+    def _resolve(self, name: str) -> Optional[str]:
+        for scope in reversed(self._scopes):
+            identifier = scope.get(name)
+            if identifier is not None:
+                return identifier
+        return None
+
+    def _store(self, name_tok: Token, value) -> ast.stmt:
+        identifier = self._resolve(name_tok.value)
+        if identifier is not None:
+            return _at(ast.Assign(targets=[_name(identifier, name_tok, store=True)], value=value),
+                       name_tok)
+        # global: só pode ser atribuída se já existe (a leitura levanta NameError)
+        identifier = f"v_{name_tok.value}"
+        if self._in_function:
+            self._assigned_globals.add(identifier)
+        checked = ast.Subscript(value=ast.Tuple(elts=[value, _name(identifier, name_tok)],
+                                                ctx=ast.Load()),
+                                slice=ast.Constant(0), ctx=ast.Load())
+        return _at(ast.Assign(targets=[_name(identifier, name_tok, store=True)], value=checked),
+                   name_tok)
+
+    # ==========================
+    # Statements: cada um devolve uma lista de statements Python
+    # ==========================
+    def _statement(self, node) -> List[ast.stmt]:
+        method = self._STATEMENTS.get(type(node))
+        if method is None:
+            if isinstance(node, FuncDecl):
+                raise error_at(node.name, "funções só podem ser declaradas no topo do programa")
+            raise NocSysRuntimeError(f"nó desconhecido: {type(node).__name__}")
+        return method(self, node)
+
+    def _block(self, node: Block) -> List[ast.stmt]:
+        self._scopes.append({})
+        try:
+            statements = []
+            for statement in node.statements:
+                statements.extend(self._statement(statement))
+            return statements
+        finally:
+            self._scopes.pop()
+
+    def _var_decl(self, node: VarDecl):
+        value = ast.Constant(None) if node.init_expr is None else self._expression(node.init_expr)
+        identifier = self._declare(node.name.value)
+        return [_at(ast.Assign(targets=[_name(identifier, node.name, store=True)], value=value),
+                    node.name)]
+
+    def _assign_stmt(self, node: AssignStmt):
+        return [self._store(node.target.name, self._expression(node.value))]
+
+    def _if_stmt(self, node: IfStmt):
+        orelse = [] if node.else_branch is None else self._block(node.else_branch)
+        return [ast.If(test=self._expression(node.condition),
+                       body=self._block(node.then_branch) or [ast.Pass()], orelse=orelse)]
+
+    def _while_stmt(self, node: WhileStmt):
+        return [ast.While(test=self._expression(node.condition),
+                          body=self._block(node.body) or [ast.Pass()], orelse=[])]
+
+    def _return_stmt(self, node: ReturnStmt):
+        value = None if node.value is None else self._expression(node.value)
+        if not self._in_function:
+            # como no TreeWalker: o valor é avaliado e o erro só sai se o return rodar
+            statements = [] if value is None else [ast.Expr(value)]
+            statements.append(ast.Expr(_error_call("'return' fora de função")))
+            return statements
+        return [ast.Return(value=value)]
+
+    def _print_stmt(self, node: PrintStmt):
+        return [ast.Expr(_helper_call('_nocsys_print', [self._expression(node.value)]))]
+
+    def _expr_stmt(self, node: ExprStmt):
+        expr = node.expr
+        if type(expr) is LiteralExpr:
+            return []
+        if type(expr) is BinaryExpr and expr.op.kind == SWAP:
+            if type(expr.left) is not VarExpr or type(expr.right) is not VarExpr:
+                return [ast.Expr(_error_call("'<->' só troca duas variáveis", expr.op))]
+            return [self._swap(expr)]
+        return [ast.Expr(self._expression(expr))]
+
+    def _swap(self, expr: BinaryExpr):
+        names = []
+        for var in (expr.left, expr.right):
+            identifier = self._resolve(var.name.value)
+            if identifier is None:
+                identifier = f"v_{var.name.value}"
+                if self._in_function:
+                    self._assigned_globals.add(identifier)
+            names.append((identifier, var.name))
+        (left, left_tok), (right, right_tok) = names
+        # os dois nomes são lidos antes da atribuição: uma global inexistente falha ali
+        return _at(ast.Assign(
+            targets=[ast.Tuple(elts=[_name(left, left_tok, store=True),
+                                     _name(right, right_tok, store=True)], ctx=ast.Store())],
+            value=ast.Tuple(elts=[_name(right, right_tok), _name(left, left_tok)], ctx=ast.Load()),
+        ), expr.op)
+
+    # ==========================
+    # Expressões
+    # ==========================
+    def _expression(self, node) -> ast.expr:
+        method = self._EXPRESSIONS.get(type(node))
+        if method is None:
+            raise NocSysRuntimeError(f"expressão desconhecida: {type(node).__name__}")
+        return method(self, node)
+
+    def _literal(self, node: LiteralExpr):
+        return ast.Constant(literal_value(node.value))
+
+    def _variable(self, node: VarExpr):
+        identifier = self._resolve(node.name.value) or f"v_{node.name.value}"
+        return _name(identifier, node.name)
+
+    def _binary(self, node: BinaryExpr):
+        op_tok = node.op
+        kind = op_tok.kind
+        if kind == SWAP:
+            return _error_call("'<->' é uma instrução, não uma expressão", op_tok)
+        left, right = self._expression(node.left), self._expression(node.right)
+        self._operators.append((op_tok.line, op_tok.column, op_tok.value))
+        if kind == POWER:
+            return _helper_call('_nocsys_power', [left, right], op_tok)
+        if kind == MULTIPLY:
+            return _helper_call('_nocsys_multiply', [left, right], op_tok)
+        if kind in _COMPARE:
+            return _at(ast.Compare(left=left, ops=[_COMPARE[kind]()], comparators=[right]), op_tok)
+        return _at(ast.BinOp(left=left, op=_BINARY[kind](), right=right), op_tok)
+
+    def _unary(self, node: UnaryExpr):
+        op_tok = node.op
+        self._operators.append((op_tok.line, op_tok.column, op_tok.value))
+        return _at(ast.UnaryOp(op=_UNARY[op_tok.kind](), operand=self._expression(node.right)),
+                   op_tok)
+
+    def _call(self, node: CallExpr):
+        callee = node.callee
+        function = self.functions.get(callee.value)
+        message = None
+        if function is None:
+            message = f"função '{callee.value}' não declarada"
+        elif len(node.args) != len(function.params):
+            message = (f"função '{callee.value}' espera {len(function.params)} "
+                       f"argumento(s), recebeu {len(node.args)}")
+        if message is not None:
+            return _error_call(message, callee)
+        args = [self._expression(arg) for arg in node.args]
+        return _at(ast.Call(func=_name(f"f_{callee.value}", callee), args=args, keywords=[]), callee)
+
+    _STATEMENTS = {
+        VarDecl: _var_decl,
+        AssignStmt: _assign_stmt,
+        IfStmt: _if_stmt,
+        WhileStmt: _while_stmt,
+        ReturnStmt: _return_stmt,
+        PrintStmt: _print_stmt,
+        ExprStmt: _expr_stmt,
+        Block: _block,
+    }
+
+    _EXPRESSIONS = {
+        LiteralExpr: _literal,
+        VarExpr: _variable,
+        BinaryExpr: _binary,
+        UnaryExpr: _unary,
+        CallExpr: _call,
+    }
+
+
+def transpile(program: Program) -> ast.Module:
+    return PythonTranspiler().transpile(program)
+
+
+def to_python_source(program: Program) -> str:
+    """Código Python equivalente (para inspeção; a execução usa a árvore direto)."""
+    return ast.unparse(transpile(program))
+
+
+def compile_program(program: Program) -> CodeType:
+    return compile(transpile(program), FILENAME, 'exec')
+
+
+# ==========================
+# Execução e tradução de erros
+# ==========================
+def _raise_error(message: str, line: int, column: int):
+    raise NocSysRuntimeError(message, line, column)
+
+
+def _multiply(left, right):
+    """
+    `*` com os operandos guardados no TypeError: a mensagem do Python para
+    texto vezes real (ou texto) não traz os dois tipos.
+    """
+    try:
+        return left * right
+    except TypeError as e:
+        e.operands = (left, right)
+        raise
+
+
+def _printer(output):
+    """
+    `print` do programa. O texto vem de `format_value`, como nos outros
+    backends; um erro da própria saída passa adiante sem virar erro de operador.
+    """
+    def nocsys_print(value):
+        try:
+            output(format_value(value))
+        except OPERATOR_ERRORS as e:
+            e.from_output = True
+            raise
+    return nocsys_print
+
+
+def execute(code: CodeType, output=None) -> dict:
+    """Executa o code object gerado; devolve as variáveis globais do programa."""
+    output = output if output is not None else print
+    namespace = {
+        '__builtins__': {},
+        '_nocsys_print': _printer(output),
+        '_nocsys_power': power,
+        '_nocsys_multiply': _multiply,
+        '_nocsys_error': _raise_error,
+    }
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, RECURSION_LIMIT))
+    try:
+        exec(code, namespace)
+    except NocSysRuntimeError:
+        raise
+    except RecursionError:
+        raise NocSysRuntimeError("limite de recursão excedido") from None
+    except (NameError,) + OPERATOR_ERRORS as e:
+        if getattr(e, 'from_output', False):
+            raise
+        raise _translate(e, namespace) from None
+    finally:
+        sys.setrecursionlimit(limit)
+    return {name[2:]: value for name, value in namespace.items() if name.startswith('v_')}
+
+
+def _failing_position(error: Exception):
+    """(linha, coluna) NocSys da instrução do código gerado que levantou `error`."""
+    position = (None, None)
+    tb = error.__traceback__
+    while tb is not None:
+        code = tb.tb_frame.f_code
+        if code.co_filename == FILENAME:
+            line, _, column, _ = list(code.co_positions())[tb.tb_lasti // 2]
+            if line is not None:
+                position = (line, column + 1)
+        tb = tb.tb_next
+    return position
+
+
+_PYTHON_TYPES = {t.__name__: name for t, name in TYPE_NAMES.items()}
+_CONCATENATE_RE = re.compile(r'can only concatenate (\w+) \(not "(\w+)"\)')
+_QUOTED_TYPE_RE = re.compile(r"'(\w+)'")
+
+
+def _operand_types(message: str) -> List[str]:
+    """Tipos NocSys dos operandos, lidos da mensagem do TypeError ([] se não der)."""
+    match = _CONCATENATE_RE.search(message)
+    names = match.groups() if match else _QUOTED_TYPE_RE.findall(message)
+    if not names or not message.startswith(("can only", "unsupported", "'", "bad operand")):
+        return []
+    types = [_PYTHON_TYPES.get(name) for name in names]
+    return [] if None in types else types
+
+
+def _translate(error: Exception, namespace: dict) -> NocSysRuntimeError:
+    line, column = _failing_position(error)
+    if isinstance(error, NameError):
+        name = getattr(error, 'name', None) or ''
+        return NocSysRuntimeError(f"variável '{name.partition('_')[2]}' não declarada",
+                                  line, column)
+    symbol = '?'
+    for op_line, op_column, op_symbol in namespace.get(OPERATORS_TABLE, ()):
+        if (op_line, op_column) == (line, column):
+            symbol = op_symbol
+            break
+    token = Token('OPERATOR', symbol, line, column)
+    operands = getattr(error, 'operands', None)
+    if operands is not None:
+        return operation_error(token, error, *operands)
+    if isinstance(error, TypeError):
+        return error_at(token, invalid_operation(symbol, _operand_types(str(error))))
+    return operation_error(token, error)
+
+
+# ==========================
+# Cache de code objects
+# ==========================
+MEMORY_CACHE_SIZE = 128
+_memory_cache: Dict[str, CodeType] = {}
+
+
+def source_key(source: str) -> str:
+    """Hash do source + versão do formato + versão do bytecode do Python."""
+    data = f"{FORMAT_VERSION}\n{importlib.util.MAGIC_NUMBER.hex()}\n{source}".encode('utf-8')
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def cache_path(key: str) -> str:
+    return os.path.join(cache_dir(), f"python-{key}.bin")
+
+
+def load_cached(source: str) -> CodeType:
+    """
+    Code object de `source`: da memória, do disco ou gerado agora (lexer,
+    parser, tradução e compile) e gravado para as próximas execuções.
+    """
+    key = source_key(source)
+    code = _memory_cache.get(key)
+    if code is not None:
+        return code
+
+    path = cache_path(key)
+    if cache_enabled():
+        code = _read(path)
+    if code is None:
+        from src.parser.parser import Parser  # só necessário quando o cache falha
+
+        code = compile_program(Parser(source).parse())
+        if cache_enabled():
+            body = marshal.dumps(code)
+            save_atomic(path, MAGIC + zlib.crc32(body).to_bytes(4, 'big') + body)
+
+    if len(_memory_cache) >= MEMORY_CACHE_SIZE:
+        del _memory_cache[next(iter(_memory_cache))]
+    _memory_cache[key] = code
+    return code
+
+
+def _read(path: str) -> Optional[CodeType]:
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    header = len(MAGIC) + 4
+    if len(data) < header or not data.startswith(MAGIC):
+        return None
+    body = data[header:]
+    if zlib.crc32(body).to_bytes(4, 'big') != data[len(MAGIC):header]:
+        return None
+    try:
+        code = marshal.loads(body)
+    except (EOFError, ValueError, TypeError):
+        return None
+    return code if isinstance(code, CodeType) else None
+
+
+def run(source: str, output=None) -> dict:
+    """Executa `source` pelo cache de code objects; devolve as variáveis globais."""
+    return execute(load_cached(source), output)
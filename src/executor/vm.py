@@ -0,0 +1,242 @@
+# src/executor/vm.py
+"""
+Máquina de pilha que executa o bytecode de `bytecode.py`.
+
+Um único laço de despacho, com todo o estado em variáveis locais: código,
+constantes e slots da função atual, pc e a pilha de operandos (compartilhada
+entre as chamadas). Os opcodes são testados numa cadeia de `if` na ordem de
+frequência; operadores aritméticos são feitos inline.
+
+Chamadas não usam a pilha do Python: CALL guarda (função, slots, pc) numa lista
+e troca para a função chamada; RETURN restaura. A
+profundidade de recursão tem o mesmo limite dos outros backends
+(RECURSION_LIMIT chamadas guardadas). TAIL_CALL (`return
+f(...)`) troca de função sem guardar nada: recursão em cauda, direta ou
+mútua, roda em espaço constante.
+
+Erros dos operadores viram `NocSysRuntimeError` com a linha/coluna gravada
+para a instrução que falhou.
+"""
+
+from __future__ import annotations
+
+from src.lexer.lexer import Token
+from .bytecode import Module, Op, OP_SYMBOLS
+from .runtime import (
+    NocSysRuntimeError, OPERATOR_ERRORS, operation_error, format_value, power,
+    RECURSION_LIMIT,
+)
+
+_UNDEFINED = object()
+
+LOAD_LOCAL = int(Op.LOAD_LOCAL)
+LOAD_CONST = int(Op.LOAD_CONST)
+STORE_LOCAL = int(Op.STORE_LOCAL)
+JUMP_IF_FALSE = int(Op.JUMP_IF_FALSE)
+JUMP = int(Op.JUMP)
+ADD = int(Op.ADD)
+SUB = int(Op.SUB)
+MUL = int(Op.MUL)
+LT = int(Op.LT)
+LE = int(Op.LE)
+GT = int(Op.GT)
+GE = int(Op.GE)
+EQ = int(Op.EQ)
+NE = int(Op.NE)
+CALL = int(Op.CALL)
+RETURN = int(Op.RETURN)
+LOAD_GLOBAL = int(Op.LOAD_GLOBAL)
+STORE_GLOBAL = int(Op.STORE_GLOBAL)
+DIV = int(Op.DIV)
+FLOOR_DIV = int(Op.FLOOR_DIV)
+POW = int(Op.POW)
+NEG = int(Op.NEG)
+POS = int(Op.POS)
+POP = int(Op.POP)
+PRINT = int(Op.PRINT)
+DECLARE_GLOBAL = int(Op.DECLARE_GLOBAL)
+RETURN_NONE = int(Op.RETURN_NONE)
+ERROR = int(Op.ERROR)
+TAIL_CALL = int(Op.TAIL_CALL)
+
+
+class VM:
+    def __init__(self, module: Module, output=None):
+        self.module = module
+        self.output = output if output is not None else print
+        self.globals = [_UNDEFINED] * len(module.global_names)
+        self.instructions = 0  # instruções executadas na última chamada de run()
+
+    def globals_dict(self) -> dict:
+        return {name: value for name, value in zip(self.module.global_names, self.globals)
+                if value is not _UNDEFINED}
+
+    def run(self) -> dict:
+        """Executa o código de topo do módulo; devolve as variáveis globais."""
+        functions = self.module.functions
+        globals_ = self.globals
+        output = self.output
+
+        current = self.module.main
+        code, constants = current.code, current.constants
+        slots = [None] * current.nlocals
+        frames = []
+        stack = []
+        push, pop = stack.append, stack.pop
+        pc = 0
+        executed = 0
+        op = a = b = None
+
+        try:
+            while True:
+                op = code[pc]
+                arg = code[pc + 1]
+                pc += 2
+                executed += 1
+                if op == LOAD_LOCAL:
+                    push(slots[arg])
+                elif op == LOAD_CONST:
+                    push(constants[arg])
+                elif op == STORE_LOCAL:
+                    slots[arg] = pop()
+                elif op == JUMP_IF_FALSE:
+                    if not pop():
+                        pc = arg
+                elif op == JUMP:
+                    pc = arg
+                elif op == ADD:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = a + b
+                elif op == SUB:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = a - b
+                elif op == LT:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = a < b
+                elif op == MUL:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = a * b
+                elif op == CALL:
+                    if len(frames) >= RECURSION_LIMIT:
+                        raise NocSysRuntimeError("limite de recursão excedido")
+                    frames.append((current, slots, pc))
+                    current = functions[arg]
+                    code, constants = current.code, current.constants
+                    nparams = current.nparams
+                    if nparams:
+                        slots = stack[-nparams:]
+                        del stack[-nparams:]
+                    else:
+                        slots = []
+                    if current.nlocals > nparams:
+                        slots.extend([None] * (current.nlocals - nparams))
+                    pc = 0
+                elif op == RETURN:
+                    current, slots, pc = frames.pop()
+                    code, constants = current.code, current.constants
+                elif op == RETURN_NONE:
+                    if not frames:
+                        break
+                    current, slots, pc = frames.pop()
+                    code, constants = current.code, current.constants
+                    push(None)
+                elif op == TAIL_CALL:
+                    current = functions[arg]
+                    code, constants = current.code, current.constants
+                    nparams = current.nparams
+                    if nparams:
+                        slots = stack[-nparams:]
+                        del stack[-nparams:]
+                    else:
+                        slots = []
+                    if current.nlocals > nparams:
+                        slots.extend([None] * (current.nlocals - nparams))
+                    pc = 0
+                elif op == LE:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = a <= b
+                elif op == GT:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = a > b
+                elif op == GE:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = a >= b
+                elif op == EQ:
+                    b = pop()
+                    stack[-1] = stack[-1] == b
+                elif op == NE:
+                    b = pop()
+                    stack[-1] = stack[-1] != b
+                elif op == LOAD_GLOBAL:
+                    value = globals_[arg]
+                    if value is _UNDEFINED:
+                        raise _error(current, pc, f"variável '{self.module.global_names[arg]}' "
+                                                  f"não declarada")
+                    push(value)
+                elif op == STORE_GLOBAL:
+                    if globals_[arg] is _UNDEFINED:
+                        raise _error(current, pc, f"variável '{self.module.global_names[arg]}' "
+                                                  f"não declarada")
+                    globals_[arg] = pop()
+                elif op == DECLARE_GLOBAL:
+                    globals_[arg] = pop()
+                elif op == POP:
+                    pop()
+                elif op == PRINT:
+                    output(format_value(pop()))
+                elif op == DIV:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = a / b
+                elif op == FLOOR_DIV:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = a // b
+                elif op == POW:
+                    b = pop()
+                    a = stack[-1]
+                    stack[-1] = power(a, b)
+                elif op == NEG:
+                    b = stack[-1]
+                    stack[-1] = -b
+                elif op == POS:
+                    b = stack[-1]
+                    stack[-1] = +b
+                elif op == ERROR:
+                    raise _error(current, pc, constants[arg])
+                else:
+                    raise NocSysRuntimeError(f"opcode desconhecido: {op}")
+        except OPERATOR_ERRORS as e:
+            symbol = OP_SYMBOLS.get(op)
+            if symbol is None:
+                # só os opcodes de operadores são traduzidos (não PRINT, por exemplo)
+                raise
+            line, column = _position(current, pc)
+            token = Token('OPERATOR', symbol, line, column)
+            operands = (b,) if op == NEG or op == POS else (a, b)
+            raise operation_error(token, e, *operands) from None
+        finally:
+            self.instructions = executed
+        return self.globals_dict()
+
+
+def _position(code_object, pc: int):
+    """Linha e coluna da instrução anterior a `pc` (a que está executando)."""
+    index = pc // 2 - 1
+    line = code_object.lines[index]
+    return (line, code_object.columns[index]) if line else (None, None)
+
+
+def _error(code_object, pc: int, message: str) -> NocSysRuntimeError:
+    return NocSysRuntimeError(message, *_position(code_object, pc))
+
+
+def run(module: Module, output=None) -> dict:
+    return VM(module, output).run()
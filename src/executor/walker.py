@@ -0,0 +1,178 @@
+# src/executor/walker.py
+"""
+Interpretador ingênuo: percorre a AST a cada execução.
+
+Cada nó é despachado com uma cadeia de `isinstance`, variáveis ficam numa
+cadeia de ambientes (um dict por bloco, procurado por nome de dentro para
+fora) e `return` é uma exceção. É a referência simples da semântica e a base
+de comparação dos benchmarks do executor de closures.
+
+Escopo: funções são declaradas antes de o programa rodar (podem ser chamadas
+antes da declaração); cada bloco abre um escopo novo; dentro de função são
+visíveis os parâmetros, os blocos que a envolvem e as variáveis globais.
+"""
+
+import sys
+
+from src.parser.ast import (
+    Program, VarDecl, FuncDecl,
+    Block, AssignStmt, IfStmt, WhileStmt,
+    ReturnStmt, PrintStmt, ExprStmt,
+    BinaryExpr, UnaryExpr, LiteralExpr,
+    VarExpr, CallExpr
+)
+from src.lexer.tokens import TokenType
+from .runtime import (
+    NocSysRuntimeError, error_at, format_value, literal_value,
+    BINARY_OPERATORS, UNARY_OPERATORS, OPERATOR_ERRORS, operation_error,
+    RECURSION_LIMIT,
+)
+
+SWAP = int(TokenType.SWAP)
+
+
+class Environment:
+    def __init__(self, parent=None):
+        self.values = {}
+        self.parent = parent
+
+    def find(self, name: str):
+        env = self
+        while env is not None:
+            if name in env.values:
+                return env
+            env = env.parent
+        return None
+
+
+class _Return(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class TreeWalker:
+    def __init__(self, output=None):
+        self.output = output if output is not None else print
+        self.globals = Environment()
+        self.functions = {}
+
+    def run(self, program: Program) -> dict:
+        """Executa o programa; devolve as variáveis globais."""
+        for decl in program.declarations:
+            if isinstance(decl, FuncDecl):
+                name = decl.name.value
+                if name in self.functions:
+                    raise error_at(decl.name, f"função '{name}' já declarada")
+                self.functions[name] = decl
+
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, RECURSION_LIMIT))
+        try:
+            for decl in program.declarations:
+                if not isinstance(decl, FuncDecl):
+                    self.execute(decl, self.globals)
+        except _Return:
+            raise NocSysRuntimeError("'return' fora de função")
+        except RecursionError:
+            raise NocSysRuntimeError("limite de recursão excedido")
+        finally:
+            sys.setrecursionlimit(limit)
+        return self.globals.values
+
+    # ==========================
+    # Statements
+    # ==========================
+    def execute(self, node, env: Environment):
+        if isinstance(node, VarDecl):
+            value = None if node.init_expr is None else self.evaluate(node.init_expr, env)
+            env.values[node.name.value] = value
+        elif isinstance(node, AssignStmt):
+            self._assign(node.target.name, self.evaluate(node.value, env), env)
+        elif isinstance(node, PrintStmt):
+            self.output(format_value(self.evaluate(node.value, env)))
+        elif isinstance(node, ExprStmt):
+            expr = node.expr
+            if isinstance(expr, BinaryExpr) and expr.op.kind == SWAP:
+                self._swap(expr, env)
+            else:
+                self.evaluate(expr, env)
+        elif isinstance(node, IfStmt):
+            if self.evaluate(node.condition, env):
+                self.execute(node.then_branch, env)
+            elif node.else_branch is not None:
+                self.execute(node.else_branch, env)
+        elif isinstance(node, WhileStmt):
+            while self.evaluate(node.condition, env):
+                self.execute(node.body, env)
+        elif isinstance(node, Block):
+            inner = Environment(env)
+            for statement in node.statements:
+                self.execute(statement, inner)
+        elif isinstance(node, ReturnStmt):
+            raise _Return(None if node.value is None else self.evaluate(node.value, env))
+        elif isinstance(node, FuncDecl):
+            raise error_at(node.name, "funções só podem ser declaradas no topo do programa")
+        else:
+            raise NocSysRuntimeError(f"nó desconhecido: {type(node).__name__}")
+
+    def _assign(self, name_tok, value, env: Environment):
+        target = env.find(name_tok.value)
+        if target is None:
+            raise error_at(name_tok, f"variável '{name_tok.value}' não declarada")
+        target.values[name_tok.value] = value
+
+    def _swap(self, expr: BinaryExpr, env: Environment):
+        if not (isinstance(expr.left, VarExpr) and isinstance(expr.right, VarExpr)):
+            raise error_at(expr.op, "'<->' só troca duas variáveis")
+        left = self.evaluate(expr.left, env)
+        right = self.evaluate(expr.right, env)
+        self._assign(expr.left.name, right, env)
+        self._assign(expr.right.name, left, env)
+
+    # ==========================
+    # Expressões
+    # ==========================
+    def evaluate(self, node, env: Environment):
+        if isinstance(node, LiteralExpr):
+            return literal_value(node.value)
+        if isinstance(node, VarExpr):
+            name = node.name.value
+            target = env.find(name)
+            if target is None:
+                raise error_at(node.name, f"variável '{name}' não declarada")
+            return target.values[name]
+        if isinstance(node, BinaryExpr):
+            if node.op.kind == SWAP:
+                raise error_at(node.op, "'<->' é uma instrução, não uma expressão")
+            left = self.evaluate(node.left, env)
+            right = self.evaluate(node.right, env)
+            try:
+                return BINARY_OPERATORS[node.op.kind](left, right)
+            except OPERATOR_ERRORS as e:
+                raise operation_error(node.op, e, left, right) from None
+        if isinstance(node, UnaryExpr):
+            right = self.evaluate(node.right, env)
+            try:
+                return UNARY_OPERATORS[node.op.kind](right)
+            except OPERATOR_ERRORS as e:
+                raise operation_error(node.op, e, right) from None
+        if isinstance(node, CallExpr):
+            return self._call(node, env)
+        raise NocSysRuntimeError(f"expressão desconhecida: {type(node).__name__}")
+
+    def _call(self, node: CallExpr, env: Environment):
+        name = node.callee.value
+        function = self.functions.get(name)
+        if function is None:
+            raise error_at(node.callee, f"função '{name}' não declarada")
+        if len(node.args) != len(function.params):
+            raise error_at(node.callee, f"função '{name}' espera {len(function.params)} "
+                                        f"argumento(s), recebeu {len(node.args)}")
+        frame = Environment(self.globals)
+        for param, arg in zip(function.params, node.args):
+            frame.values[param.name.value] = self.evaluate(arg, env)
+        try:
+            self.execute(function.body, frame)
+        except _Return as signal:
+            return signal.value
+        return None
@@ -3,8 +3,16 @@ Pacote do analisador léxico (lexer) para a linguagem NocSysPy.
 
 Este pacote contém:
 - dfa.py: Definição dos AFDs específicos (identificadores, números, operadores, strings).
-- afn_to_afd.py: Implementação genérica do algoritmo de construção de subconjuntos (AFN -> AFD).
+- afn_to_afd.py: Implementação genérica do algoritmo de construção de subconjuntos (AFN -> AFD),
+  minimização de Hopcroft e conversão para a classe DFA.
+- scanner.py: Autômato produto que combina os AFDs numa única passada.
+- regex.py: Front end de expressões regulares (construção de Thompson -> AFN).
+- spec.py: Tabela declarativa de tokens, compilada uma vez num único AFD.
+- cache.py: Cache em disco das tabelas compiladas (marshal), chaveado pela especificação.
 - lexer.py: Implementação do analisador léxico baseado em AFDs.
+- buffer.py: TokenBuffer, tokens em colunas paralelas (array) com lexemas sob demanda.
+- stream.py: Lexer em streaming sobre arquivos binários/mmap, lidos em blocos.
+- parallel.py: Lexer paralelo, com o source cortado em quebras de linha fora de strings.
 """
 
 from .lexer import Lexer, Token, KEYWORDS
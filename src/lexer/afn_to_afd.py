@@ -2,10 +2,13 @@
 
 from collections import defaultdict, deque
 
+from .dfa import DFA
+
 EPSILON = None  # usamos None para representar transições-ε
 
 class NFA:
-    def __init__(self, states, alphabet, transitions, start_state, accept_states):
+    def __init__(self, states, alphabet, transitions, start_state, accept_states,
+                 accept_tokens=None):
         """
         states: conjunto ou lista de estados (strings ou ints)
         alphabet: conjunto de símbolos (chars) EXCETO epsilon
@@ -13,12 +16,23 @@ class NFA:
                      use symbol = EPSILON para transições-ε
         start_state: estado inicial
         accept_states: conjunto de estados de aceitação
+        accept_tokens: dict opcional {estado_de_aceitação: token_type}; a ordem
+                       de inserção define a prioridade quando um estado do AFD
+                       contém mais de um estado de aceitação
         """
         self.states = set(states)
         self.alphabet = set(alphabet)
         self.transitions = transitions
         self.start_state = start_state
         self.accept_states = set(accept_states)
+        self.accept_tokens = dict(accept_tokens or {})
+
+    def token_for(self, state_set):
+        """Token de maior prioridade entre os estados de aceitação do conjunto."""
+        for state, token_type in self.accept_tokens.items():
+            if state in state_set:
+                return token_type
+        return None
 
     def epsilon_closure(self, state_set):
         """Retorna o fecho-ε de um conjunto de estados."""
@@ -39,10 +53,33 @@ class DFAFromNFA:
     Representação simples do AFD gerado a partir de um AFN.
     Transições são: dict {state_name: {symbol: next_state_name}}
     """
-    def __init__(self, start_state, accept_states, transitions):
+    def __init__(self, start_state, accept_states, transitions, accept_tokens=None):
         self.start_state = start_state
         self.accept_states = set(accept_states)
         self.transitions = transitions  # {dfa_state: {symbol: dfa_state}}
+        self.accept_tokens = dict(accept_tokens or {})  # {dfa_state: token_type}
+
+    @property
+    def states(self):
+        """Todos os estados que aparecem no AFD (inicial, origens e destinos)."""
+        states = {self.start_state} | set(self.accept_states) | set(self.transitions)
+        for edges in self.transitions.values():
+            states.update(edges.values())
+        return states
+
+    def to_dfa(self, name="FromNFA", default_token='ACCEPT') -> DFA:
+        """
+        Converte para a classe `DFA` executável pelo Lexer.
+        Símbolos viram condições literais (ou predicados, se forem funções).
+        """
+        dfa = DFA(name)
+        dfa.start_state = self.start_state
+        for state, edges in self.transitions.items():
+            for symbol, target in edges.items():
+                dfa.add_transition(state, symbol, target)
+        for state in self.accept_states:
+            dfa.set_accepting(state, self.accept_tokens.get(state, default_token))
+        return dfa
 
 
 def nfa_to_dfa(nfa: NFA) -> DFAFromNFA:
@@ -68,9 +105,14 @@ def nfa_to_dfa(nfa: NFA) -> DFAFromNFA:
 
     start_name = get_state_name(start_closure)
 
+    dfa_accept_tokens = {}
+
     # Se o conjunto inicial contém algum estado de aceitação do NFA, é aceitação no DFA também
     if nfa.accept_states & set(start_closure):
         dfa_accept_states.add(start_name)
+        token_type = nfa.token_for(start_closure)
+        if token_type is not None:
+            dfa_accept_tokens[start_name] = token_type
 
     # 2. Processar estados com BFS
     queue = deque([start_name])
@@ -102,7 +144,261 @@ def nfa_to_dfa(nfa: NFA) -> DFAFromNFA:
                 # Verifica se algum estado NFA do conjunto é de aceitação
                 if nfa.accept_states & next_nfa_states:
                     dfa_accept_states.add(next_dfa_state)
+                    token_type = nfa.token_for(next_nfa_states)
+                    if token_type is not None:
+                        dfa_accept_tokens[next_dfa_state] = token_type
 
     return DFAFromNFA(start_state=start_name,
                       accept_states=dfa_accept_states,
-                      transitions=dict(dfa_transitions))
\ No newline at end of file
+                      transitions=dict(dfa_transitions),
+                      accept_tokens=dfa_accept_tokens)
+
+
+def _iter_bits(mask):
+    """Índices dos bits ligados de um inteiro."""
+    bits = bin(mask)[:1:-1]  # bit 0 primeiro
+    i = bits.find('1')
+    while i != -1:
+        yield i
+        i = bits.find('1', i + 1)
+
+
+def nfa_to_dfa_bitset(nfa: NFA) -> DFAFromNFA:
+    """
+    Construção de subconjuntos com conjuntos de estados empacotados em inteiros.
+
+    - Os estados do AFN são numerados e cada conjunto vira uma máscara de bits.
+    - O fecho-ε de cada estado é calculado uma única vez e reaproveitado.
+    - Um índice de movimentos por estado ({símbolo: máscara do fecho dos destinos})
+      evita reconsultar `nfa.transitions` e percorrer símbolos sem transição.
+
+    Reconhece a mesma linguagem (e os mesmos tokens) que `nfa_to_dfa`.
+    """
+    order = list(nfa.states | {nfa.start_state} | nfa.accept_states)
+    index = {state: i for i, state in enumerate(order)}
+
+    epsilon_edges = [()] * len(order)
+    symbol_edges = [[] for _ in order]
+    for (state, symbol), targets in nfa.transitions.items():
+        i = index[state]
+        if symbol is EPSILON:
+            epsilon_edges[i] = tuple(index[t] for t in targets)
+        else:
+            symbol_edges[i].append((symbol, [index[t] for t in targets]))
+
+    # Fecho-ε por estado, calculado na primeira vez que é pedido e memorizado:
+    # ao alcançar um estado já resolvido, incorpora o fecho dele sem expandi-lo.
+    closures = [None] * len(order)
+
+    def closure(i):
+        mask = closures[i]
+        if mask is not None:
+            return mask
+        mask = 1 << i
+        stack = [i]
+        while stack:
+            for nxt in epsilon_edges[stack.pop()]:
+                bit = 1 << nxt
+                if mask & bit:
+                    continue
+                if closures[nxt] is not None:
+                    mask |= closures[nxt]
+                else:
+                    mask |= bit
+                    stack.append(nxt)
+        closures[i] = mask
+        return mask
+
+    # Índice de movimentos: estado -> [(símbolo, máscara do fecho dos destinos)]
+    moves = []
+    movers = 0  # estados que têm alguma transição por símbolo
+    for i, edges in enumerate(symbol_edges):
+        merged = {}
+        for symbol, targets in edges:
+            acc = merged.get(symbol, 0)
+            for t in targets:
+                acc |= closure(t)
+            merged[symbol] = acc
+        moves.append(list(merged.items()))
+        if merged:
+            movers |= 1 << i
+
+    accept_mask = 0
+    for state in nfa.accept_states:
+        accept_mask |= 1 << index[state]
+
+    # Estado do AFN -> (prioridade, token); a máscara filtra os candidatos
+    token_mask = 0
+    token_of = {}
+    for priority, (state, token_type) in enumerate(nfa.accept_tokens.items()):
+        if state in index:
+            token_mask |= 1 << index[state]
+            token_of[index[state]] = (priority, token_type)
+
+    names = {}
+    transitions = {}
+    accept_states = set()
+    accept_tokens = {}
+
+    def get_state_name(mask):
+        name = names.get(mask)
+        if name is None:
+            name = f"S{len(names)}"
+            names[mask] = name
+            queue.append(mask)
+            if mask & accept_mask:
+                accept_states.add(name)
+                candidates = [token_of[i] for i in _iter_bits(mask & token_mask)]
+                if candidates:
+                    accept_tokens[name] = min(candidates)[1]
+        return name
+
+    queue = deque()
+    start_name = get_state_name(closure(index[nfa.start_state]))
+
+    while queue:
+        mask = queue.popleft()
+        successors = {}
+        for i in _iter_bits(mask & movers):
+            for symbol, target_mask in moves[i]:
+                successors[symbol] = successors.get(symbol, 0) | target_mask
+
+        if successors:
+            name = names[mask]
+            edges = {}
+            for symbol in sorted(successors, key=repr):
+                edges[symbol] = get_state_name(successors[symbol])
+            transitions[name] = edges
+
+    return DFAFromNFA(start_state=start_name,
+                      accept_states=accept_states,
+                      transitions=transitions,
+                      accept_tokens=accept_tokens)
+
+
+def minimize_dfa(dfa: DFAFromNFA) -> DFAFromNFA:
+    """
+    Minimiza o AFD pelo algoritmo de Hopcroft (refinamento de partições).
+
+    A partição inicial separa os estados não-finais e agrupa os finais por
+    token_type, de modo que estados que reconhecem tokens diferentes nunca
+    são fundidos. Estados inalcançáveis são descartados e o estado morto
+    implícito não aparece no resultado. Os estados minimizados se chamam
+    M0, M1, ... na ordem de uma BFS a partir do inicial.
+    """
+    # Estados alcançáveis, numerados; o índice `dead` completa as transições
+    order = [dfa.start_state]
+    index = {dfa.start_state: 0}
+    for state in order:
+        for target in dfa.transitions.get(state, {}).values():
+            if target not in index:
+                index[target] = len(order)
+                order.append(target)
+    dead = len(order)
+    alphabet = sorted({symbol for state in order for symbol in dfa.transitions.get(state, {})},
+                      key=repr)
+
+    # inverse[símbolo][destino] = origens
+    inverse = {symbol: defaultdict(list) for symbol in alphabet}
+    for state in order:
+        edges = dfa.transitions.get(state, {})
+        for symbol in alphabet:
+            target = edges.get(symbol)
+            inverse[symbol][dead if target is None else index[target]].append(index[state])
+    for symbol in alphabet:
+        inverse[symbol][dead].append(dead)
+
+    # Partição inicial: não-finais (com o morto) e finais agrupados por token
+    groups = defaultdict(set)
+    for state in order:
+        if state in dfa.accept_states:
+            groups[('accept', dfa.accept_tokens.get(state))].add(index[state])
+        else:
+            groups[('reject',)].add(index[state])
+    groups[('reject',)].add(dead)
+
+    blocks = [block for block in groups.values() if block]
+    block_of = {}
+    for block_id, block in enumerate(blocks):
+        for state in block:
+            block_of[state] = block_id
+
+    pending = deque(range(len(blocks)))
+    in_pending = set(pending)
+
+    while pending:
+        splitter_id = pending.popleft()
+        in_pending.discard(splitter_id)
+        splitter = set(blocks[splitter_id])
+
+        for symbol in alphabet:
+            # Estados que levam a algum estado do splitter lendo `symbol`
+            predecessors = defaultdict(set)
+            for target in splitter:
+                for source in inverse[symbol].get(target, ()):
+                    predecessors[block_of[source]].add(source)
+
+            for block_id, hit in predecessors.items():
+                block = blocks[block_id]
+                if len(hit) == len(block):
+                    continue
+                # Divide o bloco: `hit` fica com um novo id
+                block -= hit
+                new_id = len(blocks)
+                blocks.append(hit)
+                for state in hit:
+                    block_of[state] = new_id
+                if block_id in in_pending:
+                    pending.append(new_id)
+                    in_pending.add(new_id)
+                else:
+                    smaller = new_id if len(hit) <= len(block) else block_id
+                    pending.append(smaller)
+                    in_pending.add(smaller)
+
+    # Reconstrói o AFD, nomeando os blocos por BFS a partir do inicial
+    names = {}
+    queue = deque([block_of[0]])
+    names[block_of[0]] = "M0"
+    transitions = {}
+    accept_states = set()
+    accept_tokens = {}
+
+    while queue:
+        block_id = queue.popleft()
+        name = names[block_id]
+        representative = order[next(iter(blocks[block_id]))]
+
+        if representative in dfa.accept_states:
+            accept_states.add(name)
+            if representative in dfa.accept_tokens:
+                accept_tokens[name] = dfa.accept_tokens[representative]
+
+        edges = {}
+        for symbol, target in dfa.transitions.get(representative, {}).items():
+            target_block = block_of[index[target]]
+            if target_block == block_of[dead]:
+                continue  # estado equivalente ao morto: some do AFD mínimo
+            if target_block not in names:
+                names[target_block] = f"M{len(names)}"
+                queue.append(target_block)
+            edges[symbol] = names[target_block]
+        if edges:
+            transitions[name] = edges
+
+    return DFAFromNFA(start_state="M0",
+                      accept_states=accept_states,
+                      transitions=transitions,
+                      accept_tokens=accept_tokens)
+
+
+def minimization_report(dfa: DFAFromNFA, minimized: DFAFromNFA = None) -> dict:
+    """
+    Relatório de estados antes e depois da minimização.
+    Retorna {'before': n, 'after': m, 'removed': n - m}.
+    """
+    if minimized is None:
+        minimized = minimize_dfa(dfa)
+    before = len(dfa.states)
+    after = len(minimized.states)
+    return {'before': before, 'after': after, 'removed': before - after}
\ No newline at end of file
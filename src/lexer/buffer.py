@@ -0,0 +1,295 @@
+# src/lexer/buffer.py
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+
+from .lexer import Checkpoint, Lexer, Token, token_kind
+from .tokens import TokenType
+
+# Tipos cujos lexemas são internados: nomes repetidos viram o mesmo objeto str
+INTERNED_TYPES = frozenset({'IDENTIFIER', 'KEYWORD'})
+
+# Um checkpoint do lexer a cada tantos tokens
+CHECKPOINT_INTERVAL = 16
+
+
+@dataclass(slots=True)
+class TextEdit:
+    """Troca source[start:end] por `text` (posições em caracteres no source antigo)."""
+    start: int
+    end: int
+    text: str
+
+    def apply(self, source: str) -> str:
+        return source[:self.start] + self.text + source[self.end:]
+
+
+@dataclass(slots=True)
+class Patch:
+    """Resultado de `TokenBuffer.relex`: tokens [first, old_end) viraram [first, new_end)."""
+    first: int
+    old_end: int
+    new_end: int
+
+    @property
+    def relexed(self) -> int:
+        return self.new_end - self.first
+
+
+class TokenBuffer:
+    """
+    Lista de tokens em colunas paralelas (struct-of-arrays).
+
+    Em vez de um objeto `Token` (com __dict__ e cópia do lexema) por token,
+    guarda arrays paralelos: código do tipo, TokenType, início no source,
+    comprimento, linha e coluna. O lexema só é recortado do source quando
+    acessado, e nomes de identificadores/palavras-chave são internados com
+    `sys.intern`.
+
+    `buffer[i]` materializa o i-ésimo token como `Token`; `reader()` devolve
+    uma função no formato de `Lexer.next_token`, usada pelo Parser.
+
+    `from_source` guarda também os checkpoints do lexer; `relex(edit)` usa o
+    checkpoint seguro mais próximo antes da edição para reler só os tokens
+    afetados e remendar as colunas no lugar.
+    """
+    def __init__(self, source: str):
+        self.source = source
+        self.type_names = []   # código -> nome do tipo ('IDENTIFIER', ...)
+        self._type_codes = {}  # nome do tipo -> código
+        self.types = array('B')
+        self.kinds = array('B')
+        self.starts = array('q')
+        self.lengths = array('I')
+        self.lines = array('I')
+        self.columns = array('I')
+        # Checkpoints do lexer: índice do token e `scan_limit` (posição, linha e
+        # coluna saem das próprias colunas do buffer)
+        self.checkpoint_tokens = array('I')
+        self.checkpoint_limits = array('q')
+        self.checkpoint_interval = CHECKPOINT_INTERVAL
+
+    @classmethod
+    def from_source(cls, source: str, lexer: Lexer = None,
+                    checkpoint_interval: int = CHECKPOINT_INTERVAL) -> 'TokenBuffer':
+        """Tokeniza `source` inteiro direto para as colunas (sem criar objetos Token)."""
+        buffer = cls(source)
+        if lexer is None:
+            lexer = Lexer(source, checkpoint_interval=checkpoint_interval)
+        buffer.checkpoint_interval = lexer.checkpoint_interval or checkpoint_interval
+        append = buffer.append
+        next_span = lexer.next_span
+        while True:
+            token_type, start, end, line, column = next_span()
+            append(token_type, start, end - start, line, column)
+            if token_type == 'EOF':
+                checkpoints = lexer.checkpoints or ()
+                buffer.checkpoint_tokens = array('I', (cp.token_index for cp in checkpoints))
+                buffer.checkpoint_limits = array('q', (cp.scan_limit for cp in checkpoints))
+                return buffer
+
+    def _type_code(self, token_type: str) -> int:
+        code = self._type_codes.get(token_type)
+        if code is None:
+            code = len(self.type_names)
+            self._type_codes[token_type] = code
+            self.type_names.append(token_type)
+        return code
+
+    def append(self, token_type: str, start: int, length: int, line: int, column: int):
+        self.types.append(self._type_code(token_type))
+        if token_type == 'EOF':
+            self.kinds.append(TokenType.EOF)
+        else:
+            self.kinds.append(token_kind(token_type, self.source[start:start + length]))
+        self.starts.append(start)
+        self.lengths.append(length)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def __len__(self):
+        return len(self.types)
+
+    def type(self, index: int) -> str:
+        return self.type_names[self.types[index]]
+
+    def value(self, index: int) -> str:
+        """Lexema do token, recortado do source sob demanda."""
+        token_type = self.type_names[self.types[index]]
+        if token_type == 'EOF':
+            return 'EOF'
+        start = self.starts[index]
+        lexeme = self.source[start:start + self.lengths[index]]
+        if token_type in INTERNED_TYPES:
+            lexeme = sys.intern(lexeme)
+        return lexeme
+
+    def __getitem__(self, index: int) -> Token:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice de token fora do buffer")
+        return Token(self.type(index), self.value(index), self.lines[index],
+                     self.columns[index], TokenType(self.kinds[index]))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def reader(self):
+        """
+        Função sem argumentos que devolve o próximo Token a cada chamada (como
+        `Lexer.next_token`); depois do último token continua devolvendo EOF.
+        """
+        last = len(self) - 1
+        position = 0
+        source = self.source
+        type_names = self.type_names
+        types, kinds = self.types, self.kinds
+        starts, lengths = self.starts, self.lengths
+        lines, columns = self.lines, self.columns
+        intern = sys.intern
+
+        def next_token() -> Token:
+            nonlocal position
+            index = position
+            if index < last:
+                position = index + 1
+            token_type = type_names[types[index]]
+            if token_type == 'EOF':
+                value = 'EOF'
+            else:
+                start = starts[index]
+                value = source[start:start + lengths[index]]
+                if token_type in INTERNED_TYPES:
+                    value = intern(value)
+            return Token(token_type, value, lines[index], columns[index], kinds[index])
+
+        return next_token
+
+    # ==========================
+    # Relex incremental
+    # ==========================
+    @property
+    def checkpoints(self):
+        """Checkpoints como objetos `Checkpoint` (para inspeção)."""
+        return [Checkpoint(self.starts[i], self.lines[i], self.columns[i], i, limit)
+                for i, limit in zip(self.checkpoint_tokens, self.checkpoint_limits)]
+
+    def _restart_point(self, offset: int) -> Checkpoint:
+        """
+        Último checkpoint em ou antes de `offset` cujos tokens anteriores não
+        foram lidos além de `offset` (o início do arquivo, se não houver).
+        """
+        starts = self.starts
+        tokens, limits = self.checkpoint_tokens, self.checkpoint_limits
+        index = bisect_right(tokens, offset, key=starts.__getitem__)
+        while index > 0:
+            index -= 1
+            if limits[index] <= offset:
+                token = tokens[index]
+                return Checkpoint(starts[token], self.lines[token], self.columns[token],
+                                  token, limits[index])
+        return Checkpoint(0, 1, 1, 0)
+
+    def relex(self, edit: TextEdit) -> Patch:
+        """
+        Aplica `edit` ao source e relê só os tokens afetados: o lexer recomeça
+        no checkpoint seguro anterior à edição e para quando o próximo token
+        novo começa onde começava (deslocado) um token antigo depois da edição.
+        Daí em diante os tokens antigos são mantidos, com início/linha/coluna
+        deslocados. O buffer é alterado no lugar.
+        """
+        new_source = edit.apply(self.source)
+        delta = len(edit.text) - (edit.end - edit.start)
+        restart = self._restart_point(edit.start)
+
+        lexer = Lexer(new_source, checkpoint_interval=self.checkpoint_interval)
+        lexer.restore(restart)
+
+        starts = self.starts
+        first = restart.token_index
+        # Tokens antigos que começam no fim da edição ou depois podem ser reaproveitados
+        after = bisect_left(starts, edit.end, lo=first)
+        edit_end = edit.start + len(edit.text)
+
+        spans = []
+        while True:
+            token_type, start, end, line, column = lexer.next_span()
+            if start >= edit_end:
+                resync = bisect_left(starts, start - delta, lo=after)
+                if resync < len(starts) and starts[resync] == start - delta:
+                    break
+            spans.append((token_type, start, end, line, column))
+
+        # `line`/`column` são as do primeiro token reaproveitado, já no texto novo
+        old_line = self.lines[resync]
+        line_delta = line - old_line
+        column_delta = column - self.columns[resync]
+        tail = first + len(spans)
+
+        self._replace_tokens(first, resync, spans, new_source)
+        self._shift_tail(tail, delta, old_line, line_delta, column_delta)
+        self._patch_checkpoints(first, resync, tail, lexer, delta)
+        self.source = new_source
+        return Patch(first, resync, tail)
+
+    def _patch_checkpoints(self, first: int, old_end: int, new_end: int, lexer: Lexer,
+                           delta: int):
+        tokens, limits = self.checkpoint_tokens, self.checkpoint_limits
+        keep = bisect_left(tokens, first)
+        reuse = bisect_left(tokens, old_end)
+        count_delta = new_end - old_end
+        relexed = [cp for cp in lexer.checkpoints if cp.token_index < new_end]
+        # Os tokens relidos podem ter sido lidos além do início dos mantidos
+        scan_limit = lexer._scan_limit
+        self.checkpoint_tokens = (
+            tokens[:keep]
+            + array('I', (cp.token_index for cp in relexed))
+            + array('I', map(count_delta.__add__, tokens[reuse:]))
+        )
+        shifted = array('q', map(delta.__add__, limits[reuse:]))
+        index = 0
+        while index < len(shifted) and shifted[index] < scan_limit:
+            shifted[index] = scan_limit
+            index += 1
+        self.checkpoint_limits = (
+            limits[:keep] + array('q', (cp.scan_limit for cp in relexed)) + shifted
+        )
+
+    def _replace_tokens(self, first: int, old_end: int, spans, source: str):
+        """Troca os tokens [first, old_end) pelos spans novos (tipo, início, fim, linha, coluna)."""
+        types, kinds = array('B'), array('B')
+        starts, lengths = array('q'), array('I')
+        lines, columns = array('I'), array('I')
+        for token_type, start, end, line, column in spans:
+            types.append(self._type_code(token_type))
+            kinds.append(TokenType.EOF if token_type == 'EOF'
+                         else token_kind(token_type, source[start:end]))
+            starts.append(start)
+            lengths.append(end - start)
+            lines.append(line)
+            columns.append(column)
+        self.types[first:old_end] = types
+        self.kinds[first:old_end] = kinds
+        self.starts[first:old_end] = starts
+        self.lengths[first:old_end] = lengths
+        self.lines[first:old_end] = lines
+        self.columns[first:old_end] = columns
+
+    def _shift_tail(self, first: int, delta: int, old_line: int, line_delta: int,
+                    column_delta: int):
+        """Desloca os tokens mantidos a partir de `first` (um laço em C por coluna)."""
+        if column_delta:
+            # só os tokens que estavam na mesma linha do fim da edição mudam de coluna
+            lines, columns = self.lines, self.columns
+            index = first
+            while index < len(lines) and lines[index] == old_line:
+                columns[index] += column_delta
+                index += 1
+        if delta:
+            self.starts[first:] = array('q', map(delta.__add__, self.starts[first:]))
+        if line_delta:
+            self.lines[first:] = array('I', map(line_delta.__add__, self.lines[first:]))
@@ -0,0 +1,155 @@
+# src/lexer/cache.py
+"""
+Cache em disco das tabelas compiladas do lexer.
+
+Compilar a especificação de tokens (regex -> AFN -> AFD mínimo -> tabela)
+custa mais de uma dezena de milissegundos, o que pesa em processos curtos.
+As tabelas de uma `CompiledDFA` são gravadas com marshal num arquivo cujo
+nome é o hash da especificação; na inicialização seguinte o arquivo é lido
+de uma vez só.
+
+Formato do arquivo: MAGIC + crc32(corpo) + corpo (marshal). A chave inclui as
+regras, a versão do formato e o tamanho/mtime dos módulos que geram as
+tabelas, então editar a especificação ou o gerador invalida o cache; o corpo
+guarda as regras completas para descartar colisões da chave. Arquivos
+corrompidos ou de outra versão são descartados e reconstruídos.
+
+Variáveis de ambiente:
+    NOCSYS_CACHE_DIR   diretório do cache (padrão: ~/.cache/nocsyspy)
+    NOCSYS_NO_CACHE=1  desliga o cache em disco
+"""
+
+import marshal
+import os
+import zlib
+
+from .dfa import CompiledDFA
+from .regex import PREDICATES
+
+FORMAT_VERSION = 1
+MAGIC = b'NOCSYSLX'
+
+# Módulos cujo código define o conteúdo das tabelas
+_GENERATOR_MODULES = ('afn_to_afd.py', 'dfa.py', 'regex.py', 'spec.py', 'cache.py')
+
+_PREDICATE_NAMES = {function: name for name, function in PREDICATES.items()}
+
+
+def cache_dir() -> str:
+    return os.environ.get('NOCSYS_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'nocsyspy'
+    )
+
+
+def cache_enabled() -> bool:
+    return os.environ.get('NOCSYS_NO_CACHE', '') not in ('1', 'true', 'yes')
+
+
+def spec_key(rules) -> str:
+    """Chave da especificação + versão do formato + estado dos módulos geradores."""
+    parts = [repr((FORMAT_VERSION, tuple(rules)))]
+    here = os.path.dirname(os.path.abspath(__file__))
+    for module in _GENERATOR_MODULES:
+        try:
+            st = os.stat(os.path.join(here, module))
+            parts.append(f"{module}:{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{module}:?")
+    data = '\n'.join(parts).encode('utf-8')
+    # Dois CRCs independentes (dados e dados invertidos) formam uma chave de 64 bits
+    return f"{zlib.crc32(data):08x}{zlib.crc32(data[::-1]):08x}"
+
+
+def cache_path(key: str) -> str:
+    return os.path.join(cache_dir(), f"lexer-{key}.bin")
+
+
+def _encode_condition(condition):
+    name = _PREDICATE_NAMES.get(condition)
+    if name is None:
+        raise ValueError(f"Condição {condition!r} não pode ser gravada no cache")
+    return ('predicate', name)
+
+
+def _decode_condition(encoded):
+    kind, name = encoded
+    if kind != 'predicate' or name not in PREDICATES:
+        raise ValueError(f"Condição desconhecida no cache: {encoded!r}")
+    return PREDICATES[name]
+
+
+def load_tables(key: str, rules=None):
+    """Lê a CompiledDFA do cache; retorna None se não existir, for antiga ou estiver corrompida."""
+    try:
+        with open(cache_path(key), 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    header = len(MAGIC) + 4
+    if len(data) < header or not data.startswith(MAGIC):
+        return None
+    body = data[header:]
+    if zlib.crc32(body).to_bytes(4, 'big') != data[len(MAGIC):header]:
+        return None
+
+    try:
+        payload = marshal.loads(body)
+        if payload.get('version') != FORMAT_VERSION or payload.get('key') != key:
+            return None
+        if rules is not None and payload.get('rules') != _rules_repr(rules):
+            return None
+        return CompiledDFA.from_tables(payload['tables'], _decode_condition)
+    except (EOFError, ValueError, TypeError, KeyError, AttributeError, IndexError):
+        return None
+
+
+def _rules_repr(rules) -> str:
+    return repr(tuple(rules))
+
+
+def save_tables(key: str, compiled: CompiledDFA, rules=None) -> bool:
+    """Grava as tabelas de forma atômica (arquivo temporário + rename). Falhas são ignoradas."""
+    try:
+        payload = {
+            'version': FORMAT_VERSION,
+            'key': key,
+            'rules': _rules_repr(rules) if rules is not None else None,
+            'tables': compiled.export_tables(_encode_condition),
+        }
+        body = marshal.dumps(payload)
+    except ValueError:
+        return False
+
+    import tempfile  # só necessário ao gravar; mantém a inicialização com cache leve
+
+    directory = cache_dir()
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix='.lexer-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(MAGIC + zlib.crc32(body).to_bytes(4, 'big') + body)
+            os.replace(tmp, cache_path(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        return False
+    return True
+
+
+def load_or_build(rules, build) -> CompiledDFA:
+    """
+    Retorna as tabelas de `rules` do cache em disco, ou chama `build()` para
+    compilá-las e grava o resultado para as próximas execuções.
+    """
+    if not cache_enabled():
+        return build()
+
+    key = spec_key(rules)
+    compiled = load_tables(key, rules)
+    if compiled is None:
+        compiled = build()
+        save_tables(key, compiled, rules)
+    return compiled
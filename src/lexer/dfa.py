@@ -1,5 +1,214 @@
 # src/lexer/dfa.py
 
+from array import array
+
+DEAD = -1          # estado morto nas tabelas compiladas
+ASCII_LIMIT = 128  # caracteres abaixo deste código usam a tabela rápida
+
+
+class CompiledDFA:
+    """
+    Forma tabular de um autômato: mapa caractere -> classe e tabela densa estado x classe.
+
+    Dois caracteres caem na mesma classe quando todas as condições de transição
+    (literais e funções como is_alpha) dão o mesmo resultado para ambos; assim a
+    transição depende só da classe e cada passo vira duas indexações.
+    Caracteres ASCII são classificados de antemão em `ascii_classes` (bytes);
+    os demais são classificados na primeira vez que aparecem e memorizados.
+
+    start_state: estado inicial (qualquer valor hashable)
+    conditions: todas as condições usadas pelas transições
+    move: função (estado, char) -> próximo estado ou None
+    accepting: função estado -> token_type ou None
+    """
+    def __init__(self, start_state, conditions, move, accepting):
+        self._conditions = list(conditions)
+        self._move = move
+        self._accepting_of = accepting
+
+        self.states = []      # id -> estado original
+        self._ids = {}        # estado original -> id
+        self.accepting = []   # id -> token_type (ou None)
+        self.table = []       # id -> array('h') indexado pela classe
+        self._pending = []    # estados com linha incompleta
+
+        self._classes = {}          # assinatura -> classe
+        self._representatives = []  # classe -> caractere representante
+        self._non_ascii = {}        # char não-ASCII -> classe
+
+        self.ascii_classes = bytes(self._class_for(chr(code)) for code in range(ASCII_LIMIT))
+        self.start = self._state_id(start_state)
+        self._complete()
+
+    @property
+    def class_count(self):
+        return len(self._representatives)
+
+    def _signature(self, char):
+        return tuple(
+            bool(condition(char)) if callable(condition) else condition == char
+            for condition in self._conditions
+        )
+
+    def _class_for(self, char):
+        signature = self._signature(char)
+        cls = self._classes.get(signature)
+        if cls is None:
+            if self._move is None:
+                raise LookupError(
+                    f"Tabela carregada não conhece a classe do caractere {char!r}"
+                )
+            cls = len(self._representatives)
+            self._classes[signature] = cls
+            self._representatives.append(char)
+            # Nova coluna: todas as linhas precisam ser estendidas
+            self._pending.extend(range(len(self.states)))
+        return cls
+
+    def _state_id(self, state):
+        state_id = self._ids.get(state)
+        if state_id is None:
+            state_id = len(self.states)
+            self._ids[state] = state_id
+            self.states.append(state)
+            self.accepting.append(self._accepting_of(state))
+            self.table.append(array('h'))
+            self._pending.append(state_id)
+        return state_id
+
+    def _complete(self):
+        """Preenche as colunas que faltam em cada linha (pode descobrir novos estados)."""
+        while self._pending:
+            state_id = self._pending.pop()
+            row = self.table[state_id]
+            state = self.states[state_id]
+            for cls in range(len(row), len(self._representatives)):
+                target = self._move(state, self._representatives[cls])
+                row.append(DEAD if target is None else self._state_id(target))
+
+    def class_of(self, char):
+        """Classe de um caractere (fallback lento para não-ASCII, memorizado)."""
+        code = ord(char)
+        if code < ASCII_LIMIT:
+            return self.ascii_classes[code]
+        cls = self._non_ascii.get(char)
+        if cls is None:
+            cls = self._class_for(char)
+            self._non_ascii[char] = cls
+            self._complete()
+        return cls
+
+    def export_tables(self, encode_condition=None):
+        """
+        Exporta as tabelas como tipos simples (bytes, str, int, tuplas e listas),
+        serializáveis com marshal. `encode_condition` converte condições que são
+        funções num valor serializável (por exemplo, o nome da função).
+        """
+        if self._pending:
+            self._complete()
+        encode = encode_condition or (lambda condition: condition)
+        return {
+            'ascii_classes': self.ascii_classes,
+            'class_count': self.class_count,
+            'table': b''.join(row.tobytes() for row in self.table),
+            'accepting': list(self.accepting),
+            'start': self.start,
+            'conditions': [encode(c) if callable(c) else c for c in self._conditions],
+            'classes': [(signature, cls) for signature, cls in self._classes.items()],
+            'representatives': list(self._representatives),
+        }
+
+    @classmethod
+    def from_tables(cls, tables, decode_condition=None):
+        """
+        Reconstrói uma CompiledDFA a partir de `export_tables`. A instância não tem
+        mais a função de transição original: caracteres não-ASCII só podem cair
+        em classes que já existiam quando a tabela foi exportada.
+        """
+        decode = decode_condition or (lambda condition: condition)
+        self = cls.__new__(cls)
+        self._conditions = [c if isinstance(c, str) else decode(c) for c in tables['conditions']]
+        self._move = None
+        self._accepting_of = None
+
+        self.accepting = list(tables['accepting'])
+        self.states = list(range(len(self.accepting)))
+        self._ids = {}
+        self._pending = []
+
+        class_count = tables['class_count']
+        flat = array('h')
+        flat.frombytes(tables['table'])
+        if len(flat) != class_count * len(self.accepting):
+            raise ValueError("Tabela de transições com tamanho inconsistente")
+        self.table = [flat[i:i + class_count] for i in range(0, len(flat), class_count)]
+
+        self._classes = {tuple(signature): c for signature, c in tables['classes']}
+        self._representatives = list(tables['representatives'])
+        self._non_ascii = {}
+        self.ascii_classes = bytes(tables['ascii_classes'])
+        self.start = tables['start']
+        return self
+
+    def advance(self, text, pos=0, state=None):
+        """
+        Laço único de execução da tabela: lê `text` a partir de `pos`, começando
+        em `state` (o inicial, se None). Retorna (estado, token_type, fim, parada):
+        o último aceite visto nesta chamada (None, pos se nenhum) e onde parou.
+        Se o estado devolvido é DEAD, `text[parada]` matou o autômato; senão o
+        texto acabou com ele vivo e a leitura pode continuar com mais texto a
+        partir desse estado (lexer em streaming).
+        """
+        table = self.table
+        accepting = self.accepting
+        ascii_classes = self.ascii_classes
+        if state is None:
+            state = self.start
+        last_type = None
+        last_end = pos
+
+        for i in range(pos, len(text)):
+            code = ord(text[i])
+            if code < ASCII_LIMIT:
+                state = table[state][ascii_classes[code]]
+            else:
+                state = table[state][self.class_of(text[i])]
+            if state == DEAD:
+                return DEAD, last_type, last_end, i
+            token_type = accepting[state]
+            if token_type is not None:
+                last_type = token_type
+                last_end = i + 1
+
+        return state, last_type, last_end, len(text)
+
+    def match(self, text, pos=0):
+        """
+        Executa a tabela sobre `text` a partir do índice `pos`.
+        Retorna (token_type, fim) do match mais longo, ou (None, pos) se falhar.
+        """
+        _, token_type, end, _ = self.advance(text, pos)
+        return token_type, end
+
+    def scan(self, text, pos=0):
+        """
+        Como `match`, mas informa também até onde o texto foi lido: retorna
+        (token_type, fim, lido), onde `lido` é o índice logo após o último
+        caractere examinado (o match mais longo pode olhar além do próprio fim).
+        """
+        state, token_type, end, stop = self.advance(text, pos)
+        return token_type, end, stop + 1 if state == DEAD else stop
+
+    def match_prefix(self, text, pos=0):
+        """
+        Como `match`, mas informa também se o texto acabou com o autômato ainda vivo:
+        retorna (token_type, fim, esgotou). Quando `esgotou` é True, mais texto
+        poderia estender o match.
+        """
+        state, token_type, end, _ = self.advance(text, pos)
+        return token_type, end, state != DEAD
+
+
 class DFA:
     """
     Classe base para Autômatos Finitos Determinísticos baseados em Tabela.
@@ -9,54 +218,66 @@ class DFA:
         self.transitions = {}  # { state: [ (char_condition, next_state), ... ] }
         self.accepting_states = {}  # { state: token_type }
         self.start_state = 'start'
+        self._compiled = None
 
     def add_transition(self, state, char_condition, next_state):
         """Adiciona uma transição. char_condition pode ser um char ou uma função."""
         if state not in self.transitions:
             self.transitions[state] = []
         self.transitions[state].append((char_condition, next_state))
+        self._compiled = None
 
     def set_accepting(self, state, token_type):
         self.accepting_states[state] = token_type
+        self._compiled = None
+
+    def conditions(self):
+        """Condições distintas usadas nas transições, na ordem em que aparecem."""
+        unique = {}
+        for pairs in self.transitions.values():
+            for condition, _ in pairs:
+                unique.setdefault(condition, None)
+        return list(unique)
+
+    def compile(self) -> CompiledDFA:
+        """Compila (e guarda) a tabela densa de classes de caracteres deste AFD."""
+        if self._compiled is None:
+            self._compiled = CompiledDFA(
+                self.start_state, self.conditions(), self.step, self.accepting_states.get
+            )
+        return self._compiled
+
+    def step(self, state, char):
+        """Retorna o estado alcançado a partir de `state` lendo `char` (ou None)."""
+        for condition, target in self.transitions.get(state, ()):
+            # Se a condição for função (ex: is_digit) ou literal (ex: 'a')
+            if callable(condition):
+                if condition(char):
+                    return target
+            elif condition == char:
+                return target
+        return None
+
+    def match(self, text, pos=0):
+        """
+        Executa o AFD sobre `text` a partir do índice `pos`, sem copiar o texto.
+        Retorna (token_type, fim) do match mais longo, ou (None, pos) se falhar.
+        """
+        return self.compile().match(text, pos)
+
+    def scan(self, text, pos=0):
+        """Como `match`, retornando também até onde o texto foi lido (ver CompiledDFA.scan)."""
+        return self.compile().scan(text, pos)
 
     def run(self, text):
         """
         Executa o AFD sobre o texto.
         Retorna (token_type, valor_consumido) ou (None, None) se falhar.
         """
-        current_state = self.start_state
-        chars_consumed = 0
-        last_accepting_pos = None
-        last_accepting_type = None
-
-        for char in text:
-            next_state = None
-
-            # Busca transição válida
-            if current_state in self.transitions:
-                for condition, target in self.transitions[current_state]:
-                    # Se a condição for função (ex: is_digit) ou literal (ex: 'a')
-                    if callable(condition):
-                        if condition(char):
-                            next_state = target
-                            break
-                    elif condition == char:
-                        next_state = target
-                        break
-
-            if next_state:
-                current_state = next_state
-                chars_consumed += 1
-                # Verifica se é estado de aceitação
-                if current_state in self.accepting_states:
-                    last_accepting_pos = chars_consumed
-                    last_accepting_type = self.accepting_states[current_state]
-            else:
-                break  # Transição inválida, para o autômato
-
-        if last_accepting_pos:
-            return last_accepting_type, text[:last_accepting_pos]
-        return None, None
+        token_type, end = self.match(text)
+        if token_type is None:
+            return None, None
+        return token_type, text[:end]
 
 
 # --- Definições de Auxiliares ---
@@ -176,4 +397,13 @@ def build_string_dfa():
     dfa.add_transition('body', '"', 'final')
 
     dfa.set_accepting('final', 'STRING')
-    return dfa
\ No newline at end of file
+    return dfa
+
+
+def build_symbol_dfa():
+    """AFD para a pontuação simples (; , ( ) { } [ ])."""
+    dfa = DFA("Symbol")
+    for char in ';,(){}[]':
+        dfa.add_transition('start', char, 'symbol')
+    dfa.set_accepting('symbol', 'SYMBOL')
+    return dfa
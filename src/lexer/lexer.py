@@ -1,7 +1,14 @@
 # src/lexer/lexer.py
 
 from dataclasses import dataclass
-from .dfa import build_identifier_dfa, build_number_dfa, build_operator_dfa, build_string_dfa
+from typing import List, Optional
+from .dfa import (
+    build_identifier_dfa, build_number_dfa, build_operator_dfa,
+    build_string_dfa, build_symbol_dfa,
+)
+from .scanner import Scanner
+from .spec import spec_scanner
+from .tokens import TokenType
 
 # Lista de palavras reservadas da linguagem NocSysPy
 KEYWORDS = {
@@ -9,29 +16,149 @@ KEYWORDS = {
     'print', 'int', 'float', 'string', 'bool', 'true', 'false'
 }
 
-@dataclass
+# Tipo inteiro (TokenType) de cada palavra reservada e de cada pontuação
+KEYWORD_KINDS = {
+    'if': TokenType.KW_IF,
+    'else': TokenType.KW_ELSE,
+    'while': TokenType.KW_WHILE,
+    'for': TokenType.KW_FOR,
+    'return': TokenType.KW_RETURN,
+    'func': TokenType.KW_FUNC,
+    'var': TokenType.KW_VAR,
+    'print': TokenType.KW_PRINT,
+    'int': TokenType.KW_INT,
+    'float': TokenType.KW_FLOAT,
+    'string': TokenType.KW_STRING,
+    'bool': TokenType.KW_BOOL,
+    'true': TokenType.KW_TRUE,
+    'false': TokenType.KW_FALSE,
+}
+
+SYMBOL_KINDS = {
+    ';': TokenType.SEMICOLON,
+    ',': TokenType.COMMA,
+    '(': TokenType.LPAREN,
+    ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE,
+    '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET,
+    ']': TokenType.RBRACKET,
+}
+
+# Tipo em string emitido pelos AFDs -> TokenType (KEYWORD/SYMBOL dependem do lexema)
+TYPE_KINDS = {
+    'IDENTIFIER': TokenType.IDENTIFIER,
+    'INTEGER': TokenType.INTEGER,
+    'HEXADECIMAL': TokenType.HEXADECIMAL,
+    'FLOAT': TokenType.FLOAT,
+    'STRING': TokenType.STRING,
+    'PLUS': TokenType.PLUS,
+    'MINUS': TokenType.MINUS,
+    'STAR': TokenType.MULTIPLY,
+    'SLASH': TokenType.DIVIDE,
+    'FLOOR_DIV': TokenType.FLOOR_DIV,
+    'POWER': TokenType.POWER,
+    'EQUAL': TokenType.EQUAL,
+    'NOT_EQUAL': TokenType.NOT_EQUAL,
+    'LESS': TokenType.LESS,
+    'GREATER': TokenType.GREATER,
+    'LESS_EQUAL': TokenType.LESS_EQUAL,
+    'GREATER_EQUAL': TokenType.GREATER_EQUAL,
+    'SWAP': TokenType.SWAP,
+    'NULL_COALESCING': TokenType.NULL_COALESCING,
+    'ARROW': TokenType.ARROW,
+    'PIPE': TokenType.PIPE,
+    'ASSIGN': TokenType.ASSIGN,
+    'EOF': TokenType.EOF,
+}
+
+# Caminho inverso, para mensagens de erro: TokenType -> (tipo, lexema ou None)
+KIND_DESCRIPTIONS = {kind: (name, None) for name, kind in TYPE_KINDS.items()}
+KIND_DESCRIPTIONS.update({kind: ('KEYWORD', word) for word, kind in KEYWORD_KINDS.items()})
+KIND_DESCRIPTIONS.update({kind: ('SYMBOL', char) for char, kind in SYMBOL_KINDS.items()})
+
+
+def token_kind(token_type: str, value: str) -> TokenType:
+    """TokenType de um token a partir do tipo em string e do lexema."""
+    kind = TYPE_KINDS.get(token_type)
+    if kind is not None:
+        return kind
+    if token_type == 'KEYWORD':
+        return KEYWORD_KINDS[value]
+    if token_type == 'SYMBOL':
+        return SYMBOL_KINDS[value]
+    return TokenType.OTHER
+
+
+@dataclass(slots=True)
 class Token:
     type: str
     value: str
     line: int
     column: int
+    kind: int = TokenType.OTHER  # TokenType; o Parser compara só este campo
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """
+    Ponto onde o lexer pode recomeçar: início de um token, com linha e coluna.
+
+    `scan_limit` é até onde os tokens anteriores foram lidos (o match mais
+    longo olha além do fim do token). Se ele passa de `offset`, o checkpoint
+    está dentro da leitura de um token anterior (`in_token`), e recomeçar ali
+    só é seguro quando a edição fica depois de `scan_limit`.
+    """
+    offset: int
+    line: int
+    column: int
+    token_index: int
+    scan_limit: int = 0
+
+    @property
+    def in_token(self) -> bool:
+        return self.scan_limit > self.offset
 
 
 class Lexer:
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: str, use_scanner: bool = True, dfas=None,
+                 checkpoint_interval: Optional[int] = None):
         self.source = source_code
         self.position = 0
         self.line = 1
         self.column = 1
 
-        # Inicializa os autômatos (AFDs específicos)
-        self.dfas = [
-            build_number_dfa(),
-            build_string_dfa(),
-            build_operator_dfa(),
-            # IDENTIFIER por último (pode virar KEYWORD se estiver na tabela)
-            build_identifier_dfa(),
-        ]
+        # Checkpoints a cada `checkpoint_interval` tokens (None desliga)
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints: Optional[List[Checkpoint]] = [] if checkpoint_interval else None
+        self.token_count = 0
+        self._scan_limit = 0  # maior posição já lida por algum token
+
+        # Por padrão o lexer usa o AFD único gerado da especificação (spec.py),
+        # compilado uma vez e compartilhado entre instâncias. `dfas` permite usar
+        # outros AFDs, por exemplo os gerados por nfa_to_dfa (DFAFromNFA.to_dfa),
+        # e use_scanner=False volta a rodar cada AFD separadamente.
+        if dfas is not None:
+            self.dfas = list(dfas)
+        elif use_scanner:
+            self.dfas = []
+        else:
+            # Inicializa os autômatos (AFDs específicos)
+            self.dfas = [
+                build_number_dfa(),
+                build_string_dfa(),
+                build_operator_dfa(),
+                # IDENTIFIER por último (pode virar KEYWORD se estiver na tabela)
+                build_identifier_dfa(),
+            ]
+
+        if not use_scanner:
+            self.scanner = None
+        elif dfas is not None:
+            # Autômato produto: lê cada caractere uma única vez.
+            self.scanner = Scanner(self.dfas + [build_symbol_dfa()])
+        else:
+            self.scanner = spec_scanner()
 
     def _skip_whitespace(self):
         """Ignora espaços em branco e atualiza linha/coluna."""
@@ -47,55 +174,114 @@ class Lexer:
             else:
                 break
 
-    def next_token(self) -> Token:
-        """Retorna o próximo token (princípio do match mais longo)."""
+    def next_span(self):
+        """
+        Reconhece o próximo token sem criar o objeto Token.
+        Retorna (token_type, início, fim, linha, coluna); no fim do arquivo o
+        tipo é 'EOF' e início == fim.
+        """
         self._skip_whitespace()
 
-        if self.position >= len(self.source):
-            return Token('EOF', 'EOF', self.line, self.column)
+        start = self.position
+        line = self.line
+        column = self.column
+
+        if start >= len(self.source):
+            return 'EOF', start, start, line, column
+
+        if self.checkpoints is not None:
+            return self._next_span_with_checkpoints(start, line, column)
 
-        best_match = None
-        best_length = 0
+        best_end = start
         best_token_type = None
 
-        # Buffer: texto restante a partir da posição atual
-        remaining_text = self.source[self.position:]
+        if self.scanner is not None:
+            best_token_type, best_end = self.scanner.match(self.source, start)
+        else:
+            # Tenta todos os DFAs e pega o que consumiu mais caracteres (Longest Match).
+            # Cada AFD varre o próprio source a partir de self.position, sem cópias.
+            for dfa in self.dfas:
+                token_type, end = dfa.match(self.source, start)
+                if token_type is not None and end > best_end:
+                    best_end = end
+                    best_token_type = token_type
 
-        # Tenta todos os DFAs e pega o que consumiu mais caracteres (Longest Match)
-        for dfa in self.dfas:
-            token_type, matched_text = dfa.run(remaining_text)
-            if matched_text and len(matched_text) > best_length:
-                best_match = matched_text
-                best_length = len(matched_text)
-                best_token_type = token_type
+        return self._finish_span(best_token_type, start, best_end, line, column)
+
+    def _next_span_with_checkpoints(self, start, line, column):
+        """`next_span` que grava checkpoints e acompanha até onde o texto foi lido."""
+        if self.token_count % self.checkpoint_interval == 0:
+            self.checkpoints.append(
+                Checkpoint(start, line, column, self.token_count, self._scan_limit)
+            )
+        self.token_count += 1
 
+        best_end = start
+        best_token_type = None
+        if self.scanner is not None:
+            best_token_type, best_end, examined = self.scanner.scan(self.source, start)
+        else:
+            examined = start
+            for dfa in self.dfas:
+                token_type, end, dfa_examined = dfa.scan(self.source, start)
+                examined = max(examined, dfa_examined)
+                if token_type is not None and end > best_end:
+                    best_end = end
+                    best_token_type = token_type
+        if examined > self._scan_limit:
+            self._scan_limit = examined
+
+        return self._finish_span(best_token_type, start, best_end, line, column)
+
+    def _finish_span(self, best_token_type, start, best_end, line, column):
+        """Resolve o tipo final do token reconhecido e avança posição/linha/coluna."""
         # Se nenhum DFA aceitou
-        if not best_match:
-            char = self.source[self.position]
+        if best_token_type is None:
+            char = self.source[start]
             # Verifica se é pontuação simples que não cobrimos nos DFAs (ex: ; ( ) { } )
             if char in ';,(){}[]':
-                token = Token('SYMBOL', char, self.line, self.column)
-                self.position += 1
-                self.column += 1
-                return token
-
-            raise SyntaxError(
-                f"Erro Léxico: Caractere inválido '{char}' "
-                f"na linha {self.line}, coluna {self.column}"
-            )
+                best_token_type = 'SYMBOL'
+                best_end = start + 1
+            else:
+                raise SyntaxError(
+                    f"Erro Léxico: Caractere inválido '{char}' "
+                    f"na linha {self.line}, coluna {self.column}"
+                )
 
         # Tratamento especial para Identificadores vs Palavras-Chave
-        if best_token_type == 'IDENTIFIER' and best_match in KEYWORDS:
+        if best_token_type == 'IDENTIFIER' and self.source[start:best_end] in KEYWORDS:
             best_token_type = 'KEYWORD'
 
-        # Cria o token com posição atual
-        token = Token(best_token_type, best_match, self.line, self.column)
+        # Atualiza posição (strings podem conter quebras de linha)
+        self.position = best_end
+        newline = self.source.rfind('\n', start, best_end) if best_token_type == 'STRING' else -1
+        if newline >= 0:
+            self.line += self.source.count('\n', start, best_end)
+            self.column = best_end - newline
+        else:
+            self.column += best_end - start
 
-        # Atualiza posição
-        self.position += best_length
-        self.column += best_length
+        return best_token_type, start, best_end, line, column
+
+    def restore(self, checkpoint: Checkpoint):
+        """Recomeça a leitura a partir de um checkpoint (de uma leitura anterior do mesmo texto)."""
+        self.position = checkpoint.offset
+        self.line = checkpoint.line
+        self.column = checkpoint.column
+        self.token_count = checkpoint.token_index
+        self._scan_limit = checkpoint.scan_limit
+
+    def next_token(self) -> Token:
+        """Retorna o próximo token (princípio do match mais longo)."""
+        return self.token_from_span(*self.next_span())
 
-        return token
+    def token_from_span(self, token_type: str, start: int, end: int, line: int, column: int) -> Token:
+        """Token de um span devolvido por `next_span` (o mesmo que `next_token` criaria)."""
+        if token_type == 'EOF':
+            return Token('EOF', 'EOF', line, column, TokenType.EOF)
+        # O lexema só é recortado do source quando o token é emitido
+        value = self.source[start:end]
+        return Token(token_type, value, line, column, token_kind(token_type, value))
 
     def get_all_tokens(self):
         tokens = []
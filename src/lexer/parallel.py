@@ -0,0 +1,147 @@
+# src/lexer/parallel.py
+"""
+Lexer paralelo para fontes muito grandes.
+
+O source é cortado em segmentos logo depois de quebras de linha que estão
+comprovadamente fora de strings. Nenhum token além de STRING contém '\\n', e
+a leitura do match mais longo para no '\\n', então cada corte é também uma
+fronteira de token: lexar os segmentos separadamente (começando na linha
+certa, coluna 1) dá exatamente os mesmos tokens que uma passada só.
+
+Para achar os cortes basta seguir as aspas: fora de string, '"' só aparece
+abrindo uma string, e o fim dela é a próxima '"' não escapada. Os saltos são
+feitos com `str.find`, então a busca custa pouco mesmo em centenas de MB.
+
+Cada segmento vira um TokenBuffer num processo do pool (o source vai para os
+workers uma vez só, no initializer) e volta como arrays; as colunas são
+costuradas com início deslocado e códigos de tipo remapeados.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .buffer import TokenBuffer
+from .lexer import Lexer, Token
+
+# Abaixo disso por segmento não compensa o custo de processo/IPC
+MIN_SEGMENT_SIZE = 1024 * 1024
+
+
+def _string_end(source: str, quote: int) -> int:
+    """Posição logo depois da string que abre em `quote` (-1 se não termina)."""
+    position = quote + 1
+    while True:
+        close = source.find('"', position)
+        if close == -1:
+            return -1
+        # número ímpar de barras logo antes: a aspa está escapada
+        backslashes = 0
+        while source[close - 1 - backslashes] == '\\':
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return close + 1
+        position = close + 1
+
+
+def split_points(source: str, parts: int) -> List[int]:
+    """
+    Até `parts - 1` posições de corte, cada uma logo depois de um '\\n' fora
+    de string, perto de len(source) * i / parts. Ordenadas e sem repetição.
+    """
+    points: List[int] = []
+    position = 0  # sempre fora de string
+    for i in range(1, parts):
+        target = len(source) * i // parts
+        while True:
+            newline = source.find('\n', max(target, position))
+            if newline == -1:
+                return points
+            quote = source.find('"', position, newline)
+            if quote == -1:
+                break
+            position = _string_end(source, quote)
+            if position == -1:
+                # string sem fim: o resto fica num segmento só (e o lexer acusa o erro)
+                return points
+        position = newline + 1
+        if position < len(source):
+            points.append(position)
+    return points
+
+
+def segments(source: str, parts: int) -> List[Tuple[int, int, int]]:
+    """(início, fim, linha inicial) de cada segmento."""
+    bounds = [0] + split_points(source, parts) + [len(source)]
+    result = []
+    line = 1
+    for start, end in zip(bounds, bounds[1:]):
+        result.append((start, end, line))
+        line += source.count('\n', start, end)
+    return result
+
+
+_source: Optional[str] = None
+
+
+def _init_worker(source: str):
+    global _source
+    _source = source
+
+
+def _lex_segment(segment: Tuple[int, int, int]):
+    """Lexa um segmento do source do worker e devolve as colunas do TokenBuffer."""
+    start, end, line = segment
+    text = _source[start:end]
+    lexer = Lexer(text)
+    lexer.line = line
+    buffer = TokenBuffer.from_source(text, lexer=lexer)
+    return (buffer.type_names, buffer.types, buffer.kinds, buffer.starts,
+            buffer.lengths, buffer.lines, buffer.columns)
+
+
+def _stitch(source: str, starts_at: List[int], pieces) -> TokenBuffer:
+    buffer = TokenBuffer(source)
+    last = len(pieces) - 1
+    for index, (offset, piece) in enumerate(zip(starts_at, pieces)):
+        type_names, types, kinds, starts, lengths, lines, columns = piece
+        # o EOF de cada segmento só vale no último
+        count = len(types) if index == last else len(types) - 1
+        table = bytes(buffer._type_code(name) for name in type_names)
+        buffer.types.frombytes(types[:count].tobytes().translate(table.ljust(256, b'\0')))
+        buffer.kinds.extend(kinds[:count])
+        if offset:
+            buffer.starts.extend(map(offset.__add__, starts[:count]))
+        else:
+            buffer.starts.extend(starts[:count])
+        buffer.lengths.extend(lengths[:count])
+        buffer.lines.extend(lines[:count])
+        buffer.columns.extend(columns[:count])
+    return buffer
+
+
+def lex_parallel(source: str, workers: Optional[int] = None,
+                 min_segment_size: int = MIN_SEGMENT_SIZE) -> TokenBuffer:
+    """
+    TokenBuffer de `source` lexado em `workers` processos (padrão:
+    os.cpu_count()). Fontes pequenas demais para dividir são lexadas aqui
+    mesmo. Erros léxicos são os mesmos (e com a mesma linha/coluna) da
+    passada sequencial. O buffer resultante não tem checkpoints.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    parts = min(workers, len(source) // max(1, min_segment_size))
+    if parts <= 1:
+        return TokenBuffer.from_source(source, lexer=Lexer(source))
+
+    pieces_of = segments(source, parts)
+    with ProcessPoolExecutor(max_workers=min(workers, len(pieces_of)),
+                             initializer=_init_worker, initargs=(source,)) as pool:
+        pieces = list(pool.map(_lex_segment, pieces_of))
+    return _stitch(source, [start for start, _, _ in pieces_of], pieces)
+
+
+def get_all_tokens_parallel(source: str, workers: Optional[int] = None,
+                            min_segment_size: int = MIN_SEGMENT_SIZE) -> List[Token]:
+    """Mesmo resultado de `Lexer(source).get_all_tokens()`, lexando em paralelo."""
+    return list(lex_parallel(source, workers, min_segment_size))
@@ -0,0 +1,255 @@
+# src/lexer/regex.py
+"""
+Front end de expressões regulares para o lexer (construção de Thompson).
+
+Cada regra é um par (token_type, regex). Todas as regras viram um único AFN:
+o estado inicial tem transições-ε para o fragmento de cada regra e o estado
+final de cada fragmento aceita o respectivo token. A ordem das regras define
+a prioridade quando dois tokens reconhecem o mesmo lexema.
+
+Sintaxe suportada:
+    ab      concatenação          a|b     união
+    a*      zero ou mais          a+      uma ou mais
+    a?      opcional              (ab)    agrupamento
+    .       qualquer caractere    [a-z_]  classe (com intervalos)
+    [^"\\]  classe negada         \\x      escape de metacaractere
+    \\n \\t \\r  quebra de linha, tabulação, retorno de carro
+    \\L      letras fora do ASCII (também vale dentro de classes)
+    \\N      outros alfanuméricos fora do ASCII: dígitos, sobrescritos (²)...
+
+O alfabeto do AFN é formado pelos caracteres ASCII mais três predicados que
+particionam o resto do Unicode (is_non_ascii_alpha / is_non_ascii_numeric /
+is_non_ascii_other), na mesma divisão de `str.isalpha` e `str.isalnum`;
+`DFAFromNFA.to_dfa` transforma esses predicados em condições do AFD.
+"""
+
+from .afn_to_afd import NFA, EPSILON
+
+
+def is_non_ascii_alpha(c):
+    return ord(c) >= 128 and c.isalpha()
+
+
+def is_non_ascii_numeric(c):
+    return ord(c) >= 128 and c.isalnum() and not c.isalpha()
+
+
+def is_non_ascii_other(c):
+    return ord(c) >= 128 and not c.isalnum()
+
+
+# Predicados que podem aparecer como símbolos do AFN (e condições do AFD), por nome
+PREDICATES = {
+    'is_non_ascii_alpha': is_non_ascii_alpha,
+    'is_non_ascii_numeric': is_non_ascii_numeric,
+    'is_non_ascii_other': is_non_ascii_other,
+}
+
+# Um caractere de cada classe não-ASCII; compilar estes três de antemão deixa a
+# tabela completa para qualquer entrada (útil quando ela é carregada do cache).
+NON_ASCII_REPRESENTATIVES = ('ç', '²', '€')
+
+ASCII = [chr(code) for code in range(128)]
+ANY = frozenset(ASCII) | {is_non_ascii_alpha, is_non_ascii_numeric, is_non_ascii_other}
+
+ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+
+
+class RegexError(ValueError):
+    pass
+
+
+class _Thompson:
+    """Monta fragmentos (início, fim) de AFN num dicionário de transições compartilhado."""
+    def __init__(self):
+        self.transitions = {}
+        self.alphabet = set()
+        self.count = 1  # o estado 0 é o inicial do AFN completo
+
+    def new_state(self):
+        self.count += 1
+        return self.count - 1
+
+    def epsilon(self, source, target):
+        self.transitions.setdefault((source, EPSILON), set()).add(target)
+
+    def symbols(self, symbols):
+        start, end = self.new_state(), self.new_state()
+        for symbol in symbols:
+            self.transitions.setdefault((start, symbol), set()).add(end)
+            self.alphabet.add(symbol)
+        return start, end
+
+    def empty(self):
+        start, end = self.new_state(), self.new_state()
+        self.epsilon(start, end)
+        return start, end
+
+    def concat(self, first, second):
+        self.epsilon(first[1], second[0])
+        return first[0], second[1]
+
+    def union(self, first, second):
+        start, end = self.new_state(), self.new_state()
+        self.epsilon(start, first[0])
+        self.epsilon(start, second[0])
+        self.epsilon(first[1], end)
+        self.epsilon(second[1], end)
+        return start, end
+
+    def star(self, fragment):
+        start, end = self.new_state(), self.new_state()
+        self.epsilon(start, fragment[0])
+        self.epsilon(start, end)
+        self.epsilon(fragment[1], fragment[0])
+        self.epsilon(fragment[1], end)
+        return start, end
+
+    def plus(self, fragment):
+        start, end = self.new_state(), self.new_state()
+        self.epsilon(start, fragment[0])
+        self.epsilon(fragment[1], fragment[0])
+        self.epsilon(fragment[1], end)
+        return start, end
+
+    def optional(self, fragment):
+        start, end = self.new_state(), self.new_state()
+        self.epsilon(start, fragment[0])
+        self.epsilon(start, end)
+        self.epsilon(fragment[1], end)
+        return start, end
+
+
+class _RegexParser:
+    """
+    Descida recursiva sobre a regex:
+        Union  ::= Concat { "|" Concat }
+        Concat ::= { Repeat }
+        Repeat ::= Atom { "*" | "+" | "?" }
+        Atom   ::= "(" Union ")" | "[" Class "]" | "." | Escape | char
+    """
+    def __init__(self, pattern, builder):
+        self.pattern = pattern
+        self.pos = 0
+        self.builder = builder
+
+    def _peek(self):
+        return self.pattern[self.pos] if self.pos < len(self.pattern) else None
+
+    def _next(self):
+        char = self._peek()
+        if char is None:
+            raise RegexError(f"Fim inesperado da regex '{self.pattern}'")
+        self.pos += 1
+        return char
+
+    def parse(self):
+        fragment = self._union()
+        if self.pos != len(self.pattern):
+            raise RegexError(f"Caractere inesperado '{self._peek()}' na posição {self.pos} "
+                             f"da regex '{self.pattern}'")
+        return fragment
+
+    def _union(self):
+        fragment = self._concat()
+        while self._peek() == '|':
+            self.pos += 1
+            fragment = self.builder.union(fragment, self._concat())
+        return fragment
+
+    def _concat(self):
+        fragment = None
+        while self._peek() not in (None, '|', ')'):
+            atom = self._repeat()
+            fragment = atom if fragment is None else self.builder.concat(fragment, atom)
+        return fragment if fragment is not None else self.builder.empty()
+
+    def _repeat(self):
+        fragment = self._atom()
+        while self._peek() in ('*', '+', '?'):
+            op = self._next()
+            if op == '*':
+                fragment = self.builder.star(fragment)
+            elif op == '+':
+                fragment = self.builder.plus(fragment)
+            else:
+                fragment = self.builder.optional(fragment)
+        return fragment
+
+    def _atom(self):
+        char = self._next()
+        if char == '(':
+            fragment = self._union()
+            if self._next() != ')':
+                raise RegexError(f"Esperado ')' na regex '{self.pattern}'")
+            return fragment
+        if char == '[':
+            return self.builder.symbols(self._class())
+        if char == '.':
+            return self.builder.symbols(ANY)
+        if char == '\\':
+            return self.builder.symbols(self._escape())
+        if char in '*+?)|':
+            raise RegexError(f"Operador '{char}' sem operando na regex '{self.pattern}'")
+        return self.builder.symbols({char})
+
+    def _escape(self):
+        char = self._next()
+        if char == 'L':
+            return {is_non_ascii_alpha}
+        if char == 'N':
+            return {is_non_ascii_numeric}
+        return {ESCAPES.get(char, char)}
+
+    def _class(self):
+        negated = self._peek() == '^'
+        if negated:
+            self.pos += 1
+
+        symbols = set()
+        first = True
+        while first or self._peek() != ']':
+            first = False
+            char = self._next()
+            if char == '\\':
+                item = self._escape()
+            else:
+                item = {char}
+            # Intervalo a-z (só entre caracteres simples)
+            if (len(item) == 1 and self._peek() == '-' and
+                    self.pos + 1 < len(self.pattern) and self.pattern[self.pos + 1] != ']'):
+                low = next(iter(item))
+                self.pos += 1
+                high = self._next()
+                if high == '\\':
+                    high = next(iter(self._escape()))
+                if callable(low) or callable(high) or low > high:
+                    raise RegexError(f"Intervalo inválido na regex '{self.pattern}'")
+                item = {chr(code) for code in range(ord(low), ord(high) + 1)}
+            symbols |= item
+        self.pos += 1  # ']'
+
+        if negated:
+            return ANY - symbols
+        return symbols
+
+
+def regex_to_nfa(pattern: str, token_type='ACCEPT') -> NFA:
+    """AFN de uma única regex."""
+    return rules_to_nfa([(token_type, pattern)])
+
+
+def rules_to_nfa(rules) -> NFA:
+    """
+    Compila uma tabela [(token_type, regex), ...] num único AFN.
+    O estado final de cada regra aceita o token dela; a ordem da tabela é a prioridade.
+    """
+    builder = _Thompson()
+    accept_tokens = {}
+    for token_type, pattern in rules:
+        start, end = _RegexParser(pattern, builder).parse()
+        builder.epsilon(0, start)
+        accept_tokens[end] = token_type
+
+    return NFA(range(builder.count), builder.alphabet, builder.transitions, 0,
+               set(accept_tokens), accept_tokens=accept_tokens)
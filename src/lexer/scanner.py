@@ -0,0 +1,71 @@
+# src/lexer/scanner.py
+
+from .dfa import CompiledDFA
+
+
+class Scanner:
+    """
+    Autômato produto dos AFDs do lexer.
+
+    Cada estado do produto é a tupla com o estado atual de cada AFD componente
+    (None quando aquele AFD já morreu). Assim cada caractere da entrada é lido
+    uma única vez, em vez de uma passada de `DFA.run` por autômato.
+
+    A prioridade entre tokens segue a ordem da lista `dfas`: quando mais de um
+    componente aceita no mesmo estado, vence o primeiro (o mesmo desempate do
+    laço antigo do Lexer). O produto é compilado numa `CompiledDFA`, com classes
+    de caracteres calculadas sobre as condições de todos os componentes.
+    """
+    def __init__(self, dfas):
+        self.dfas = list(dfas)
+
+        conditions = {}
+        for dfa in self.dfas:
+            for condition in dfa.conditions():
+                conditions.setdefault(condition, None)
+
+        self.compiled = CompiledDFA(
+            tuple(dfa.start_state for dfa in self.dfas),
+            list(conditions),
+            self._move,
+            self._accepting,
+        )
+
+    def _move(self, components, char):
+        """Transição do estado produto lendo `char` (None se todos morreram)."""
+        targets = tuple(
+            dfa.step(state, char) if state is not None else None
+            for dfa, state in zip(self.dfas, components)
+        )
+        if all(state is None for state in targets):
+            return None
+        return targets
+
+    def _accepting(self, components):
+        for dfa, state in zip(self.dfas, components):
+            if state is not None and state in dfa.accepting_states:
+                return dfa.accepting_states[state]
+        return None
+
+    @property
+    def state_count(self):
+        """Quantidade de estados do produto."""
+        return len(self.compiled.states)
+
+    def match(self, text, pos=0):
+        """
+        Executa o autômato sobre `text` a partir do índice `pos`, sem copiar o texto.
+        Retorna (token_type, fim) do match mais longo, ou (None, pos) se falhar.
+        """
+        return self.compiled.match(text, pos)
+
+    def scan(self, text, pos=0):
+        """Como `match`, retornando também até onde o texto foi lido."""
+        return self.compiled.scan(text, pos)
+
+    def run(self, text):
+        """Mesma interface de `DFA.run`: (token_type, valor_consumido) ou (None, None)."""
+        token_type, end = self.match(text)
+        if token_type is None:
+            return None, None
+        return token_type, text[:end]
@@ -0,0 +1,73 @@
+# src/lexer/spec.py
+"""
+Especificação declarativa dos tokens do NocSysPy.
+
+As regras são compiladas uma única vez (regex -> AFN de Thompson -> AFD por
+subconjuntos -> AFD mínimo -> tabela densa) e a tabela resultante é
+compartilhada por todas as instâncias de Lexer e gravada em cache no disco.
+"""
+
+from .afn_to_afd import nfa_to_dfa_bitset, minimize_dfa
+from .cache import load_or_build
+from .dfa import DFA, CompiledDFA
+from .regex import rules_to_nfa, NON_ASCII_REPRESENTATIVES
+
+# Ordem = prioridade em caso de empate no tamanho do lexema.
+# IDENTIFIER vem por último: palavras reservadas viram KEYWORD no Lexer.
+TOKEN_RULES = [
+    ('FLOAT', r'(0|[1-9][0-9]*)\.[0-9]+'),
+    ('HEXADECIMAL', r'0x[0-9a-fA-F]+'),
+    ('INTEGER', r'0|[1-9][0-9]*'),
+    ('STRING', r'"([^"\\]|\\.)*"'),
+
+    # Relacionais
+    ('SWAP', r'<->'),
+    ('LESS_EQUAL', r'<='),
+    ('LESS', r'<'),
+    ('GREATER_EQUAL', r'>='),
+    ('GREATER', r'>'),
+    ('EQUAL', r'=='),
+    ('NOT_EQUAL', r'!='),
+
+    # Especiais
+    ('ARROW', r'=>'),
+    ('PIPE', r'\|>'),
+    ('NULL_COALESCING', r'\?\?'),
+
+    # Atribuição e aritméticos
+    ('ASSIGN', r'='),
+    ('PLUS', r'\+'),
+    ('MINUS', r'-'),
+    ('POWER', r'\*\*'),
+    ('STAR', r'\*'),
+    ('FLOOR_DIV', r'//'),
+    ('SLASH', r'/'),
+
+    ('SYMBOL', r'[;,(){}\[\]]'),
+    ('IDENTIFIER', r'[A-Za-z_\L][A-Za-z0-9_\L\N]*'),
+]
+
+_compiled_specs = {}
+
+
+def build_spec_dfa(rules=None, name="Spec") -> DFA:
+    """Compila uma tabela de regras (token_type, regex) num único AFD mínimo."""
+    rules = TOKEN_RULES if rules is None else rules
+    dfa = minimize_dfa(nfa_to_dfa_bitset(rules_to_nfa(rules))).to_dfa(name)
+    compiled = dfa.compile()
+    for char in NON_ASCII_REPRESENTATIVES:
+        compiled.class_of(char)
+    return dfa
+
+
+def spec_scanner(rules=None) -> CompiledDFA:
+    """
+    Tabelas compiladas para `rules`, compartilhadas por todas as instâncias de Lexer.
+    Na primeira chamada do processo vêm do cache em disco (cache.py) ou são compiladas.
+    """
+    key = tuple(TOKEN_RULES if rules is None else rules)
+    scanner = _compiled_specs.get(key)
+    if scanner is None:
+        scanner = load_or_build(key, lambda: build_spec_dfa(key).compile())
+        _compiled_specs[key] = scanner
+    return scanner
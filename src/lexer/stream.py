@@ -0,0 +1,146 @@
+# src/lexer/stream.py
+
+import codecs
+
+from .dfa import DEAD
+from .lexer import Token, KEYWORDS, token_kind
+from .tokens import TokenType
+from .spec import spec_scanner
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class StreamingLexer:
+    """
+    Lexer em streaming sobre um arquivo binário (ou `mmap`), lido em blocos.
+
+    Só o trecho ainda não consumido fica em memória: o buffer guarda o token
+    atual mais um bloco, então o uso de memória é limitado pelo maior token e
+    não pelo tamanho do arquivo. Tokens que atravessam a fronteira entre
+    blocos (strings longas, identificadores, `<->`) são detectados porque o
+    autômato chega ao fim do buffer ainda vivo; nesse caso a leitura continua
+    no próximo bloco a partir do estado em que parou, e os pedaços do token
+    só são juntados no fim: um token de k blocos custa O(k) e não O(k²).
+
+    Produz os mesmos tokens (tipo, valor, linha e coluna) que `Lexer`.
+    """
+    def __init__(self, stream, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 encoding: str = 'utf-8', scanner=None):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size deve ser positivo")
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.scanner = scanner if scanner is not None else spec_scanner()
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+
+        self.buffer = ''
+        self.position = 0  # posição dentro do buffer
+        self.line = 1
+        self.column = 1
+        self._eof = False
+
+    def _read(self) -> str:
+        """Próximo bloco decodificado ('' no fim do arquivo)."""
+        if self._eof:
+            return ''
+        data = self.stream.read(self.chunk_size)
+        if not data:
+            self._eof = True
+        if isinstance(data, str):
+            return data
+        return self._decoder.decode(data, final=not data)
+
+    def _fill(self) -> bool:
+        """Descarta o trecho já consumido e anexa o próximo bloco. Retorna False no fim."""
+        if self._eof:
+            return False
+        self.buffer = self.buffer[self.position:] + self._read()
+        self.position = 0
+        return not self._eof
+
+    def _match(self):
+        """
+        (token_type, fim) do match mais longo a partir da posição atual. Se o
+        buffer acaba com o autômato vivo, os blocos seguintes são lidos a partir
+        do estado em que ele parou; no fim o buffer passa a começar no token.
+        """
+        scanner = self.scanner
+        position = self.position
+        state, token_type, end, _ = scanner.advance(self.buffer, position)
+        if state == DEAD or self._eof:
+            return token_type, end
+
+        pieces = [self.buffer[position:]]
+        offset = len(pieces[0])  # tamanho já lido do token, em relação a `position`
+        end -= position
+        while state != DEAD:
+            text = self._read()
+            if not text:
+                if self._eof:
+                    break
+                continue  # bloco só com parte de um caractere multibyte
+            state, piece_type, piece_end, _ = scanner.advance(text, 0, state)
+            if piece_type is not None:
+                token_type, end = piece_type, offset + piece_end
+            pieces.append(text)
+            offset += len(text)
+        self.buffer = ''.join(pieces)
+        self.position = 0
+        return token_type, end
+
+    def _skip_whitespace(self):
+        while True:
+            buffer = self.buffer
+            while self.position < len(buffer):
+                char = buffer[self.position]
+                if char in ' \t\r':
+                    self.position += 1
+                    self.column += 1
+                elif char == '\n':
+                    self.position += 1
+                    self.line += 1
+                    self.column = 1
+                else:
+                    return
+            if not self._fill() and self.position >= len(self.buffer):
+                return
+
+    def tokens(self):
+        """Gerador de tokens; o último é sempre EOF."""
+        while True:
+            self._skip_whitespace()
+            if self.position >= len(self.buffer):
+                yield Token('EOF', 'EOF', self.line, self.column, TokenType.EOF)
+                return
+
+            token_type, end = self._match()
+            if token_type is None:
+                char = self.buffer[self.position]
+                raise SyntaxError(
+                    f"Erro Léxico: Caractere inválido '{char}' "
+                    f"na linha {self.line}, coluna {self.column}"
+                )
+
+            lexeme = self.buffer[self.position:end]
+            if token_type == 'IDENTIFIER' and lexeme in KEYWORDS:
+                token_type = 'KEYWORD'
+
+            yield Token(token_type, lexeme, self.line, self.column,
+                        token_kind(token_type, lexeme))
+
+            newline = lexeme.rfind('\n') if token_type == 'STRING' else -1
+            if newline >= 0:
+                # string com quebra de linha: a posição segue o texto real
+                self.line += lexeme.count('\n')
+                self.column = len(lexeme) - newline
+            else:
+                self.column += end - self.position
+            self.position = end
+
+    def __iter__(self):
+        return self.tokens()
+
+
+def stream_tokens(stream, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = 'utf-8'):
+    """Atalho: gera os tokens de um arquivo binário ou mmap, bloco a bloco."""
+    return StreamingLexer(stream, chunk_size, encoding).tokens()
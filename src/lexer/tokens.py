@@ -1,6 +1,10 @@
-from enum import Enum, auto
+from enum import IntEnum, auto
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    """
+    Tipos de token como inteiros pequenos (IntEnum), comparáveis direto com `int`.
+    O Lexer grava o tipo em `Token.kind` e o Parser compara só esses inteiros.
+    """
     # Palavras-chave (português)
     SE = auto()             # se (if)
     SENAO = auto()          # senao (else)
@@ -30,9 +34,26 @@ class TokenType(Enum):
     ASYNC = auto()          # async
     AGUARDA = auto()        # aguarda (await)
     
+    # Palavras-chave do lexer atual (inglês)
+    KW_IF = auto()          # if
+    KW_ELSE = auto()        # else
+    KW_WHILE = auto()       # while
+    KW_FOR = auto()         # for
+    KW_RETURN = auto()      # return
+    KW_FUNC = auto()        # func
+    KW_VAR = auto()         # var
+    KW_PRINT = auto()       # print
+    KW_INT = auto()         # int
+    KW_FLOAT = auto()       # float
+    KW_STRING = auto()      # string
+    KW_BOOL = auto()        # bool
+    KW_TRUE = auto()        # true
+    KW_FALSE = auto()       # false
+
     # Identificadores e literais
     IDENTIFIER = auto()
     INTEGER = auto()
+    HEXADECIMAL = auto()
     FLOAT = auto()
     STRING = auto()
     
@@ -81,6 +102,7 @@ class TokenType(Enum):
     BLOCK_COMMENT = auto()  # /* comentário */
     WHITESPACE = auto()     # espaços
     EOF = auto()            # Fim do arquivo
+    OTHER = auto()          # tipo fora desta tabela (ex: AFDs customizados)
 
 class Token:
     """
@@ -0,0 +1,36 @@
+"""
+Pacote de passadas de otimização sobre a AST de NocSys.
+
+Cada passada de transformação recebe um Program e devolve um Program novo,
+executável por qualquer backend de src/executor com a mesma saída, mais as
+estatísticas do que mudou. As análises (pureza, escopo) não mudam a AST.
+
+Este pacote contém:
+- nodes.py: Percurso genérico da AST (filhos de um nó, contagem de nós).
+- folding.py: Dobra de constantes e identidades algébricas seguras para os tipos.
+- deadcode.py: Remoção de código inalcançável, ramos e laços constantes, `;` soltos e
+  funções nunca chamadas (rodar depois de folding.py).
+- purity.py: Análise de pureza das funções (sem print, sem ler/escrever globais, só
+  chamadas puras), usada pela memoização do executor.
+- resolver.py: Tabelas de escopo e posição (profundidade, slot) de cada variável, com
+  nomes não declarados e sombreados.
+"""
+
+from .folding import ConstantFolder, FoldStats, fold_constants
+from .deadcode import DeadCodeEliminator, DeadCodeStats, eliminate_dead_code
+from .purity import pure_functions
+from .resolver import Resolution, Scope, ScopeResolver, resolve_scopes
+
+__all__ = [
+    'ConstantFolder',
+    'FoldStats',
+    'fold_constants',
+    'DeadCodeEliminator',
+    'DeadCodeStats',
+    'eliminate_dead_code',
+    'pure_functions',
+    'Resolution',
+    'Scope',
+    'ScopeResolver',
+    'resolve_scopes',
+]
@@ -0,0 +1,183 @@
+# src/optimizer/deadcode.py
+"""
+Eliminação de código morto sobre a AST.
+
+Remove, devolvendo um Program novo:
+
+- statements depois de um que nunca termina normalmente: `return`, `while`
+  com condição constante verdadeira (não há `break`), `if`/`else` em que os
+  dois ramos não terminam, bloco que contém um desses;
+- `if` com condição literal (fica só o ramo escolhido, ainda como bloco,
+  para manter o escopo) e `while` com condição literal falsa;
+- `;` sozinho e outros literais soltos (`ExprStmt(LiteralExpr)`), e blocos
+  vazios;
+- funções que não são alcançadas a partir do código de topo por chamadas.
+
+Só condições que já são literais contam como constantes: rode antes a dobra
+de constantes (folding.py) para pegar `if (1 < 2)`. Como no interpretador
+ingênuo, erros que só seriam acusados quando o código rodasse (`return` fora
+de função, `<->` dentro de expressão) somem junto com o código morto;
+funções com nome repetido nunca são removidas, para o erro continuar.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.parser.ast import (
+    Program, FuncDecl, Block, IfStmt, WhileStmt,
+    ReturnStmt, ExprStmt, LiteralExpr, CallExpr
+)
+from src.executor.runtime import literal_value
+from .nodes import children, count_nodes
+
+
+@dataclass(slots=True)
+class DeadCodeStats:
+    unreachable: int = 0        # statements depois de return / laço infinito
+    constant_branches: int = 0  # `if` com condição constante
+    dead_loops: int = 0         # `while` com condição falsa
+    empty_statements: int = 0   # `;`, literais soltos e blocos vazios
+    functions: int = 0          # funções nunca chamadas
+    nodes_before: int = 0
+    nodes_after: int = 0
+
+    @property
+    def eliminated(self) -> int:
+        return self.nodes_before - self.nodes_after
+
+
+def _constant(condition):
+    """(True, valor-verdade) para condição literal; (False, None) caso contrário."""
+    if type(condition) is LiteralExpr:
+        return True, bool(literal_value(condition.value))
+    return False, None
+
+
+def _terminates(node) -> bool:
+    """O statement nunca continua no próximo (retorna ou fica preso num laço)."""
+    kind = type(node)
+    if kind is ReturnStmt:
+        return True
+    if kind is Block:
+        return any(_terminates(statement) for statement in node.statements)
+    if kind is IfStmt:
+        return (node.else_branch is not None
+                and _terminates(node.then_branch) and _terminates(node.else_branch))
+    if kind is WhileStmt:
+        constant, value = _constant(node.condition)
+        return constant and value
+    return False
+
+
+def _callees(root) -> set:
+    """Nomes chamados dentro de uma subárvore."""
+    names = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if type(node) is CallExpr:
+            names.add(node.callee.value)
+        stack.extend(children(node))
+    return names
+
+
+class DeadCodeEliminator:
+    def __init__(self):
+        self.stats = DeadCodeStats()
+
+    def eliminate(self, program: Program) -> Program:
+        self.stats.nodes_before += count_nodes(program)
+        declarations = self._statements(program.declarations, top_level=True)
+        declarations = self._reachable(declarations)
+        result = Program(declarations)
+        self.stats.nodes_after += count_nodes(result)
+        return result
+
+    def _reachable(self, declarations: list) -> list:
+        """Remove as funções de topo que nenhuma chamada alcança."""
+        functions = {}
+        pending = []
+        for decl in declarations:
+            if type(decl) is FuncDecl:
+                functions.setdefault(decl.name.value, []).append(decl)
+            else:
+                pending.extend(_callees(decl))
+        reached = set()
+        while pending:
+            name = pending.pop()
+            if name in reached or name not in functions:
+                continue
+            reached.add(name)
+            for decl in functions[name]:
+                pending.extend(_callees(decl.body))
+
+        repeated = {name for name, decls in functions.items() if len(decls) > 1}
+        kept = []
+        for decl in declarations:
+            if type(decl) is FuncDecl and decl.name.value not in reached | repeated:
+                self.stats.functions += 1
+            else:
+                kept.append(decl)
+        return kept
+
+    # ==========================
+    # Statements
+    # ==========================
+    def _statements(self, statements: list, top_level: bool = False) -> list:
+        result = []
+        dead = False
+        for statement in statements:
+            if dead:
+                # funções de topo são içadas: continuam valendo depois de um return
+                if top_level and type(statement) is FuncDecl:
+                    result.append(self._statement(statement))
+                else:
+                    self.stats.unreachable += 1
+                continue
+            statement = self._statement(statement)
+            if statement is None:
+                continue
+            result.append(statement)
+            dead = _terminates(statement)
+        return result
+
+    def _statement(self, node):
+        """O statement simplificado, ou None se ele não faz nada."""
+        kind = type(node)
+        if kind is ExprStmt and type(node.expr) is LiteralExpr:
+            self.stats.empty_statements += 1
+            return None
+        if kind is Block:
+            block = Block(self._statements(node.statements))
+            if not block.statements:
+                self.stats.empty_statements += 1
+                return None
+            return block
+        if kind is IfStmt:
+            constant, value = _constant(node.condition)
+            if constant:
+                self.stats.constant_branches += 1
+                branch = node.then_branch if value else node.else_branch
+                return None if branch is None else self._statement(branch)
+            return IfStmt(node.condition, self._branch(node.then_branch),
+                          None if node.else_branch is None else self._branch(node.else_branch))
+        if kind is WhileStmt:
+            constant, value = _constant(node.condition)
+            if constant and not value:
+                self.stats.dead_loops += 1
+                return None
+            return WhileStmt(node.condition, self._branch(node.body))
+        if kind is FuncDecl:
+            return FuncDecl(node.func_token, node.name, node.params, self._branch(node.body))
+        return node
+
+    def _branch(self, block: Block) -> Block:
+        """Corpo de if/while/função: continua sendo um Block, mesmo vazio."""
+        return Block(self._statements(block.statements))
+
+
+def eliminate_dead_code(program: Program):
+    """Devolve (programa sem código morto, DeadCodeStats)."""
+    eliminator = DeadCodeEliminator()
+    return eliminator.eliminate(program), eliminator.stats
@@ -0,0 +1,331 @@
+# src/optimizer/folding.py
+"""
+Dobra de constantes e simplificação algébrica sobre a AST.
+
+A passada devolve um Program novo (a AST de entrada não é alterada) que
+qualquer backend de src/executor executa com a mesma saída do original:
+
+- subárvores só com literais viram um LiteralExpr, calculado com os mesmos
+  operadores de runtime.py (int/float/bool/str se comportam igual);
+- operações que falhariam (divisão por zero, tipos inválidos, resultado
+  complexo) não são dobradas: o erro continua acontecendo na execução, com a
+  posição do operador;
+- identidades (`x + 0`, `x * 1`, `x - 0`, `x // 1`, `x ** 1`, `- -x`, `+x`)
+  só são aplicadas quando o tipo de `x` é conhecido e a identidade vale para
+  ele: `true + 0` é 1, `-0.0 + 0` é 0.0 e `"a" + 0` é erro, então `x + 0` só
+  some quando `x` é sempre inteiro.
+
+Os tipos vêm de uma inferência simples por nome: o conjunto de tipos de uma
+variável é a união dos tipos de tudo o que é atribuído a qualquer variável
+com aquele nome no programa (parâmetros e resultados de chamadas podem ser
+qualquer coisa). É conservador, mas pega contadores e acumuladores.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from itertools import product
+
+from src.parser.ast import (
+    Program, VarDecl, FuncDecl, Param,
+    Block, AssignStmt, IfStmt, WhileStmt,
+    ReturnStmt, PrintStmt, ExprStmt,
+    BinaryExpr, UnaryExpr, LiteralExpr,
+    VarExpr, CallExpr
+)
+from src.lexer.tokens import TokenType
+from src.executor.runtime import (
+    BINARY_OPERATORS, UNARY_OPERATORS, OPERATOR_ERRORS, RECURSION_LIMIT,
+    literal_value, encode_string,
+)
+from .nodes import children, count_nodes
+
+SWAP = int(TokenType.SWAP)
+PLUS = int(TokenType.PLUS)
+MINUS = int(TokenType.MINUS)
+MULTIPLY = int(TokenType.MULTIPLY)
+FLOOR_DIV = int(TokenType.FLOOR_DIV)
+POWER = int(TokenType.POWER)
+
+# Resultados maiores que isso ficam para a execução (não incham a AST)
+MAX_STRING = 4096
+MAX_INT_BITS = 4096
+
+NONE = type(None)
+ANY = frozenset((int, float, bool, str, NONE))
+INT = frozenset((int,))
+NUMBER = frozenset((int, float))
+NUMBER_OR_STRING = frozenset((int, float, str))
+
+
+# ==========================
+# Tipos
+# ==========================
+def _result_types():
+    """Tipos do resultado de cada operador para cada par de tipos de operando."""
+    samples = {int: 3, float: 1.5, bool: True, str: 'a', NONE: None}
+    binary = {}
+    for kind, function in BINARY_OPERATORS.items():
+        for left, right in product(samples, repeat=2):
+            try:
+                result = {type(function(samples[left], samples[right]))}
+            except OPERATOR_ERRORS:
+                result = set()
+            if kind == POWER and left in (int, bool) and right in (int, bool):
+                result.add(float)  # expoente negativo
+            binary[kind, left, right] = frozenset(result)
+    unary = {}
+    for kind, function in UNARY_OPERATORS.items():
+        for operand in samples:
+            try:
+                unary[kind, operand] = frozenset((type(function(samples[operand])),))
+            except OPERATOR_ERRORS:
+                unary[kind, operand] = frozenset()
+    return binary, unary
+
+
+_BINARY_TYPES, _UNARY_TYPES = _result_types()
+
+
+def static_type(expr, variables: dict) -> frozenset:
+    """Tipos que `expr` pode produzir (sem contar os casos em que dá erro)."""
+    kind = type(expr)
+    if kind is LiteralExpr:
+        return frozenset((type(literal_value(expr.value)),))
+    if kind is VarExpr:
+        return variables.get(expr.name.value, ANY)
+    if kind is BinaryExpr:
+        op = expr.op.kind
+        if op == SWAP:
+            return ANY
+        left = static_type(expr.left, variables)
+        right = static_type(expr.right, variables)
+        result = frozenset()
+        for pair in product(left, right):
+            result |= _BINARY_TYPES[(op,) + pair]
+        return result
+    if kind is UnaryExpr:
+        result = frozenset()
+        for operand in static_type(expr.right, variables):
+            result |= _UNARY_TYPES[expr.op.kind, operand]
+        return result
+    return ANY
+
+
+def variable_types(program: Program) -> dict:
+    """Tipos possíveis de cada nome de variável (ponto fixo sobre as atribuições)."""
+    assignments = []  # (nome, expressão ou None para `var x;`)
+    swaps = []
+    variables = {}
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        kind = type(node)
+        if kind is VarDecl:
+            assignments.append((node.name.value, node.init_expr))
+        elif kind is AssignStmt and type(node.target) is VarExpr:
+            assignments.append((node.target.name.value, node.value))
+        elif kind is Param:
+            variables[node.name.value] = ANY
+        elif kind is ExprStmt and type(node.expr) is BinaryExpr and node.expr.op.kind == SWAP:
+            left, right = node.expr.left, node.expr.right
+            if type(left) is VarExpr and type(right) is VarExpr:
+                swaps.append((left.name.value, right.name.value))
+        stack.extend(children(node))
+
+    for name, _ in assignments:
+        variables.setdefault(name, frozenset())
+    changed = True
+    while changed:
+        changed = False
+        for name, expr in assignments:
+            new = frozenset((NONE,)) if expr is None else static_type(expr, variables)
+            if not new <= variables[name]:
+                variables[name] = variables[name] | new
+                changed = True
+        for left, right in swaps:
+            union = variables.get(left, ANY) | variables.get(right, ANY)
+            if variables.get(left) != union or variables.get(right) != union:
+                variables[left] = variables[right] = union
+                changed = True
+    return variables
+
+
+# ==========================
+# Passada
+# ==========================
+@dataclass(slots=True)
+class FoldStats:
+    folded: int = 0          # operações calculadas em tempo de compilação
+    identities: int = 0      # operações removidas por identidade algébrica
+    nodes_before: int = 0
+    nodes_after: int = 0
+
+    @property
+    def eliminated(self) -> int:
+        return self.nodes_before - self.nodes_after
+
+
+# Identidades com o literal inteiro à direita ou à esquerda: (operador, valor) -> tipos
+# de `x` para os quais a operação devolve o próprio `x`
+_RIGHT_IDENTITIES = {
+    (PLUS, 0): INT,
+    (MINUS, 0): NUMBER,
+    (MULTIPLY, 1): NUMBER_OR_STRING,
+    (FLOOR_DIV, 1): INT,
+    (POWER, 1): NUMBER,
+}
+_LEFT_IDENTITIES = {
+    (PLUS, 0): INT,
+    (MULTIPLY, 1): NUMBER_OR_STRING,
+}
+
+
+def _too_big(kind: int, left, right) -> bool:
+    """Operações cujo resultado seria grande demais para virar literal."""
+    if kind == POWER and type(left) in (int, bool) and type(right) in (int, bool):
+        return right > 0 and abs(left) > 1 and left.bit_length() * right > MAX_INT_BITS
+    if kind == MULTIPLY:
+        if type(left) is str and type(right) in (int, bool):
+            return len(left) * right > MAX_STRING
+        if type(right) is str and type(left) in (int, bool):
+            return len(right) * left > MAX_STRING
+    return False
+
+
+def _literal(value) -> LiteralExpr | None:
+    """LiteralExpr com o valor de execução `value`, ou None se for grande demais."""
+    if type(value) is str:
+        return LiteralExpr(encode_string(value)) if len(value) <= MAX_STRING else None
+    if type(value) is int and value.bit_length() > MAX_INT_BITS:
+        return None
+    return LiteralExpr(value)
+
+
+class ConstantFolder:
+    def __init__(self):
+        self.stats = FoldStats()
+        self.variables = {}
+
+    def fold(self, program: Program) -> Program:
+        self.stats.nodes_before += count_nodes(program)
+        self.variables = variable_types(program)
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, RECURSION_LIMIT))
+        try:
+            result = Program([self._statement(decl) for decl in program.declarations])
+        finally:
+            sys.setrecursionlimit(limit)
+        self.stats.nodes_after += count_nodes(result)
+        return result
+
+    # ==========================
+    # Statements
+    # ==========================
+    def _statement(self, node):
+        kind = type(node)
+        if kind is VarDecl:
+            init = None if node.init_expr is None else self._expression(node.init_expr)
+            return VarDecl(node.var_token, node.name, init)
+        if kind is AssignStmt:
+            return AssignStmt(node.target, self._expression(node.value))
+        if kind is PrintStmt:
+            return PrintStmt(self._expression(node.value))
+        if kind is ExprStmt:
+            expr = node.expr
+            if type(expr) is BinaryExpr and expr.op.kind == SWAP:
+                return node
+            return ExprStmt(self._expression(expr))
+        if kind is IfStmt:
+            return IfStmt(self._expression(node.condition), self._statement(node.then_branch),
+                          None if node.else_branch is None else self._statement(node.else_branch))
+        if kind is WhileStmt:
+            return WhileStmt(self._expression(node.condition), self._statement(node.body))
+        if kind is Block:
+            return Block([self._statement(statement) for statement in node.statements])
+        if kind is ReturnStmt:
+            return ReturnStmt(None if node.value is None else self._expression(node.value))
+        if kind is FuncDecl:
+            return FuncDecl(node.func_token, node.name, node.params, self._statement(node.body))
+        return node
+
+    # ==========================
+    # Expressões
+    # ==========================
+    def _expression(self, node):
+        kind = type(node)
+        if kind is BinaryExpr:
+            return self._binary(node)
+        if kind is UnaryExpr:
+            return self._unary(node)
+        if kind is CallExpr:
+            return CallExpr(node.callee, [self._expression(arg) for arg in node.args])
+        return node
+
+    def _binary(self, node: BinaryExpr):
+        kind = node.op.kind
+        if kind == SWAP:
+            # erro de compilação do backend: fica como está
+            return node
+        left = self._expression(node.left)
+        right = self._expression(node.right)
+        left_literal = type(left) is LiteralExpr
+        right_literal = type(right) is LiteralExpr
+
+        if left_literal and right_literal:
+            a, b = literal_value(left.value), literal_value(right.value)
+            if not _too_big(kind, a, b):
+                try:
+                    folded = _literal(BINARY_OPERATORS[kind](a, b))
+                except OPERATOR_ERRORS:
+                    folded = None
+                if folded is not None:
+                    self.stats.folded += 1
+                    return folded
+        elif right_literal and self._is_identity(_RIGHT_IDENTITIES, kind, right, left):
+            self.stats.identities += 1
+            return left
+        elif left_literal and self._is_identity(_LEFT_IDENTITIES, kind, left, right):
+            self.stats.identities += 1
+            return right
+
+        if left is node.left and right is node.right:
+            return node
+        return BinaryExpr(left, node.op, right)
+
+    def _is_identity(self, table: dict, kind: int, literal: LiteralExpr, other) -> bool:
+        value = literal.value
+        if type(value) is not int:
+            return False
+        types = table.get((kind, value))
+        return types is not None and static_type(other, self.variables) <= types
+
+    def _unary(self, node: UnaryExpr):
+        kind = node.op.kind
+        right = self._expression(node.right)
+        if type(right) is LiteralExpr:
+            try:
+                folded = _literal(UNARY_OPERATORS[kind](literal_value(right.value)))
+            except OPERATOR_ERRORS:
+                folded = None
+            if folded is not None:
+                self.stats.folded += 1
+                return folded
+        elif kind == PLUS and static_type(right, self.variables) <= NUMBER:
+            self.stats.identities += 1
+            return right
+        elif (kind == MINUS and type(right) is UnaryExpr and right.op.kind == MINUS
+              and static_type(right.right, self.variables) <= NUMBER):
+            # - -x (com x booleano daria inteiro)
+            self.stats.identities += 2
+            return right.right
+        if right is node.right:
+            return node
+        return UnaryExpr(node.op, right)
+
+
+def fold_constants(program: Program):
+    """Devolve (programa dobrado, FoldStats)."""
+    folder = ConstantFolder()
+    return folder.fold(program), folder.stats
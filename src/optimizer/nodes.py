@@ -0,0 +1,34 @@
+# src/optimizer/nodes.py
+"""Percurso genérico da AST usado pelas passadas de otimização."""
+
+from src.lexer.lexer import Token
+
+# Campos de cada classe da AST (dataclass preserva a ordem de declaração)
+_FIELDS = {}
+
+
+def children(node):
+    """Filhos de um nó da AST (nós, não tokens), na ordem dos campos."""
+    names = _FIELDS.get(type(node))
+    if names is None:
+        names = _FIELDS[type(node)] = tuple(
+            name for name in node.__dataclass_fields__ if name != 'spans')
+    result = []
+    for name in names:
+        value = getattr(node, name)
+        if isinstance(value, list):
+            result.extend(value)
+        elif value is not None and not isinstance(value, (Token, int, float, str)):
+            result.append(value)
+    return result
+
+
+def count_nodes(root) -> int:
+    """Número de nós da AST na subárvore (pilha explícita)."""
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(children(node))
+    return count
@@ -0,0 +1,103 @@
+# src/optimizer/purity.py
+"""
+Análise de pureza das funções de topo.
+
+Uma função é pura quando o resultado depende só dos argumentos e a chamada
+não tem efeito visível, ou seja, quando pode ser trocada por um resultado
+guardado (memoização, ver executor/memo.py). Ela deixa de ser pura se:
+
+- tem `print`;
+- atribui (ou troca com `<->`) uma variável global;
+- lê uma variável global (o valor pode mudar entre chamadas);
+- chama uma função impura ou que não existe.
+
+Erros de execução não contam: com os mesmos argumentos uma função pura
+falha sempre do mesmo jeito, e resultados só são guardados quando a chamada
+termina normalmente.
+"""
+
+from __future__ import annotations
+
+from src.parser.ast import (
+    Program, VarDecl, FuncDecl,
+    Block, AssignStmt, PrintStmt, ExprStmt,
+    BinaryExpr, VarExpr, CallExpr
+)
+from src.lexer.tokens import TokenType
+from .nodes import children
+
+SWAP = int(TokenType.SWAP)
+
+
+class _FunctionFacts:
+    """O que a análise local descobriu sobre o corpo de uma função."""
+    __slots__ = ('impure', 'callees')
+
+    def __init__(self):
+        self.impure = False
+        self.callees = set()
+
+
+def _local_facts(decl: FuncDecl) -> _FunctionFacts:
+    facts = _FunctionFacts()
+    scopes = [{param.name.value for param in decl.params}]
+
+    def is_local(name: str) -> bool:
+        return any(name in scope for scope in scopes)
+
+    def visit(node):
+        if facts.impure:
+            return
+        kind = type(node)
+        if kind is PrintStmt or kind is FuncDecl:
+            facts.impure = True
+        elif kind is Block:
+            scopes.append(set())
+            for statement in node.statements:
+                visit(statement)
+            scopes.pop()
+        elif kind is VarDecl:
+            if node.init_expr is not None:
+                visit(node.init_expr)
+            scopes[-1].add(node.name.value)
+        elif kind is AssignStmt:
+            if not is_local(node.target.name.value):
+                facts.impure = True
+            visit(node.value)
+        elif kind is ExprStmt and type(node.expr) is BinaryExpr and node.expr.op.kind == SWAP:
+            for operand in (node.expr.left, node.expr.right):
+                if type(operand) is not VarExpr or not is_local(operand.name.value):
+                    facts.impure = True
+        elif kind is VarExpr:
+            if not is_local(node.name.value):
+                facts.impure = True
+        elif kind is CallExpr:
+            facts.callees.add(node.callee.value)
+            for arg in node.args:
+                visit(arg)
+        else:
+            for child in children(node):
+                visit(child)
+
+    visit(decl.body)
+    return facts
+
+
+def pure_functions(program: Program) -> set:
+    """Nomes das funções de topo puras."""
+    facts = {}
+    for decl in program.declarations:
+        if type(decl) is FuncDecl:
+            name = decl.name.value
+            # nome repetido é erro de compilação: não vale a pena analisar
+            facts[name] = None if name in facts else _local_facts(decl)
+
+    pure = {name for name, fact in facts.items() if fact is not None and not fact.impure}
+    changed = True
+    while changed:
+        changed = False
+        for name in list(pure):
+            if not facts[name].callees <= pure:
+                pure.discard(name)
+                changed = True
+    return pure
@@ -0,0 +1,176 @@
+# src/optimizer/resolver.py
+"""
+Resolução de escopo: liga cada uso de variável à sua declaração.
+
+Cada Program, FuncDecl e Block ganha uma tabela de escopo (nome -> slot, na
+ordem de declaração; parâmetros ocupam os primeiros slots da função). Cada
+VarDecl, VarExpr (inclusive o alvo de uma atribuição e os operandos de
+`<->`) recebe a posição `(profundidade, slot)`: quantos escopos subir a
+partir do mais interno e o índice dentro dele. Com isso um executor guarda
+cada escopo numa lista e acessa `escopos[-1 - profundidade][slot]`, sem
+procurar nomes em dicts.
+
+As regras são as dos backends: uma declaração só vale depois dela (o
+inicializador de `var x = x;` ainda vê o `x` de fora), declarar de novo no
+mesmo escopo reaproveita o slot, e funções enxergam as globais declaradas
+em qualquer ponto do topo do programa (elas só rodam quando chamadas).
+
+Na mesma passada são coletados os nomes não declarados (variáveis e
+funções) e as declarações que sombreiam outra de um escopo de fora.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from src.lexer.lexer import Token
+from src.parser.ast import (
+    Program, VarDecl, FuncDecl, Block, AssignStmt, VarExpr, CallExpr
+)
+from .nodes import children
+
+
+class Scope:
+    """Tabela de um escopo léxico."""
+    __slots__ = ('kind', 'parent', 'slots', 'tokens')
+
+    def __init__(self, kind: str, parent: Optional['Scope']):
+        self.kind = kind            # 'programa', 'função' ou 'bloco'
+        self.parent = parent
+        self.slots: Dict[str, int] = {}
+        self.tokens: List[Token] = []  # token da declaração de cada slot
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def __repr__(self) -> str:
+        return f"Scope({self.kind}, {list(self.slots)})"
+
+
+class Resolution:
+    """Resultado da resolução (válido enquanto a AST resolvida existir)."""
+
+    def __init__(self, program: Program):
+        self.program = program
+        self.scopes: Dict[int, Scope] = {}                # id(nó) -> escopo que ele abre
+        self.locations: Dict[int, Tuple[int, int]] = {}   # id(nó) -> (profundidade, slot)
+        self.undeclared: List[Token] = []                 # variáveis sem declaração visível
+        self.undeclared_functions: List[Token] = []
+        self.shadowed: List[Tuple[Token, Token]] = []     # (declaração, declaração sombreada)
+
+    def scope(self, node) -> Optional[Scope]:
+        """Escopo aberto por um Program, FuncDecl ou Block."""
+        return self.scopes.get(id(node))
+
+    def location(self, node) -> Optional[Tuple[int, int]]:
+        """(profundidade, slot) de um VarDecl ou VarExpr; None se não declarado."""
+        return self.locations.get(id(node))
+
+
+class ScopeResolver:
+    def __init__(self):
+        self.result: Optional[Resolution] = None
+        self._scope: Optional[Scope] = None
+        self._functions = set()
+
+    def resolve(self, program: Program) -> Resolution:
+        self.result = Resolution(program)
+        self._functions = {decl.name.value for decl in program.declarations
+                           if type(decl) is FuncDecl}
+        self._open(program, 'programa')
+        functions = []
+        for decl in program.declarations:
+            if type(decl) is FuncDecl:
+                functions.append(decl)
+            else:
+                self._visit(decl)
+        # funções por último: enxergam todas as globais do programa
+        for decl in functions:
+            self._function(decl)
+        self._scope = None
+        return self.result
+
+    # ==========================
+    # Escopos
+    # ==========================
+    def _open(self, node, kind: str) -> Scope:
+        scope = self._scope = Scope(kind, self._scope)
+        self.result.scopes[id(node)] = scope
+        return scope
+
+    def _declare(self, token: Token, reuse: bool = True) -> int:
+        scope = self._scope
+        name = token.value
+        slot = scope.slots.get(name)
+        if slot is not None and reuse:
+            return slot
+        if slot is None:
+            outer = self._find(name, scope.parent)
+            if outer is not None:
+                found, _ = outer
+                self.result.shadowed.append((token, found.tokens[found.slots[name]]))
+        slot = scope.slots[name] = len(scope.tokens)
+        scope.tokens.append(token)
+        return slot
+
+    @staticmethod
+    def _find(name: str, scope: Optional[Scope]):
+        """(escopo, profundidade relativa a `scope`) em que `name` foi declarado."""
+        depth = 0
+        while scope is not None:
+            if name in scope.slots:
+                return scope, depth
+            scope = scope.parent
+            depth += 1
+        return None
+
+    def _reference(self, node: VarExpr):
+        name_tok = node.name
+        found = self._find(name_tok.value, self._scope)
+        if found is None:
+            self.result.undeclared.append(name_tok)
+            return
+        scope, depth = found
+        self.result.locations[id(node)] = (depth, scope.slots[name_tok.value])
+
+    # ==========================
+    # Nós
+    # ==========================
+    def _function(self, node: FuncDecl):
+        enclosing = self._scope
+        self._open(node, 'função')
+        for param in node.params:
+            # cada parâmetro tem o slot da sua posição (repetido: vale o último)
+            self._declare(param.name, reuse=False)
+        self._visit(node.body)
+        self._scope = enclosing
+
+    def _visit(self, node):
+        kind = type(node)
+        if kind is VarExpr:
+            self._reference(node)
+        elif kind is VarDecl:
+            if node.init_expr is not None:
+                self._visit(node.init_expr)
+            self.result.locations[id(node)] = (0, self._declare(node.name))
+        elif kind is AssignStmt:
+            self._visit(node.value)
+            self._visit(node.target)
+        elif kind is Block:
+            enclosing = self._scope
+            self._open(node, 'bloco')
+            for statement in node.statements:
+                self._visit(statement)
+            self._scope = enclosing
+        elif kind is FuncDecl:
+            # função fora do topo é erro nos backends; resolvida assim mesmo
+            self._function(node)
+        else:
+            if kind is CallExpr and node.callee.value not in self._functions:
+                self.result.undeclared_functions.append(node.callee)
+            for child in children(node):
+                self._visit(child)
+
+
+def resolve_scopes(program: Program) -> Resolution:
+    return ScopeResolver().resolve(program)
@@ -0,0 +1,330 @@
+# src/parser/arena.py
+"""
+AST em arena: o programa inteiro em arrays tipados, sem um objeto por nó.
+
+Cada nó é um id inteiro (índice nos arrays paralelos):
+
+    kinds[id]        tipo do nó (NodeKind)
+    tokens[id]       índice do token principal no TokenBuffer (-1 se não há);
+                     em LITERAL é o índice do valor em `constants`
+    child_start[id]  início dos filhos em `children`
+    child_end[id]    fim (exclusivo) dos filhos em `children`
+
+Os filhos de um nó ficam contíguos em `children`, na ordem dos campos da
+classe correspondente em ast.py (campos opcionais ausentes são omitidos). Os
+nós são gravados em pós-ordem, então a raiz (`root`) é o último.
+
+A arena é montada uma declaração de topo por vez: o Parser monta a AST de
+objetos da declaração, ela é copiada para os arrays e descartada. `view()`
+devolve um `NodeView` para percorrer a árvore e `to_ast()` reconstrói a AST
+de objetos.
+"""
+
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from enum import IntEnum, auto
+from typing import List, Optional
+
+from src.lexer.buffer import TokenBuffer
+from src.lexer.lexer import Token
+from .ast import (
+    Program, VarDecl, FuncDecl, Param,
+    Block, AssignStmt, IfStmt, WhileStmt,
+    ReturnStmt, PrintStmt, ExprStmt,
+    BinaryExpr, UnaryExpr, LiteralExpr,
+    VarExpr, CallExpr
+)
+from .parser import Parser
+
+NO_TOKEN = -1
+
+
+class NodeKind(IntEnum):
+    PROGRAM = auto()
+    VAR_DECL = auto()
+    PARAM = auto()
+    FUNC_DECL = auto()
+    BLOCK = auto()
+    ASSIGN = auto()
+    IF = auto()
+    WHILE = auto()
+    RETURN = auto()
+    PRINT = auto()
+    EXPR_STMT = auto()
+    BINARY = auto()
+    UNARY = auto()
+    LITERAL = auto()
+    VAR = auto()
+    CALL = auto()
+
+
+@dataclass(slots=True)
+class IndexedToken(Token):
+    """Token que sabe a própria posição no TokenBuffer (usado só durante a montagem)."""
+    index: int = NO_TOKEN
+
+
+class _IndexedTokens:
+    """Adapta um TokenBuffer para o Parser entregar IndexedTokens."""
+    def __init__(self, buffer: TokenBuffer):
+        self.buffer = buffer
+
+    def reader(self):
+        next_token = self.buffer.reader()
+        last = len(self.buffer) - 1
+        position = 0
+
+        def next_indexed() -> IndexedToken:
+            nonlocal position
+            tok = next_token()
+            index = position
+            if index < last:
+                position = index + 1
+            return IndexedToken(tok.type, tok.value, tok.line, tok.column, tok.kind, index)
+
+        return next_indexed
+
+
+def _optional(node):
+    return [] if node is None else [node]
+
+
+# classe da AST -> (NodeKind, campo com o token principal, filhos na ordem)
+_LAYOUT = {
+    Program: (NodeKind.PROGRAM, None, lambda n: n.declarations),
+    VarDecl: (NodeKind.VAR_DECL, 'name', lambda n: _optional(n.init_expr)),
+    Param: (NodeKind.PARAM, 'name', lambda n: ()),
+    FuncDecl: (NodeKind.FUNC_DECL, 'name', lambda n: [*n.params, n.body]),
+    Block: (NodeKind.BLOCK, None, lambda n: n.statements),
+    AssignStmt: (NodeKind.ASSIGN, None, lambda n: (n.target, n.value)),
+    IfStmt: (NodeKind.IF, None,
+             lambda n: [n.condition, n.then_branch, *_optional(n.else_branch)]),
+    WhileStmt: (NodeKind.WHILE, None, lambda n: (n.condition, n.body)),
+    ReturnStmt: (NodeKind.RETURN, None, lambda n: _optional(n.value)),
+    PrintStmt: (NodeKind.PRINT, None, lambda n: (n.value,)),
+    ExprStmt: (NodeKind.EXPR_STMT, None, lambda n: (n.expr,)),
+    BinaryExpr: (NodeKind.BINARY, 'op', lambda n: (n.left, n.right)),
+    UnaryExpr: (NodeKind.UNARY, 'op', lambda n: (n.right,)),
+    LiteralExpr: (NodeKind.LITERAL, None, lambda n: ()),
+    VarExpr: (NodeKind.VAR, 'name', lambda n: ()),
+    CallExpr: (NodeKind.CALL, 'callee', lambda n: n.args),
+}
+
+
+class AstArena:
+    def __init__(self, buffer: TokenBuffer):
+        self.buffer = buffer
+        self.kinds = array('B')
+        self.tokens = array('i')
+        self.child_start = array('I')
+        self.child_end = array('I')
+        self.children = array('I')
+        self.constants: List = []
+        self._constant_ids = {}
+        self.root = NO_TOKEN
+
+    @classmethod
+    def from_buffer(cls, buffer: TokenBuffer, parser_class=Parser) -> 'AstArena':
+        """Faz o parse de `buffer` direto para a arena (uma declaração por vez)."""
+        arena = cls(buffer)
+        parser = parser_class(tokens=_IndexedTokens(buffer))
+        declarations = [arena.add_tree(decl) for decl in parser.iter_declarations()]
+        arena.root = arena._add(NodeKind.PROGRAM, NO_TOKEN, declarations)
+        arena._constant_ids = None  # só é necessário durante a montagem
+        return arena
+
+    @classmethod
+    def from_source(cls, source: str, parser_class=Parser) -> 'AstArena':
+        return cls.from_buffer(TokenBuffer.from_source(source), parser_class)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    # ==========================
+    # Montagem
+    # ==========================
+    def _add(self, kind: int, token: int, child_ids) -> int:
+        node_id = len(self.kinds)
+        self.kinds.append(kind)
+        self.tokens.append(token)
+        self.child_start.append(len(self.children))
+        self.children.extend(child_ids)
+        self.child_end.append(len(self.children))
+        return node_id
+
+    def _constant(self, value) -> int:
+        # type(value) na chave separa True de 1 e 1 de 1.0
+        key = (type(value), value)
+        index = self._constant_ids.get(key)
+        if index is None:
+            index = len(self.constants)
+            self._constant_ids[key] = index
+            self.constants.append(value)
+        return index
+
+    def add_tree(self, root) -> int:
+        """Copia uma subárvore de objetos (com IndexedTokens) para a arena; retorna o id da raiz."""
+        stack = [(root, None)]
+        ids: List[int] = []
+        while stack:
+            node, children = stack.pop()
+            kind, token_field, layout = _LAYOUT[type(node)]
+            if children is None:
+                children = list(layout(node))
+                stack.append((node, children))
+                stack.extend((child, None) for child in reversed(children))
+                continue
+            count = len(children)
+            child_ids = ids[len(ids) - count:]
+            del ids[len(ids) - count:]
+            if kind == NodeKind.LITERAL:
+                token = self._constant(node.value)
+            elif token_field is not None:
+                token = getattr(node, token_field).index
+            else:
+                token = NO_TOKEN
+            ids.append(self._add(kind, token, child_ids))
+        return ids[0]
+
+    # ==========================
+    # Leitura
+    # ==========================
+    def kind(self, node_id: int) -> NodeKind:
+        return NodeKind(self.kinds[node_id])
+
+    def child_ids(self, node_id: int) -> array:
+        return self.children[self.child_start[node_id]:self.child_end[node_id]]
+
+    def token(self, node_id: int) -> Optional[Token]:
+        index = self.tokens[node_id]
+        if index == NO_TOKEN or self.kinds[node_id] == NodeKind.LITERAL:
+            return None
+        return self.buffer[index]
+
+    def value(self, node_id: int):
+        """Valor do literal, ou lexema do token principal (None se o nó não tem token)."""
+        index = self.tokens[node_id]
+        if self.kinds[node_id] == NodeKind.LITERAL:
+            return self.constants[index]
+        if index == NO_TOKEN:
+            return None
+        return self.buffer.value(index)
+
+    def view(self, node_id: Optional[int] = None) -> 'NodeView':
+        return NodeView(self, self.root if node_id is None else node_id)
+
+    def walk(self, node_id: Optional[int] = None):
+        """Ids em pré-ordem, com pilha explícita."""
+        stack = [self.root if node_id is None else node_id]
+        children, child_start, child_end = self.children, self.child_start, self.child_end
+        while stack:
+            current = stack.pop()
+            yield current
+            stack.extend(reversed(children[child_start[current]:child_end[current]]))
+
+    def to_ast(self, node_id: Optional[int] = None):
+        """Reconstrói a AST de objetos (igual à produzida pelo Parser)."""
+        root = self.root if node_id is None else node_id
+        stack = [(root, False)]
+        built: List = []
+        while stack:
+            current, ready = stack.pop()
+            start, end = self.child_start[current], self.child_end[current]
+            if not ready:
+                stack.append((current, True))
+                stack.extend((child, False) for child in reversed(self.children[start:end]))
+                continue
+            count = end - start
+            args = built[len(built) - count:]
+            del built[len(built) - count:]
+            built.append(self._build(current, args))
+        return built[0]
+
+    def _build(self, node_id: int, c: List):
+        kind = self.kinds[node_id]
+        t = self.tokens[node_id]
+        tok = self.buffer.__getitem__
+        if kind == NodeKind.PROGRAM:
+            return Program(c)
+        if kind == NodeKind.VAR_DECL:
+            # 'var' vem sempre logo antes do nome
+            return VarDecl(tok(t - 1), tok(t), c[0] if c else None)
+        if kind == NodeKind.PARAM:
+            return Param(tok(t))
+        if kind == NodeKind.FUNC_DECL:
+            return FuncDecl(tok(t - 1), tok(t), c[:-1], c[-1])
+        if kind == NodeKind.BLOCK:
+            return Block(c)
+        if kind == NodeKind.ASSIGN:
+            return AssignStmt(c[0], c[1])
+        if kind == NodeKind.IF:
+            return IfStmt(c[0], c[1], c[2] if len(c) == 3 else None)
+        if kind == NodeKind.WHILE:
+            return WhileStmt(c[0], c[1])
+        if kind == NodeKind.RETURN:
+            return ReturnStmt(c[0] if c else None)
+        if kind == NodeKind.PRINT:
+            return PrintStmt(c[0])
+        if kind == NodeKind.EXPR_STMT:
+            return ExprStmt(c[0])
+        if kind == NodeKind.BINARY:
+            return BinaryExpr(c[0], tok(t), c[1])
+        if kind == NodeKind.UNARY:
+            return UnaryExpr(tok(t), c[0])
+        if kind == NodeKind.LITERAL:
+            return LiteralExpr(self.constants[t])
+        if kind == NodeKind.VAR:
+            return VarExpr(tok(t))
+        if kind == NodeKind.CALL:
+            return CallExpr(tok(t), c)
+        raise ValueError(f"Tipo de nó desconhecido: {kind}")
+
+
+class NodeView:
+    """Visão leve de um nó da arena: (arena, id), sem copiar dados."""
+    __slots__ = ('arena', 'id')
+
+    def __init__(self, arena: AstArena, node_id: int):
+        self.arena = arena
+        self.id = node_id
+
+    @property
+    def kind(self) -> NodeKind:
+        return self.arena.kind(self.id)
+
+    @property
+    def token(self) -> Optional[Token]:
+        return self.arena.token(self.id)
+
+    @property
+    def value(self):
+        return self.arena.value(self.id)
+
+    @property
+    def children(self) -> List['NodeView']:
+        arena = self.arena
+        return [NodeView(arena, child) for child in arena.child_ids(self.id)]
+
+    def __len__(self):
+        return self.arena.child_end[self.id] - self.arena.child_start[self.id]
+
+    def __getitem__(self, index: int) -> 'NodeView':
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice de filho fora do nó")
+        return NodeView(self.arena, self.arena.children[self.arena.child_start[self.id] + index])
+
+    def __iter__(self):
+        return iter(self.children)
+
+    def __eq__(self, other):
+        return (isinstance(other, NodeView) and self.arena is other.arena
+                and self.id == other.id)
+
+    def __hash__(self):
+        return hash((id(self.arena), self.id))
+
+    def __repr__(self):
+        return f"NodeView({self.kind.name}, id={self.id}, value={self.value!r})"
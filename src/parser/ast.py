@@ -1,6 +1,6 @@
 # src/parser/ast.py
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Union
 from src.lexer.lexer import Token
 
@@ -9,7 +9,14 @@ from src.lexer.lexer import Token
 # 1. Nó base da AST
 # ================================
 class ASTNode:
-    """Nó base da AST. Guarda opcionalmente o token de origem."""
+    """
+    Nó base da AST. Guarda opcionalmente o token de origem.
+
+    Todos os nós usam __slots__ (dataclass(slots=True)): sem __dict__ por nó,
+    o que reduz bastante a memória de ASTs grandes.
+    """
+    __slots__ = ('token',)
+
     def __init__(self, token: Optional[Token] = None):
         self.token = token
 
@@ -17,25 +24,28 @@ class ASTNode:
 # ================================
 # 2. Nós de alto nível (programa, declarações)
 # ================================
-@dataclass
+@dataclass(slots=True)
 class Program(ASTNode):
     declarations: List[ASTNode]
+    # Trechos do source de cada declaração (preenchido por parser/incremental.py;
+    # não entra na comparação entre ASTs)
+    spans: Optional[list] = field(default=None, compare=False, repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class VarDecl(ASTNode):
     var_token: Token        # token 'var'
     name: Token             # IDENTIFIER
     init_expr: Optional['Expr']  # expressão de inicialização (pode ser None no futuro)
 
 
-@dataclass
+@dataclass(slots=True)
 class Param(ASTNode):
     """Parâmetro de função: só nome, sem tipo explícito."""
     name: Token  # IDENTIFIER
 
 
-@dataclass
+@dataclass(slots=True)
 class FuncDecl(ASTNode):
     func_token: Token           # token 'func'
     name: Token                 # IDENTIFIER
@@ -46,41 +56,41 @@ class FuncDecl(ASTNode):
 # ================================
 # 3. Comandos (statements)
 # ================================
-@dataclass
+@dataclass(slots=True)
 class Block(ASTNode):
     statements: List[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class AssignStmt(ASTNode):
     target: 'Expr'
     value: 'Expr'
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStmt(ASTNode):
     condition: 'Expr'
     then_branch: Block
     else_branch: Optional[Block]
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStmt(ASTNode):
     condition: 'Expr'
     body: Block
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStmt(ASTNode):
     value: Optional['Expr']
 
 
-@dataclass
+@dataclass(slots=True)
 class PrintStmt(ASTNode):
     value: 'Expr'
 
 
-@dataclass
+@dataclass(slots=True)
 class ExprStmt(ASTNode):
     """Expressão sozinha terminada por ';' (por exemplo: chamada de função)."""
     expr: 'Expr'
@@ -91,33 +101,33 @@ class ExprStmt(ASTNode):
 # ================================
 class Expr(ASTNode):
     """Base para expressões."""
-    pass
+    __slots__ = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryExpr(Expr):
     left: Expr
     op: Token       # operador: + - * / > < >= <= == etc.
     right: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryExpr(Expr):
     op: Token       # operador unário: + -
     right: Expr
 
 
-@dataclass
+@dataclass(slots=True)
 class LiteralExpr(Expr):
     value: Union[int, float, str, bool, None]
 
 
-@dataclass
+@dataclass(slots=True)
 class VarExpr(Expr):
     name: Token     # IDENTIFIER
 
 
-@dataclass
+@dataclass(slots=True)
 class CallExpr(Expr):
     callee: Token           # nome da função (IDENTIFIER)
     args: List[Expr]
\ No newline at end of file
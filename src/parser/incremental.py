@@ -0,0 +1,228 @@
+# src/parser/incremental.py
+"""
+Reparse incremental para o editor.
+
+`parse(source)` monta o Program guardando, em `program.spans`, o trecho do
+source de cada declaração de topo (DeclSpan). `reparse(program, source, edit)`
+aplica uma edição de texto e refaz o lex/parse só das declarações cujo trecho
+toca a edição:
+
+1. as declarações que terminam antes da edição são reaproveitadas como estão,
+   menos as que olharam um token à frente que a edição alcança (um `if` sem
+   `else` olha o token seguinte, que agora pode ser um `else`);
+2. o parse recomeça no fim da última delas e segue declaração por declaração
+   até chegar ao início (deslocado) de uma declaração antiga posterior à
+   edição — dali em diante o texto é o mesmo, então o resultado também é;
+3. as declarações reaproveitadas depois da edição têm linha/coluna dos seus
+   tokens e o trecho deslocados.
+
+O resultado é igual ao de `Parser(novo_source).parse()`. Os nós reaproveitados
+são os mesmos objetos do Program anterior (e seus tokens são ajustados no
+lugar), então o Program antigo não deve mais ser usado depois do reparse.
+"""
+
+from __future__ import annotations
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from src.lexer.buffer import TextEdit
+from src.lexer.lexer import Lexer, Token
+from .ast import Program, Block, IfStmt, WhileStmt
+from .parser import Parser, EOF
+
+
+@dataclass(slots=True)
+class DeclSpan:
+    start: int              # início do primeiro token da declaração
+    end: int                # fim (exclusivo) do último token
+    tokens: Tuple[Token, ...]  # tokens referenciados pela AST da declaração, em ordem
+
+
+class _SpanReader:
+    """Fonte de tokens para o Parser que lembra a posição dos tokens lidos."""
+    def __init__(self, lexer: Lexer):
+        self.lexer = lexer
+        self.current_start = self.current_end = self.previous_end = lexer.position
+
+    def reader(self):
+        next_span = self.lexer.next_span
+        token_from_span = self.lexer.token_from_span
+
+        def next_token() -> Token:
+            span = next_span()
+            self.previous_end = self.current_end
+            self.current_start = span[1]
+            self.current_end = span[2]
+            return token_from_span(*span)
+
+        return next_token
+
+
+# Campos de cada classe da AST, na ordem do source (dataclass preserva a declaração)
+_FIELDS = {}
+
+
+def _node_tokens(root) -> Tuple[Token, ...]:
+    """Tokens referenciados por uma subárvore, em pré-ordem (que é a ordem do source)."""
+    tokens = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Token):
+            tokens.append(node)
+            continue
+        names = _FIELDS.get(type(node))
+        if names is None:
+            names = _FIELDS[type(node)] = tuple(node.__dataclass_fields__)
+        children = []
+        for name in names:
+            value = getattr(node, name)
+            if isinstance(value, list):
+                children.extend(value)
+            elif value is not None and not isinstance(value, (int, float, str)):
+                children.append(value)
+        stack.extend(reversed(children))
+    return tuple(tokens)
+
+
+def _line_and_column(source: str, offset: int) -> Tuple[int, int]:
+    line = source.count('\n', 0, offset) + 1
+    column = offset - (source.rfind('\n', 0, offset) + 1) + 1
+    return line, column
+
+
+def _parse_from(source: str, offset: int, resync=None):
+    """
+    Faz o parse de declarações de topo a partir de `offset`. Antes de cada
+    declaração chama `resync(início)`; se ele devolver algo diferente de None,
+    o parse para ali e esse valor é retornado junto com o que foi lido.
+    """
+    lexer = Lexer(source)
+    lexer.position = offset
+    lexer.line, lexer.column = _line_and_column(source, offset)
+    spans_reader = _SpanReader(lexer)
+    parser = Parser(tokens=spans_reader)
+
+    declarations: List = []
+    spans: List[DeclSpan] = []
+    declarations_iter = parser.iter_declarations()
+    while parser.current_token.kind != EOF:
+        start = spans_reader.current_start
+        if resync is not None:
+            found = resync(start)
+            if found is not None:
+                return declarations, spans, found
+        decl = next(declarations_iter)
+        declarations.append(decl)
+        spans.append(DeclSpan(start, spans_reader.previous_end, _node_tokens(decl)))
+    return declarations, spans, None
+
+
+def parse(source: str) -> Program:
+    """Parse completo, guardando os trechos das declarações para `reparse`."""
+    declarations, spans, _ = _parse_from(source, 0)
+    return Program(declarations, spans)
+
+
+def reparse(program: Program, source: str, edit: TextEdit) -> Tuple[Program, str]:
+    """
+    Aplica `edit` a `source` (o texto de onde `program` veio) e devolve
+    (novo Program, novo source), refazendo só as declarações afetadas.
+    """
+    new_source = edit.apply(source)
+    spans = program.spans
+    if spans is None:
+        return parse(new_source), new_source
+
+    delta = len(edit.text) - (edit.end - edit.start)
+    # Primeira declaração que termina na edição ou depois dela (encostar conta:
+    # o texto inserido pode se juntar ao último token)
+    first = bisect_left(spans, edit.start, key=lambda span: span.end)
+    declarations = program.declarations
+    while first > 0 and _looks_ahead(declarations[first - 1]) \
+            and edit.start <= _next_token_end(source, spans[first - 1].end):
+        first -= 1
+    restart = spans[first - 1].end if first > 0 else 0
+
+    # Declarações antigas que começam depois da edição podem ser reaproveitadas
+    # se o parse novo chegar exatamente ao início delas (deslocado por delta)
+    after = bisect_left(spans, edit.end + 1, key=lambda span: span.start)
+
+    def resync(start: int):
+        old_start = start - delta
+        if old_start <= edit.end:
+            return None
+        index = bisect_left(spans, old_start, lo=after, key=lambda span: span.start)
+        if index < len(spans) and spans[index].start == old_start:
+            return index
+        return None
+
+    new_declarations, new_spans, reused_from = _parse_from(new_source, restart, resync)
+    if reused_from is None:
+        reused_from = len(spans)
+
+    _shift(source, new_source, edit, spans[reused_from:], delta)
+
+    return Program(
+        declarations[:first] + new_declarations + declarations[reused_from:],
+        spans[:first] + new_spans + spans[reused_from:],
+    ), new_source
+
+
+def _looks_ahead(decl) -> bool:
+    """
+    A declaração depende do token que vem depois dela: o último statement
+    aninhado (corpo do while, ramo else, fim de bloco) é um `if` sem else.
+    Na AST um statement solto e `{ statement }` são o mesmo Block, então
+    um `if` antes de `}` também conta; isso só custa reparsear uma
+    declaração a mais.
+    """
+    node = decl
+    while True:
+        kind = type(node)
+        if kind is IfStmt:
+            if node.else_branch is None:
+                return True
+            node = node.else_branch
+        elif kind is WhileStmt:
+            node = node.body
+        elif kind is Block and node.statements:
+            node = node.statements[-1]
+        else:
+            return False
+
+
+def _next_token_end(source: str, offset: int) -> int:
+    """Fim do primeiro token depois de `offset` (o lookahead do parser)."""
+    lexer = Lexer(source)
+    lexer.position = offset
+    return lexer.next_span()[2]
+
+
+def _shift(source: str, new_source: str, edit: TextEdit, spans: List[DeclSpan], delta: int):
+    """Desloca trechos e linha/coluna dos tokens das declarações depois da edição."""
+    if not spans:
+        return
+    old_line, old_column = _line_and_column(source, edit.end)
+    new_line, new_column = _line_and_column(new_source, edit.start + len(edit.text))
+    line_delta = new_line - old_line
+    column_delta = new_column - old_column
+
+    for span in spans:
+        span.start += delta
+        span.end += delta
+
+    if line_delta == 0 and column_delta == 0:
+        return
+    for span in spans:
+        tokens = span.tokens
+        if not tokens:
+            continue
+        if line_delta == 0 and tokens[0].line > old_line:
+            # só a linha da edição muda; as próximas declarações estão abaixo dela
+            break
+        for tok in tokens:
+            if tok.line == old_line:
+                tok.column += column_delta
+            tok.line += line_delta
@@ -0,0 +1,249 @@
+# src/parser/iterative.py
+"""
+Parser sem recursão na pilha do Python.
+
+`IterativeParser` aceita a mesma gramática e produz a mesma AST que `Parser`,
+mas cada regra que pode aninhar (blocos, statements, expressões) é um gerador:
+em vez de chamar a sub-regra, ele faz `yield` do gerador dela e recebe o
+resultado de volta. O laço de `_run` guarda esses geradores numa pilha
+explícita (lista), então a profundidade de aninhamento fica limitada só pela
+memória — `((((x))))`, `- - - x` ou blocos com 100 mil níveis funcionam em
+tempo e memória lineares.
+
+Regras folha (literais, nomes de variáveis, parâmetros) continuam sendo os
+métodos comuns herdados de `Parser`.
+"""
+
+from __future__ import annotations
+from typing import List, Optional
+
+from .ast import (
+    VarDecl, FuncDecl, Param,
+    Block, AssignStmt, IfStmt, WhileStmt,
+    ReturnStmt, PrintStmt, ExprStmt,
+    Expr, BinaryExpr, UnaryExpr, LiteralExpr,
+    VarExpr, CallExpr
+)
+from .parser import (
+    Parser, ParserError, BINARY_PRECEDENCE, RIGHT_ASSOCIATIVE, UNARY_PRECEDENCE,
+    KW_VAR, KW_FUNC, KW_IF, KW_ELSE, KW_WHILE, KW_RETURN, KW_PRINT,
+    IDENTIFIER, ASSIGN, PLUS, MINUS, SEMICOLON, COMMA,
+    LPAREN, RPAREN, LBRACE, RBRACE, EOF,
+)
+
+
+class IterativeParser(Parser):
+
+    def iter_declarations(self):
+        top_level = self._TOP_LEVEL_GEN
+        while self.current_token.kind != EOF:
+            rule = top_level.get(self.current_token.kind, IterativeParser._statement_gen)
+            yield self._run(rule(self))
+
+    @staticmethod
+    def _run(rule):
+        """
+        Executa um gerador de regra até o fim. Cada `yield` entrega o gerador
+        de uma sub-regra, que é empilhado; quando ele termina, o valor de
+        retorno é enviado de volta para quem o pediu.
+        """
+        stack = [rule]
+        value = None
+        while stack:
+            try:
+                child = stack[-1].send(value)
+            except StopIteration as done:
+                stack.pop()
+                value = done.value
+            else:
+                stack.append(child)
+                value = None
+        return value
+
+    # ==========================
+    # Declarações
+    # ==========================
+    def _var_decl_gen(self):
+        var_tok = self._consume(KW_VAR, "Esperado 'var' em declaração de variável")
+        name_tok = self._consume(IDENTIFIER, "Esperado identificador de variável após 'var'")
+        init_expr: Optional[Expr] = None
+        if self._match(ASSIGN):
+            init_expr = yield self._expression_gen()
+        self._consume(SEMICOLON, "Esperado ';' ao final da declaração de variável")
+        return VarDecl(var_tok, name_tok, init_expr)
+
+    def _func_decl_gen(self):
+        func_tok = self._consume(KW_FUNC, "Esperado 'func' em declaração de função")
+        name_tok = self._consume(IDENTIFIER, "Esperado nome da função após 'func'")
+        self._consume(LPAREN, "Esperado '(' após nome da função")
+        params: List[Param] = []
+        if not self._check(RPAREN):
+            params.append(self._param())
+            while self._match(COMMA):
+                params.append(self._param())
+        self._consume(RPAREN, "Esperado ')' após parâmetros da função")
+        body = yield self._block_gen()
+        return FuncDecl(func_tok, name_tok, params, body)
+
+    # ==========================
+    # Blocos e statements
+    # ==========================
+    def _block_gen(self):
+        self._consume(LBRACE, "Esperado '{' para iniciar bloco")
+        statements: List = []
+        while self.current_token.kind != RBRACE and self.current_token.kind != EOF:
+            statements.append((yield self._statement_gen()))
+        self._consume(RBRACE, "Esperado '}' para finalizar bloco")
+        return Block(statements)
+
+    def _statement_gen(self):
+        """Escolhe a regra pelo token atual e devolve o gerador dela (sem nível extra)."""
+        rule = self._STATEMENTS_GEN.get(self.current_token.kind,
+                                        IterativeParser._assign_or_expr_stmt_gen)
+        return rule(self)
+
+    def _empty_stmt_gen(self):
+        self._advance()
+        return ExprStmt(LiteralExpr(None))
+        yield  # gerador sem sub-regras
+
+    def _assign_or_expr_stmt_gen(self):
+        if self._check(IDENTIFIER):
+            ident_tok = self.current_token
+            self._advance()
+            if self._match(ASSIGN):
+                value = yield self._expression_gen()
+                self._consume(SEMICOLON, "Esperado ';' após atribuição")
+                return AssignStmt(VarExpr(ident_tok), value)
+            expr = yield self._finish_primary_from_ident_gen(ident_tok)
+            expr = yield self._expression_gen(0, expr)
+            self._consume(SEMICOLON, "Esperado ';' após expressão")
+            return ExprStmt(expr)
+
+        expr = yield self._expression_gen()
+        self._consume(SEMICOLON, "Esperado ';' após expressão")
+        return ExprStmt(expr)
+
+    def _if_stmt_gen(self):
+        self._consume(KW_IF)
+        self._consume(LPAREN, "Esperado '(' após 'if'")
+        cond = yield self._expression_gen()
+        self._consume(RPAREN, "Esperado ')' após condição do if")
+        then_branch = self._as_block((yield self._statement_gen()))
+        else_branch: Optional[Block] = None
+        if self._match(KW_ELSE):
+            else_branch = self._as_block((yield self._statement_gen()))
+        return IfStmt(cond, then_branch, else_branch)
+
+    def _while_stmt_gen(self):
+        self._consume(KW_WHILE)
+        self._consume(LPAREN, "Esperado '(' após 'while'")
+        cond = yield self._expression_gen()
+        self._consume(RPAREN, "Esperado ')' após condição do while")
+        body = self._as_block((yield self._statement_gen()))
+        return WhileStmt(cond, body)
+
+    def _return_stmt_gen(self):
+        self._consume(KW_RETURN)
+        if self._match(SEMICOLON):
+            return ReturnStmt(None)
+        value = yield self._expression_gen()
+        self._consume(SEMICOLON, "Esperado ';' após return")
+        return ReturnStmt(value)
+
+    def _print_stmt_gen(self):
+        self._consume(KW_PRINT)
+        self._consume(LPAREN, "Esperado '(' após 'print'")
+        value = yield self._expression_gen()
+        self._consume(RPAREN, "Esperado ')' após expressão em print")
+        self._consume(SEMICOLON, "Esperado ';' após print")
+        return PrintStmt(value)
+
+    # ==========================
+    # Expressões
+    # ==========================
+    def _expression_gen(self, min_precedence: int = 0, left: Optional[Expr] = None):
+        """Mesmo precedence climbing de `Parser._expression`, com sub-regras via yield."""
+        if left is None:
+            kind = self.current_token.kind
+            rule = self._PREFIX_GEN.get(kind)
+            if rule is not None:
+                left = yield rule(self)
+            else:
+                handler = self._PREFIX.get(kind)
+                if handler is None:
+                    tok = self.current_token
+                    raise ParserError(
+                        f"Esperado expressão, mas encontrado {tok.type}('{tok.value}') "
+                        f"na linha {tok.line}, coluna {tok.column}"
+                    )
+                left = handler(self)
+
+        op_tok = self.current_token
+        precedence = BINARY_PRECEDENCE.get(op_tok.kind)
+        while precedence is not None and precedence >= min_precedence:
+            self.current_token = self._next_token()
+            if op_tok.kind in RIGHT_ASSOCIATIVE:
+                right = yield self._expression_gen(precedence)
+            else:
+                right = yield self._expression_gen(precedence + 1)
+            left = BinaryExpr(left, op_tok, right)
+            op_tok = self.current_token
+            precedence = BINARY_PRECEDENCE.get(op_tok.kind)
+        return left
+
+    def _unary_gen(self):
+        op_tok = self.current_token
+        self._advance()
+        right = yield self._expression_gen(UNARY_PRECEDENCE)
+        return UnaryExpr(op_tok, right)
+
+    def _group_gen(self):
+        self._advance()
+        expr = yield self._expression_gen()
+        self._consume(RPAREN, "Esperado ')' após expressão")
+        return expr
+
+    def _identifier_gen(self):
+        ident_tok = self.current_token
+        self.current_token = self._next_token()
+        if self.current_token.kind != LPAREN:
+            return VarExpr(ident_tok)
+        return (yield self._finish_primary_from_ident_gen(ident_tok))
+
+    def _finish_primary_from_ident_gen(self, ident_tok):
+        if not self._match(LPAREN):
+            return VarExpr(ident_tok)
+        args: List[Expr] = []
+        if not self._check(RPAREN):
+            args.append((yield self._expression_gen()))
+            while self._match(COMMA):
+                args.append((yield self._expression_gen()))
+        self._consume(RPAREN, "Esperado ')' após argumentos de função")
+        return CallExpr(ident_tok, args)
+
+    # ==========================
+    # Tabelas de despacho (geradores)
+    # ==========================
+    _TOP_LEVEL_GEN = {
+        KW_FUNC: _func_decl_gen,
+        KW_VAR: _var_decl_gen,
+    }
+
+    _STATEMENTS_GEN = {
+        KW_VAR: _var_decl_gen,
+        KW_IF: _if_stmt_gen,
+        KW_WHILE: _while_stmt_gen,
+        KW_RETURN: _return_stmt_gen,
+        KW_PRINT: _print_stmt_gen,
+        LBRACE: _block_gen,
+        SEMICOLON: _empty_stmt_gen,
+    }
+
+    # Prefixos que aninham; literais usam Parser._PREFIX direto
+    _PREFIX_GEN = {
+        PLUS: _unary_gen,
+        MINUS: _unary_gen,
+        LPAREN: _group_gen,
+        IDENTIFIER: _identifier_gen,
+    }
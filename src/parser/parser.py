@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 from typing import List, Optional
-from src.lexer.lexer import Lexer, Token
+from src.lexer.lexer import Lexer, Token, KIND_DESCRIPTIONS
+from src.lexer.buffer import TokenBuffer
+from src.lexer.tokens import TokenType
 from .ast import (
     Program, VarDecl, FuncDecl, Param,
     Block, AssignStmt, IfStmt, WhileStmt,
@@ -11,40 +13,98 @@ from .ast import (
     VarExpr, CallExpr
 )
 
+# Tipos de token como int simples: ler TokenType.X a cada comparação é lento
+KW_VAR = int(TokenType.KW_VAR)
+KW_FUNC = int(TokenType.KW_FUNC)
+KW_IF = int(TokenType.KW_IF)
+KW_ELSE = int(TokenType.KW_ELSE)
+KW_WHILE = int(TokenType.KW_WHILE)
+KW_RETURN = int(TokenType.KW_RETURN)
+KW_PRINT = int(TokenType.KW_PRINT)
+IDENTIFIER = int(TokenType.IDENTIFIER)
+INTEGER = int(TokenType.INTEGER)
+FLOAT = int(TokenType.FLOAT)
+STRING = int(TokenType.STRING)
+ASSIGN = int(TokenType.ASSIGN)
+PLUS = int(TokenType.PLUS)
+MINUS = int(TokenType.MINUS)
+MULTIPLY = int(TokenType.MULTIPLY)
+DIVIDE = int(TokenType.DIVIDE)
+FLOOR_DIV = int(TokenType.FLOOR_DIV)
+POWER = int(TokenType.POWER)
+EQUAL = int(TokenType.EQUAL)
+NOT_EQUAL = int(TokenType.NOT_EQUAL)
+LESS = int(TokenType.LESS)
+LESS_EQUAL = int(TokenType.LESS_EQUAL)
+GREATER = int(TokenType.GREATER)
+GREATER_EQUAL = int(TokenType.GREATER_EQUAL)
+SWAP = int(TokenType.SWAP)
+HEXADECIMAL = int(TokenType.HEXADECIMAL)
+KW_TRUE = int(TokenType.KW_TRUE)
+KW_FALSE = int(TokenType.KW_FALSE)
+SEMICOLON = int(TokenType.SEMICOLON)
+COMMA = int(TokenType.COMMA)
+LPAREN = int(TokenType.LPAREN)
+RPAREN = int(TokenType.RPAREN)
+LBRACE = int(TokenType.LBRACE)
+RBRACE = int(TokenType.RBRACE)
+EOF = int(TokenType.EOF)
+
+# Precedência dos operadores binários (maior = liga mais forte). Um novo nível
+# é só uma entrada nesta tabela; o Parser não tem um método por nível.
+BINARY_PRECEDENCE = {
+    EQUAL: 1, NOT_EQUAL: 1,
+    LESS: 1, LESS_EQUAL: 1, GREATER: 1, GREATER_EQUAL: 1,
+    SWAP: 1,
+    PLUS: 2, MINUS: 2,
+    MULTIPLY: 3, DIVIDE: 3, FLOOR_DIV: 3,
+    POWER: 5,
+}
+# Operadores que associam à direita: 2 ** 3 ** 2 == 2 ** (3 ** 2)
+RIGHT_ASSOCIATIVE = frozenset({POWER})
+# Operando de + e - unários: -x * y == (-x) * y, mas -x ** 2 == -(x ** 2)
+UNARY_PRECEDENCE = 4
+
 
 class ParserError(SyntaxError):
     pass
 
 
 class Parser:
-    def __init__(self, source_code: str):
-        self.lexer = Lexer(source_code)
-        self.current_token: Token = self.lexer.next_token()
+    def __init__(self, source_code: Optional[str] = None, tokens: Optional[TokenBuffer] = None):
+        """
+        Recebe o código fonte (tokenizado sob demanda pelo Lexer) ou um
+        TokenBuffer já pronto, consumido direto das colunas.
+        """
+        if tokens is not None:
+            self.lexer = None
+            self._next_token = tokens.reader()
+        else:
+            self.lexer = Lexer(source_code)
+            self._next_token = self.lexer.next_token
+        self.current_token: Token = self._next_token()
 
     # ==========================
     # Utilitários básicos
     # ==========================
     def _advance(self):
-        self.current_token = self.lexer.next_token()
+        self.current_token = self._next_token()
 
-    def _check(self, type_: str, value: Optional[str] = None) -> bool:
-        if self.current_token.type != type_:
-            return False
-        if value is not None and self.current_token.value != value:
-            return False
-        return True
+    def _check(self, kind: int) -> bool:
+        return self.current_token.kind == kind
 
-    def _match(self, type_: str, value: Optional[str] = None) -> bool:
-        if self._check(type_, value):
+    def _match(self, kind: int) -> bool:
+        if self.current_token.kind == kind:
             self._advance()
             return True
         return False
 
-    def _consume(self, type_: str, value: Optional[str] = None, message: str = "") -> Token:
-        if self._check(type_, value):
+    def _consume(self, kind: int, message: str = "") -> Token:
+        if self.current_token.kind == kind:
             tok = self.current_token
             self._advance()
             return tok
+        type_, value = KIND_DESCRIPTIONS.get(kind, (TokenType(kind).name, None))
         exp = f"{type_}" + (f"('{value}')" if value else "")
         got = f"{self.current_token.type}('{self.current_token.value}')"
         loc = f"linha {self.current_token.line}, coluna {self.current_token.column}"
@@ -62,16 +122,15 @@ class Parser:
                    | VarDecl
                    | Stmt        -- permite statements no nível global
         """
-        declarations: List = []
-        while self.current_token.type != 'EOF':
-            if self._check('KEYWORD', 'func'):
-                declarations.append(self._func_decl())
-            elif self._check('KEYWORD', 'var'):
-                declarations.append(self._var_decl())
-            else:
-                # permite print, if, etc. no nível global
-                declarations.append(self._statement())
-        return Program(declarations)
+        return Program(list(self.iter_declarations()))
+
+    def iter_declarations(self):
+        """Gera as declarações de topo uma a uma, à medida que são lidas."""
+        top_level = self._TOP_LEVEL
+        while self.current_token.kind != EOF:
+            # permite print, if, etc. no nível global
+            handler = top_level.get(self.current_token.kind, Parser._statement)
+            yield handler(self)
 
     # ==========================
     # Declarações
@@ -81,16 +140,15 @@ class Parser:
         VarDecl ::= "var" IDENT ["=" Expr] ";"
         (na prática seu código SEMPRE usa "var x = expr;")
         """
-        var_tok = self._consume('KEYWORD', 'var', "Esperado 'var' em declaração de variável")
+        var_tok = self._consume(KW_VAR, "Esperado 'var' em declaração de variável")
 
-        name_tok = self._consume('IDENTIFIER', message="Esperado identificador de variável após 'var'")
+        name_tok = self._consume(IDENTIFIER, "Esperado identificador de variável após 'var'")
 
         init_expr: Optional[Expr] = None
-        if self._check('ASSIGN') or (self._check('SYMBOL') and self.current_token.value == '='):
-            self._advance()
+        if self._match(ASSIGN):
             init_expr = self._expression()
 
-        self._consume('SYMBOL', ';', "Esperado ';' ao final da declaração de variável")
+        self._consume(SEMICOLON, "Esperado ';' ao final da declaração de variável")
 
         return VarDecl(var_tok, name_tok, init_expr)
 
@@ -99,18 +157,18 @@ class Parser:
         FuncDecl ::= "func" IDENT "(" [ ParamList ] ")" Block
         ParamList ::= IDENT { "," IDENT }     -- parâmetros sem tipo
         """
-        func_tok = self._consume('KEYWORD', 'func', "Esperado 'func' em declaração de função")
-        name_tok = self._consume('IDENTIFIER', message="Esperado nome da função após 'func'")
+        func_tok = self._consume(KW_FUNC, "Esperado 'func' em declaração de função")
+        name_tok = self._consume(IDENTIFIER, "Esperado nome da função após 'func'")
 
-        self._consume('SYMBOL', '(', "Esperado '(' após nome da função")
+        self._consume(LPAREN, "Esperado '(' após nome da função")
 
         params: List[Param] = []
-        if not self._check('SYMBOL', ')'):
+        if not self._check(RPAREN):
             params.append(self._param())
-            while self._match('SYMBOL', ','):
+            while self._match(COMMA):
                 params.append(self._param())
 
-        self._consume('SYMBOL', ')', "Esperado ')' após parâmetros da função")
+        self._consume(RPAREN, "Esperado ')' após parâmetros da função")
 
         body = self._block()
 
@@ -120,7 +178,7 @@ class Parser:
         """
         Param ::= IDENT      -- sem tipo
         """
-        name_tok = self._consume('IDENTIFIER', message="Esperado nome de parâmetro")
+        name_tok = self._consume(IDENTIFIER, "Esperado nome de parâmetro")
         return Param(name_tok)
 
     # ==========================
@@ -130,11 +188,11 @@ class Parser:
         """
         Block ::= "{" { Stmt } "}"
         """
-        self._consume('SYMBOL', '{', "Esperado '{' para iniciar bloco")
+        self._consume(LBRACE, "Esperado '{' para iniciar bloco")
         statements: List = []
-        while not self._check('SYMBOL', '}') and self.current_token.type != 'EOF':
+        while self.current_token.kind != RBRACE and self.current_token.kind != EOF:
             statements.append(self._statement())
-        self._consume('SYMBOL', '}', "Esperado '}' para finalizar bloco")
+        self._consume(RBRACE, "Esperado '}' para finalizar bloco")
         return Block(statements)
 
     def _statement(self):
@@ -148,87 +206,72 @@ class Parser:
                | Block
                | ";"
         """
-        if self._check('KEYWORD', 'var'):
-            return self._var_decl()
-
-        if self._check('KEYWORD', 'if'):
-            return self._if_stmt()
-        if self._check('KEYWORD', 'while'):
-            return self._while_stmt()
-        if self._check('KEYWORD', 'return'):
-            return self._return_stmt()
-        if self._check('KEYWORD', 'print'):
-            return self._print_stmt()
-        if self._check('SYMBOL', '{'):
-            return self._block()
-        if self._check('SYMBOL', ';'):
-            self._advance()
-            return ExprStmt(LiteralExpr(None))
+        handler = self._STATEMENTS.get(self.current_token.kind, Parser._assign_or_expr_stmt)
+        return handler(self)
 
-        return self._assign_or_expr_stmt()
+    def _empty_stmt(self) -> ExprStmt:
+        self._advance()
+        return ExprStmt(LiteralExpr(None))
 
     def _assign_or_expr_stmt(self):
         """
         - AssignStmt: IDENT "=" Expr ";"
         - ExprStmt: Expr ";"
         """
-        if self._check('IDENTIFIER'):
+        if self._check(IDENTIFIER):
             ident_tok = self.current_token
             self._advance()
-            if self._check('ASSIGN') or (self._check('SYMBOL') and self.current_token.value == '='):
-                self._advance()
+            if self._match(ASSIGN):
                 value = self._expression()
-                self._consume('SYMBOL', ';', "Esperado ';' após atribuição")
+                self._consume(SEMICOLON, "Esperado ';' após atribuição")
                 target = VarExpr(ident_tok)
                 return AssignStmt(target, value)
             else:
                 expr: Expr = self._finish_primary_from_ident(ident_tok)
                 expr = self._expression_tail(expr)
-                self._consume('SYMBOL', ';', "Esperado ';' após expressão")
+                self._consume(SEMICOLON, "Esperado ';' após expressão")
                 return ExprStmt(expr)
 
         expr = self._expression()
-        self._consume('SYMBOL', ';', "Esperado ';' após expressão")
+        self._consume(SEMICOLON, "Esperado ';' após expressão")
         return ExprStmt(expr)
 
     # ==========================
     # Comandos específicos
     # ==========================
     def _if_stmt(self) -> IfStmt:
-        self._consume('KEYWORD', 'if')
-        self._consume('SYMBOL', '(', "Esperado '(' após 'if'")
+        self._consume(KW_IF)
+        self._consume(LPAREN, "Esperado '(' após 'if'")
         cond = self._expression()
-        self._consume('SYMBOL', ')', "Esperado ')' após condição do if")
+        self._consume(RPAREN, "Esperado ')' após condição do if")
         then_branch = self._as_block(self._statement())
         else_branch: Optional[Block] = None
-        if self._check('KEYWORD', 'else'):
-            self._advance()
+        if self._match(KW_ELSE):
             else_branch = self._as_block(self._statement())
         return IfStmt(cond, then_branch, else_branch)
 
     def _while_stmt(self) -> WhileStmt:
-        self._consume('KEYWORD', 'while')
-        self._consume('SYMBOL', '(', "Esperado '(' após 'while'")
+        self._consume(KW_WHILE)
+        self._consume(LPAREN, "Esperado '(' após 'while'")
         cond = self._expression()
-        self._consume('SYMBOL', ')', "Esperado ')' após condição do while")
+        self._consume(RPAREN, "Esperado ')' após condição do while")
         body = self._as_block(self._statement())
         return WhileStmt(cond, body)
 
     def _return_stmt(self) -> ReturnStmt:
-        self._consume('KEYWORD', 'return')
-        if self._check('SYMBOL', ';'):
-            self._advance()
+        self._consume(KW_RETURN)
+        if self._match(SEMICOLON):
             return ReturnStmt(None)
         value = self._expression()
-        self._consume('SYMBOL', ';', "Esperado ';' após return")
+        self._consume(SEMICOLON, "Esperado ';' após return")
         return ReturnStmt(value)
 
     def _print_stmt(self) -> PrintStmt:
-        self._consume('KEYWORD', 'print')
-        self._consume('SYMBOL', '(', "Esperado '(' após 'print'")
+        self._consume(KW_PRINT)
+        self._consume(LPAREN, "Esperado '(' após 'print'")
         value = self._expression()
-        self._consume('SYMBOL', ')', "Esperado ')' após expressão em print")
-        self._consume('SYMBOL', ';', "Esperado ';' após print")
+        self._consume(RPAREN, "Esperado ')' após expressão em print")
+        self._consume(SEMICOLON, "Esperado ';' após print")
         return PrintStmt(value)
 
     def _as_block(self, stmt) -> Block:
@@ -239,97 +282,123 @@ class Parser:
     # ==========================
     # Expressões
     # ==========================
-    def _expression(self) -> Expr:
-        left = self._add_expr()
-        return self._rel_expr_tail(left)
-
-    def _rel_expr_tail(self, left: Expr) -> Expr:
-        while self._check('GREATER') or \
-              (self._check('SYMBOL') and self.current_token.value in ('>',)):
-            op_tok = self.current_token
-            self._advance()
-            right = self._add_expr()
+    def _expression(self, min_precedence: int = 0, left: Optional[Expr] = None) -> Expr:
+        """
+        Precedence climbing: lê um operando pela tabela de prefixos (ou usa
+        `left`, se já foi lido) e depois consome operadores binários enquanto a
+        precedência for >= min_precedence. A profundidade de chamadas por
+        operando é constante, qualquer que seja o número de níveis em
+        BINARY_PRECEDENCE.
+        """
+        if left is None:
+            handler = self._PREFIX.get(self.current_token.kind)
+            if handler is None:
+                tok = self.current_token
+                raise ParserError(
+                    f"Esperado expressão, mas encontrado {tok.type}('{tok.value}') "
+                    f"na linha {tok.line}, coluna {tok.column}"
+                )
+            left = handler(self)
+
+        op_tok = self.current_token
+        precedence = BINARY_PRECEDENCE.get(op_tok.kind)
+        while precedence is not None and precedence >= min_precedence:
+            self.current_token = self._next_token()
+            if op_tok.kind in RIGHT_ASSOCIATIVE:
+                right = self._expression(precedence)
+            else:
+                right = self._expression(precedence + 1)
             left = BinaryExpr(left, op_tok, right)
+            op_tok = self.current_token
+            precedence = BINARY_PRECEDENCE.get(op_tok.kind)
         return left
 
-    def _add_expr(self) -> Expr:
-        expr = self._term()
-        while (self._check('PLUS') or self._check('MINUS') or
-               (self._check('SYMBOL') and self.current_token.value in ('+', '-'))):
-            op_tok = self.current_token
-            self._advance()
-            right = self._term()
-            expr = BinaryExpr(expr, op_tok, right)
-        return expr
+    def _unary(self) -> Expr:
+        op_tok = self.current_token
+        self._advance()
+        right = self._expression(UNARY_PRECEDENCE)
+        return UnaryExpr(op_tok, right)
 
-    def _term(self) -> Expr:
-        expr = self._factor()
-        while (self._check('STAR') or self._check('SLASH') or
-               (self._check('SYMBOL') and self.current_token.value in ('*', '/'))):
-            op_tok = self.current_token
-            self._advance()
-            right = self._factor()
-            expr = BinaryExpr(expr, op_tok, right)
+    def _group(self) -> Expr:
+        self._advance()
+        expr = self._expression()
+        self._consume(RPAREN, "Esperado ')' após expressão")
         return expr
 
-    def _factor(self) -> Expr:
-        if (self._check('PLUS') or self._check('MINUS') or
-                (self._check('SYMBOL') and self.current_token.value in ('+', '-'))):
-            op_tok = self.current_token
-            self._advance()
-            right = self._factor()
-            return UnaryExpr(op_tok, right)
+    def _int_literal(self) -> Expr:
+        tok = self.current_token
+        self.current_token = self._next_token()
+        return LiteralExpr(int(tok.value))
 
-        if self._check('SYMBOL', '('):
-            self._advance()
-            expr = self._expression()
-            self._consume('SYMBOL', ')', "Esperado ')' após expressão")
-            return expr
+    def _hex_literal(self) -> Expr:
+        tok = self.current_token
+        self.current_token = self._next_token()
+        return LiteralExpr(int(tok.value, 16))
 
-        if self._check('INTEGER'):
-            tok = self.current_token
-            self._advance()
-            return LiteralExpr(int(tok.value))
-        if self._check('FLOAT'):
-            tok = self.current_token
-            self._advance()
-            return LiteralExpr(float(tok.value))
-        if self._check('STRING'):
-            tok = self.current_token
-            self._advance()
-            return LiteralExpr(tok.value)
+    def _bool_literal(self) -> Expr:
+        tok = self.current_token
+        self.current_token = self._next_token()
+        return LiteralExpr(tok.kind == KW_TRUE)
 
-        if self._check('IDENTIFIER'):
-            ident_tok = self.current_token
-            self._advance()
-            if self._check('SYMBOL', '('):
-                self._advance()
-                args: List[Expr] = []
-                if not self._check('SYMBOL', ')'):
-                    args.append(self._expression())
-                    while self._match('SYMBOL', ','):
-                        args.append(self._expression())
-                self._consume('SYMBOL', ')', "Esperado ')' após argumentos de função")
-                return CallExpr(ident_tok, args)
-            return VarExpr(ident_tok)
+    def _float_literal(self) -> Expr:
+        tok = self.current_token
+        self.current_token = self._next_token()
+        return LiteralExpr(float(tok.value))
 
+    def _string_literal(self) -> Expr:
         tok = self.current_token
-        raise ParserError(
-            f"Esperado expressão, mas encontrado {tok.type}('{tok.value}') "
-            f"na linha {tok.line}, coluna {tok.column}"
-        )
+        self.current_token = self._next_token()
+        return LiteralExpr(tok.value)
+
+    def _identifier(self) -> Expr:
+        ident_tok = self.current_token
+        self.current_token = self._next_token()
+        if self.current_token.kind != LPAREN:
+            return VarExpr(ident_tok)
+        return self._finish_primary_from_ident(ident_tok)
 
     def _finish_primary_from_ident(self, ident_tok: Token) -> Expr:
-        if self._check('SYMBOL', '('):
-            self._advance()
+        if self._match(LPAREN):
             args: List[Expr] = []
-            if not self._check('SYMBOL', ')'):
+            if not self._check(RPAREN):
                 args.append(self._expression())
-                while self._match('SYMBOL', ','):
+                while self._match(COMMA):
                     args.append(self._expression())
-            self._consume('SYMBOL', ')', "Esperado ')' após argumentos de função")
+            self._consume(RPAREN, "Esperado ')' após argumentos de função")
             return CallExpr(ident_tok, args)
         return VarExpr(ident_tok)
 
     def _expression_tail(self, left: Expr) -> Expr:
-        return left
\ No newline at end of file
+        """Continua uma expressão cujo primeiro operando já foi lido."""
+        return self._expression(0, left)
+
+    # ==========================
+    # Tabelas de despacho (tipo do token atual -> método)
+    # ==========================
+    _TOP_LEVEL = {
+        KW_FUNC: _func_decl,
+        KW_VAR: _var_decl,
+    }
+
+    _STATEMENTS = {
+        KW_VAR: _var_decl,
+        KW_IF: _if_stmt,
+        KW_WHILE: _while_stmt,
+        KW_RETURN: _return_stmt,
+        KW_PRINT: _print_stmt,
+        LBRACE: _block,
+        SEMICOLON: _empty_stmt,
+    }
+
+    _PREFIX = {
+        PLUS: _unary,
+        MINUS: _unary,
+        LPAREN: _group,
+        INTEGER: _int_literal,
+        HEXADECIMAL: _hex_literal,
+        FLOAT: _float_literal,
+        STRING: _string_literal,
+        KW_TRUE: _bool_literal,
+        KW_FALSE: _bool_literal,
+        IDENTIFIER: _identifier,
+    }
@@ -0,0 +1,27 @@
+# tests/conftest.py
+"""
+Os caches em disco (tabelas do lexer, bytecode e code objects) ficam num
+diretório temporário durante a suíte, para os testes não gravarem em
+~/.cache/nocsyspy. Testes que precisam de um diretório próprio continuam
+trocando NOCSYS_CACHE_DIR no setUp.
+"""
+import os
+import tempfile
+
+_diretorio = None
+_anterior = None
+
+
+def pytest_configure(config):
+    global _diretorio, _anterior
+    _diretorio = tempfile.TemporaryDirectory(prefix='nocsys-testes-')
+    _anterior = os.environ.get('NOCSYS_CACHE_DIR')
+    os.environ['NOCSYS_CACHE_DIR'] = _diretorio.name
+
+
+def pytest_unconfigure(config):
+    if _anterior is None:
+        os.environ.pop('NOCSYS_CACHE_DIR', None)
+    else:
+        os.environ['NOCSYS_CACHE_DIR'] = _anterior
+    _diretorio.cleanup()
@@ -0,0 +1,90 @@
+# tests/test_afn_to_afd.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer.afn_to_afd import (
+    NFA, EPSILON, nfa_to_dfa, nfa_to_dfa_bitset, minimize_dfa, minimization_report,
+)
+from src.lexer.lexer import Lexer
+
+
+def nfa_abb():
+    """AFN clássico de (a|b)*abb (Aho et al.), 11 estados."""
+    t = {
+        (0, EPSILON): {1, 7},
+        (1, EPSILON): {2, 4},
+        (2, 'a'): {3},
+        (4, 'b'): {5},
+        (3, EPSILON): {6},
+        (5, EPSILON): {6},
+        (6, EPSILON): {1, 7},
+        (7, 'a'): {8},
+        (8, 'b'): {9},
+        (9, 'b'): {10},
+    }
+    return NFA(range(11), {'a', 'b'}, t, 0, {10}, accept_tokens={10: 'ABB'})
+
+
+def nfa_tokens():
+    """AFN com dois tokens que compartilham prefixo: 'ab' (AB) e 'ac' (AC)."""
+    t = {
+        (0, EPSILON): {1, 4},
+        (1, 'a'): {2},
+        (2, 'b'): {3},
+        (4, 'a'): {5},
+        (5, 'c'): {6},
+    }
+    return NFA(range(7), {'a', 'b', 'c'}, t, 0, {3, 6}, accept_tokens={3: 'AB', 6: 'AC'})
+
+
+class TestMinimizacao(unittest.TestCase):
+
+    def test_abb_minimo_tem_quatro_estados(self):
+        dfa = nfa_to_dfa(nfa_abb())
+        minimo = minimize_dfa(dfa)
+        self.assertEqual(minimization_report(dfa, minimo),
+                         {'before': 5, 'after': 4, 'removed': 1})
+        self.assertEqual(minimo.accept_tokens, {s: 'ABB' for s in minimo.accept_states})
+
+    def test_tokens_diferentes_nao_sao_fundidos(self):
+        minimo = minimize_dfa(nfa_to_dfa(nfa_tokens()))
+        dfa = minimo.to_dfa("Tokens")
+        self.assertEqual(dfa.run("ab"), ('AB', 'ab'))
+        self.assertEqual(dfa.run("ac"), ('AC', 'ac'))
+        self.assertEqual(dfa.run("aa"), (None, None))
+
+    def test_afd_convertido_dirige_o_lexer(self):
+        dfa = minimize_dfa(nfa_to_dfa(nfa_abb())).to_dfa("ABB")
+        for use_scanner in (True, False):
+            tokens = Lexer("abb aabb babb;", use_scanner=use_scanner, dfas=[dfa]).get_all_tokens()
+            self.assertEqual(
+                [(t.type, t.value) for t in tokens],
+                [('ABB', 'abb'), ('ABB', 'aabb'), ('ABB', 'babb'), ('SYMBOL', ';'), ('EOF', 'EOF')],
+            )
+
+
+class TestSubconjuntosBitset(unittest.TestCase):
+
+    def test_mesmo_afd_que_a_versao_com_conjuntos(self):
+        for nfa in (nfa_abb(), nfa_tokens()):
+            esperado = nfa_to_dfa(nfa)
+            obtido = nfa_to_dfa_bitset(nfa)
+            self.assertEqual(len(obtido.states), len(esperado.states))
+            self.assertEqual(sorted(obtido.accept_tokens.values()),
+                             sorted(esperado.accept_tokens.values()))
+            a, b = esperado.to_dfa(), obtido.to_dfa()
+            for palavra in ("ab", "ac", "abb", "aabb", "babb", "abab", "ba"):
+                self.assertEqual(a.match(palavra), b.match(palavra))
+
+    def test_fecho_epsilon_com_ciclo(self):
+        t = {(0, EPSILON): {1}, (1, EPSILON): {0, 2}, (2, 'x'): {0}}
+        dfa = nfa_to_dfa_bitset(NFA(range(3), {'x'}, t, 0, {2}, accept_tokens={2: 'X'}))
+        self.assertEqual(minimize_dfa(dfa).to_dfa().run("xxx"), ('X', 'xxx'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# tests/test_arena.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer.buffer import TokenBuffer
+from src.parser.parser import Parser
+from src.parser.iterative import IterativeParser
+from src.parser.arena import AstArena, NodeKind
+from src.parser.ast import BinaryExpr, VarDecl
+
+FONTE = '''func soma(a, b) {
+    var total = a + b * 2;
+    if (total >= 0x10) { print("grande"); } else ;
+    while (total > 1) { total = total // 2; }
+    return;
+}
+var ok = true;
+print(soma(1, 2.5) <-> -ok);
+'''
+
+
+class TestArena(unittest.TestCase):
+
+    def test_to_ast_igual_ao_parser(self):
+        buffer = TokenBuffer.from_source(FONTE)
+        arena = AstArena.from_buffer(buffer)
+        self.assertEqual(arena.to_ast(), Parser(tokens=buffer).parse())
+
+    def test_ids_e_views(self):
+        arena = AstArena.from_source(FONTE)
+        program = arena.view()
+        self.assertEqual(program.kind, NodeKind.PROGRAM)
+        self.assertEqual(program.id, len(arena) - 1)
+        self.assertEqual([d.kind for d in program],
+                         [NodeKind.FUNC_DECL, NodeKind.VAR_DECL, NodeKind.PRINT])
+
+        func = program[0]
+        self.assertEqual(func.value, 'soma')
+        self.assertEqual([p.value for p in func.children[:-1]], ['a', 'b'])
+        self.assertEqual(func[-1].kind, NodeKind.BLOCK)
+
+        ok = program[1]
+        self.assertEqual(ok.token.line, 7)
+        self.assertIs(ok[0].value, True)
+
+        swap = program[2][0]
+        self.assertEqual((swap.kind, swap.value), (NodeKind.BINARY, '<->'))
+        self.assertEqual([c.kind for c in swap], [NodeKind.CALL, NodeKind.UNARY])
+
+    def test_walk_em_pre_ordem(self):
+        arena = AstArena.from_source("var x = 1 + y;")
+        kinds = [arena.kind(i) for i in arena.walk()]
+        self.assertEqual(kinds, [NodeKind.PROGRAM, NodeKind.VAR_DECL, NodeKind.BINARY,
+                                 NodeKind.LITERAL, NodeKind.VAR])
+
+    def test_aninhamento_profundo_com_iterative_parser(self):
+        n = 20_000
+        arena = AstArena.from_source("var x = " + "-" * n + "1;", IterativeParser)
+        self.assertEqual(len(arena), n + 3)
+        self.assertEqual(sum(1 for _ in arena.walk()), n + 3)
+
+
+class TestSlots(unittest.TestCase):
+
+    def test_nos_sem_dict(self):
+        decl = Parser("var x = 1 + 2;").parse().declarations[0]
+        for node in (decl, decl.init_expr, decl.name):
+            self.assertFalse(hasattr(node, '__dict__'))
+        self.assertIsInstance(decl, VarDecl)
+        self.assertIsInstance(decl.init_expr, BinaryExpr)
+
+
+if __name__ == '__main__':
+    unittest.main()
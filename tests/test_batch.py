@@ -0,0 +1,82 @@
+# tests/test_batch.py
+import unittest
+import json
+import tempfile
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.batch import coletar_arquivos, compilar_arquivo, compilar_lote, main
+
+VALIDO = 'var x = 1;\nfunc f(a) { return a * 2; }\nprint(f(x));\n'
+
+
+class TestBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.raiz = self.dir.name
+        os.makedirs(os.path.join(self.raiz, 'sub'))
+        self._escrever('b.noc', VALIDO)
+        self._escrever('a.noc', VALIDO * 3)
+        self._escrever(os.path.join('sub', 'erro_parser.noc'), 'var x = ;\n')
+        self._escrever(os.path.join('sub', 'erro_lexer.noc'), 'var x = 1 @ 2;\n')
+        self._escrever('ignorado.txt', 'nada')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _escrever(self, nome, texto):
+        with open(os.path.join(self.raiz, nome), 'w', encoding='utf-8') as f:
+            f.write(texto)
+
+    def _caminho(self, nome):
+        return os.path.normpath(os.path.join(self.raiz, nome))
+
+    def test_coleta_diretorios_e_globs_ordenados(self):
+        arquivos = coletar_arquivos([self.raiz, os.path.join(self.raiz, '*.noc')])
+        self.assertEqual(arquivos, [
+            self._caminho('a.noc'),
+            self._caminho('b.noc'),
+            self._caminho(os.path.join('sub', 'erro_lexer.noc')),
+            self._caminho(os.path.join('sub', 'erro_parser.noc')),
+        ])
+
+    def test_resultado_de_arquivo_valido(self):
+        resultado = compilar_arquivo(self._caminho('b.noc'))
+        self.assertTrue(resultado['ok'])
+        self.assertIsNone(resultado['erro'])
+        self.assertEqual(resultado['declaracoes'], 3)
+        self.assertGreaterEqual(resultado['tempo_parse_ms'], 0)
+
+    def test_erros_ficam_no_resultado(self):
+        parser = compilar_arquivo(self._caminho(os.path.join('sub', 'erro_parser.noc')))
+        self.assertEqual((parser['ok'], parser['erro']['etapa'], parser['erro']['tipo']),
+                         (False, 'parser', 'ParserError'))
+        lexer = compilar_arquivo(self._caminho(os.path.join('sub', 'erro_lexer.noc')))
+        self.assertEqual((lexer['erro']['etapa'], lexer['erro']['tipo']), ('lexer', 'SyntaxError'))
+        leitura = compilar_arquivo(self._caminho('nao_existe.noc'))
+        self.assertEqual(leitura['erro']['etapa'], 'leitura')
+
+    def test_pool_devolve_a_mesma_ordem(self):
+        arquivos = coletar_arquivos([self.raiz]) * 3
+        sem_tempo = lambda resultados: [
+            {k: v for k, v in r.items() if not k.startswith('tempo')} for r in resultados]
+        self.assertEqual(sem_tempo(compilar_lote(arquivos, workers=2)),
+                         sem_tempo(compilar_lote(arquivos, workers=1)))
+
+    def test_cli_grava_relatorio(self):
+        saida = os.path.join(self.raiz, 'relatorio.json')
+        codigo = main([self.raiz, '-j', '1', '-o', saida])
+        self.assertEqual(codigo, 1)
+        with open(saida, encoding='utf-8') as f:
+            dados = json.load(f)
+        self.assertEqual((dados['arquivos'], dados['ok'], dados['erros']), (4, 2, 2))
+        self.assertEqual([r['arquivo'] for r in dados['resultados']],
+                         coletar_arquivos([self.raiz]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+# tests/test_buffer.py
+import unittest
+import random
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer.lexer import Lexer
+from src.lexer.buffer import TokenBuffer, TextEdit
+from src.parser.parser import Parser
+
+FONTE = '''func calcular_area(raio) {
+    var pi = 3.14159;
+    var area = pi * raio * raio;
+    if (area > 100.0) { print("Area grande"); } else { print("Area pequena"); }
+    return area;
+}
+var resultado = calcular_area(10);
+print(resultado);
+'''
+
+
+class TestTokenBuffer(unittest.TestCase):
+
+    def test_mesmos_tokens_que_o_lexer(self):
+        buffer = TokenBuffer.from_source(FONTE)
+        self.assertEqual(list(buffer), Lexer(FONTE).get_all_tokens())
+        self.assertEqual(buffer[-1].type, 'EOF')
+
+    def test_lexemas_internados(self):
+        buffer = TokenBuffer.from_source(FONTE)
+        nomes = [buffer.value(i) for i in range(len(buffer)) if buffer.type(i) == 'IDENTIFIER']
+        raios = [n for n in nomes if n == 'raio']
+        self.assertGreater(len(raios), 1)
+        self.assertTrue(all(r is raios[0] for r in raios))
+
+    def test_parser_consome_o_buffer(self):
+        esperado = Parser(FONTE).parse()
+        obtido = Parser(tokens=TokenBuffer.from_source(FONTE)).parse()
+        self.assertEqual(obtido, esperado)
+
+
+
+def colunas(buffer):
+    return ([buffer.type(i) for i in range(len(buffer))], list(buffer.kinds),
+            list(buffer.starts), list(buffer.lengths), list(buffer.lines), list(buffer.columns))
+
+
+class TestRelex(unittest.TestCase):
+
+    def _relex(self, source, edit, checkpoint_interval=4):
+        buffer = TokenBuffer.from_source(source, checkpoint_interval=checkpoint_interval)
+        patch = buffer.relex(edit)
+        novo = edit.apply(source)
+        self.assertEqual(buffer.source, novo)
+        self.assertEqual(colunas(buffer),
+                         colunas(TokenBuffer.from_source(novo, checkpoint_interval=checkpoint_interval)))
+        for checkpoint in buffer.checkpoints:
+            self.assertEqual((buffer.starts[checkpoint.token_index],
+                              buffer.lines[checkpoint.token_index],
+                              buffer.columns[checkpoint.token_index]),
+                             (checkpoint.offset, checkpoint.line, checkpoint.column))
+        return patch
+
+    def test_edicao_de_uma_linha_rele_poucos_tokens(self):
+        source = FONTE * 200
+        pos = source.index('3.14159') + 2
+        patch = self._relex(source, TextEdit(pos, pos + 1, '9'), checkpoint_interval=16)
+        self.assertLessEqual(patch.relexed, 16 + 2)
+        self.assertEqual(patch.old_end - patch.first, patch.relexed)
+
+    def test_quebra_de_linha_e_string_multilinha(self):
+        pos = FONTE.index('var area')
+        self._relex(FONTE, TextEdit(pos, pos, '\n\n  '))
+        pos = FONTE.index('"Area grande"') + 5
+        self._relex(FONTE, TextEdit(pos, pos + 1, '\n'))
+
+    def test_lookahead_do_token_anterior(self):
+        # '<' leu o '-' e o 'x' procurando '<->'; trocar o 'x' muda o token '<'
+        fonte = 'a = b <-x;   ' * 20
+        pos = fonte.rindex('x')
+        buffer = TokenBuffer.from_source(fonte, checkpoint_interval=1)
+        self.assertTrue(any(cp.in_token for cp in buffer.checkpoints))
+        self._relex(fonte, TextEdit(pos, pos + 1, '>'), checkpoint_interval=1)
+
+    def test_edicoes_aleatorias(self):
+        rnd = random.Random(5)
+        source = FONTE * 4 + 'x <- y; 0x 1.5 0x1F "a\nb" fim'
+        buffer = TokenBuffer.from_source(source, checkpoint_interval=3)
+        for _ in range(300):
+            start = rnd.randrange(len(source) + 1)
+            end = min(len(source), start + rnd.choice((0, 1, 2)))
+            text = rnd.choice(('', ' ', '\n', 'x', '1', '.', '-', '>', '"', ';'))
+            edit = TextEdit(start, end, text)
+            try:
+                esperado = TokenBuffer.from_source(edit.apply(source))
+            except SyntaxError:
+                continue
+            buffer.relex(edit)
+            source = edit.apply(source)
+            self.assertEqual(colunas(buffer), colunas(esperado))
+
+    def test_lexer_recomeca_de_um_checkpoint(self):
+        lexer = Lexer(FONTE, checkpoint_interval=5)
+        tokens = lexer.get_all_tokens()
+        checkpoint = lexer.checkpoints[3]
+        outro = Lexer(FONTE)
+        outro.restore(checkpoint)
+        self.assertEqual(outro.get_all_tokens(), tokens[checkpoint.token_index:])
+
+
+if __name__ == '__main__':
+    unittest.main()
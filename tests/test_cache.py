@@ -0,0 +1,72 @@
+# tests/test_cache.py
+import unittest
+import sys
+import os
+import tempfile
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer import cache
+from src.lexer.spec import TOKEN_RULES, build_spec_dfa
+
+FONTE = 'var ação = "olá €" ** 0x1F; print(x <-> y);'
+
+
+class TestCacheDoLexer(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._env = os.environ.get('NOCSYS_CACHE_DIR')
+        os.environ['NOCSYS_CACHE_DIR'] = self._dir.name
+        self.builds = 0
+
+    def tearDown(self):
+        if self._env is None:
+            del os.environ['NOCSYS_CACHE_DIR']
+        else:
+            os.environ['NOCSYS_CACHE_DIR'] = self._env
+        self._dir.cleanup()
+
+    def _build(self):
+        self.builds += 1
+        return build_spec_dfa(TOKEN_RULES).compile()
+
+    def _tokens(self, compiled):
+        pos, tokens = 0, []
+        while pos < len(FONTE):
+            if FONTE[pos] == ' ':
+                pos += 1
+                continue
+            token_type, end = compiled.match(FONTE, pos)
+            tokens.append((token_type, FONTE[pos:end]))
+            pos = end
+        return tokens
+
+    def test_segunda_carga_vem_do_disco(self):
+        original = cache.load_or_build(TOKEN_RULES, self._build)
+        carregado = cache.load_or_build(TOKEN_RULES, self._build)
+        self.assertEqual(self.builds, 1)
+        self.assertIsNone(carregado._move)  # veio do arquivo, não da compilação
+        self.assertEqual(self._tokens(carregado), self._tokens(original))
+
+    def test_cache_corrompido_e_reconstruido(self):
+        cache.load_or_build(TOKEN_RULES, self._build)
+        path = cache.cache_path(cache.spec_key(TOKEN_RULES))
+        with open(path, 'r+b') as f:
+            f.seek(-10, os.SEEK_END)
+            f.write(b'\x00' * 10)
+        self.assertIsNone(cache.load_tables(cache.spec_key(TOKEN_RULES), TOKEN_RULES))
+        cache.load_or_build(TOKEN_RULES, self._build)
+        self.assertEqual(self.builds, 2)
+        self.assertIsNotNone(cache.load_tables(cache.spec_key(TOKEN_RULES), TOKEN_RULES))
+
+    def test_especificacao_diferente_nao_reaproveita(self):
+        outras = TOKEN_RULES + [('MODULO', r'%')]
+        self.assertNotEqual(cache.spec_key(outras), cache.spec_key(TOKEN_RULES))
+        cache.load_or_build(TOKEN_RULES, self._build)
+        self.assertIsNone(cache.load_tables(cache.spec_key(outras), outras))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# tests/test_deadcode.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser
+from src.parser.ast import FuncDecl, Block, IfStmt, WhileStmt, ReturnStmt, PrintStmt
+from src.optimizer import fold_constants, eliminate_dead_code
+from test_executor import PROGRAMAS
+from test_folding import executores, executar
+
+MORTO = '''
+    ;;
+    func nunca() { print("nunca"); }
+    func a(n) { if (n > 0) { return b(n - 1); } return 0; print("depois"); }
+    func b(n) { return a(n) + 1; ; }
+    func sinal(x) {
+        if (x < 0) { return -1; } else { return 1; }
+        print("inalcançável");
+    }
+    func para_sempre() { while (true) { return 7; } print("fora"); }
+    if (false) { print("nao"); } else { var y = 2; print(y); }
+    if (1 < 2) { print("sim"); }
+    while (false) { print("nunca"); }
+    while (2 * 0) { print("zero"); }
+    print(a(3)); print(sinal(-5)); print(para_sempre());
+    { ; { } }
+'''
+
+
+def eliminar(source, dobrar=True):
+    program = Parser(source).parse()
+    if dobrar:
+        program, _ = fold_constants(program)
+    return eliminate_dead_code(program)
+
+
+class TestDeadCode(unittest.TestCase):
+
+    def test_mesma_saida_em_todos_os_backends(self):
+        programas = dict(PROGRAMAS, morto=MORTO)
+        for nome, source in programas.items():
+            original = Parser(source).parse()
+            otimizado, _ = eliminar(source)
+            for backend, executor in executores().items():
+                with self.subTest(programa=nome, backend=backend):
+                    self.assertEqual(executar(executor, otimizado), executar(executor, original))
+
+    def test_estatisticas(self):
+        program, stats = eliminar(MORTO)
+        self.assertEqual(stats.unreachable, 4)
+        self.assertEqual(stats.constant_branches, 2)
+        self.assertEqual(stats.dead_loops, 2)
+        self.assertEqual(stats.empty_statements, 5)
+        self.assertEqual(stats.functions, 1)
+        self.assertEqual(stats.eliminated, stats.nodes_before - stats.nodes_after)
+        self.assertGreater(stats.eliminated, 20)
+
+    def test_corpo_depois_de_return(self):
+        program, _ = eliminar('func f() { print(1); return 2; print(3); { print(4); } } f();')
+        corpo = program.declarations[0].body.statements
+        self.assertEqual([type(s) for s in corpo], [PrintStmt, ReturnStmt])
+
+    def test_ramo_constante_vira_bloco(self):
+        program, _ = eliminar('var x = 1; if (true) { var x = 2; print(x); } print(x);')
+        self.assertIsInstance(program.declarations[1], Block)
+        self.assertEqual(executar(executores()['closures'], program), ['2', '1'])
+
+    def test_condicoes_nao_constantes_ficam(self):
+        program, stats = eliminar('var x = 0; if (x) { } while (x > 1) { ; }', dobrar=False)
+        tipos = [type(decl) for decl in program.declarations]
+        self.assertEqual(tipos[1:], [IfStmt, WhileStmt])
+        self.assertEqual(program.declarations[1].then_branch.statements, [])
+        self.assertEqual(stats.empty_statements, 1)
+
+    def test_funcoes_alcancaveis(self):
+        program, stats = eliminar(
+            'func f() { return g(); } func g() { return 1; } func h() { return h(); }'
+            'func sozinha() { return f(); } print(f());')
+        nomes = [decl.name.value for decl in program.declarations if type(decl) is FuncDecl]
+        self.assertEqual(nomes, ['f', 'g'])
+        self.assertEqual(stats.functions, 2)
+
+    def test_funcoes_depois_de_return_no_topo_continuam(self):
+        program, stats = eliminar('print(f()); return 1; print(2); func f() { return 3; }')
+        nomes = [type(decl) for decl in program.declarations]
+        self.assertEqual(nomes, [PrintStmt, ReturnStmt, FuncDecl])
+        self.assertEqual(stats.unreachable, 1)
+
+    def test_funcao_repetida_nao_some(self):
+        program, stats = eliminar('func f() { } func f() { }')
+        self.assertEqual(len(program.declarations), 2)
+        self.assertEqual(stats.functions, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -52,5 +52,15 @@ class TestDFA(unittest.TestCase):
         self.assertEqual(dfa.run('"Ola Mundo"')[0], 'STRING')
         self.assertEqual(dfa.run('"Ola \\" Mundo"')[0], 'STRING') # Escape
 
+    def test_match_scan_e_match_prefix(self):
+        compiled = build_operator_dfa().compile()
+        self.assertEqual(compiled.match("a<-b", 1), ('LESS', 2))
+        self.assertEqual(compiled.scan("a<-b", 1), ('LESS', 2, 4))
+        self.assertEqual(compiled.match_prefix("a<-b", 1), ('LESS', 2, False))
+        self.assertEqual(compiled.match_prefix("a<-", 1), ('LESS', 2, True))
+        # Continuar de onde o texto acabou dá o mesmo que ler tudo de uma vez
+        state, _, _, _ = compiled.advance("a<-", 1)
+        self.assertEqual(compiled.advance(">b", 0, state)[1:3], ('SWAP', 1))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,156 @@
+# tests/test_executor.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser
+from src.executor.closures import compile_program
+from src.executor.walker import TreeWalker
+from src.executor.runtime import NocSysRuntimeError
+
+PROGRAMAS = {
+    'fibonacci': '''
+        func fib(n) { if (n < 2) { return n; } return fib(n - 1) + fib(n - 2); }
+        var i = 0;
+        while (i < 12) { print(fib(i)); i = i + 1; }
+    ''',
+    'aritmetica': '''
+        print(7 / 2); print(7 // 2); print(-7 // 2); print(2 ** 3 ** 2); print(-2 ** 2);
+        print(0x1F + 1); print(1.5 * 2); print(1 == 1.0); print(3 != 3); print("a" + "b");
+        print(true); print(false); print(2 >= 3);
+    ''',
+    'escopos': '''
+        var x = 1;
+        func f(x) { x = x + 10; { var x = 100; print(x); } return x; }
+        print(f(5)); print(x);
+        { var x = 2; x = x + 1; print(x); }
+        print(x);
+        func g() { x = x * 7; }
+        g(); print(x);
+    ''',
+    'laco_com_retorno': '''
+        func primeiro_multiplo(n, k) {
+            var i = 1;
+            while (true) {
+                if (i * k >= n) { return i * k; }
+                i = i + 1;
+            }
+        }
+        print(primeiro_multiplo(50, 7));
+        func nada() { return; }
+        print(nada());
+        func sem_retorno() { var a = 1; }
+        print(sem_retorno());
+    ''',
+    'troca_e_strings': '''
+        var a = "linha\\nnova"; var b = "aspas \\"x\\" e \\\\";
+        a <-> b; print(a); print(b);
+        func t(p, q) { p <-> q; return p - q; }
+        print(t(1, 10));
+        ;;
+        var vazio;
+        print(vazio);
+    ''',
+    'inteiro_longo': '''
+        var x = 10 ** 5000;
+        print(x); print(-x - 1);
+    ''',
+}
+
+
+# Erros que só acontecem se o código rodar: (saída até o erro, (mensagem, linha, coluna))
+ERROS_EM_EXECUCAO = {
+    'print(1); if (false) { return 1; } print(2);': (['1', '2'], None),
+    'print(1); return 2; print(3);': (['1'], ("'return' fora de função", None, None)),
+    'func f() { print(0); return 1; } print(1); return f();':
+        (['1', '0'], ("'return' fora de função", None, None)),
+    'print(1); if (false) { print(a <-> b); var c = 1; c <-> 2; }': (['1'], None),
+    'print(1); print(a <-> b);': (['1'], ("'<->' é uma instrução, não uma expressão", 1, 19)),
+    'var a = 1; print(a); a <-> 2;': (['1'], ("'<->' só troca duas variáveis", 1, 24)),
+}
+
+
+def saida_e_erro(executar, source):
+    """(linhas escritas, (mensagem, linha, coluna) do erro ou None)."""
+    saida = []
+    try:
+        executar(source, saida)
+    except NocSysRuntimeError as erro:
+        return saida, (erro.message, erro.line, erro.column)
+    return saida, None
+
+
+def executar_closures(source, saida=None):
+    saida = [] if saida is None else saida
+    compile_program(Parser(source).parse(), saida.append).run()
+    return saida
+
+
+def executar_walker(source, saida=None):
+    saida = [] if saida is None else saida
+    TreeWalker(saida.append).run(Parser(source).parse())
+    return saida
+
+
+class TestExecutor(unittest.TestCase):
+
+    def test_mesma_saida_que_o_walker(self):
+        for nome, source in PROGRAMAS.items():
+            with self.subTest(programa=nome):
+                self.assertEqual(executar_closures(source), executar_walker(source))
+
+    def test_semantica(self):
+        self.assertEqual(executar_closures(PROGRAMAS['aritmetica']),
+                         ['3.5', '3', '-4', '512', '-4', '32', '3.0', 'true', 'false', 'ab',
+                          'true', 'false', 'false'])
+        self.assertEqual(executar_closures(PROGRAMAS['escopos']),
+                         ['100', '15', '1', '3', '1', '7'])
+        self.assertEqual(executar_closures(PROGRAMAS['troca_e_strings']),
+                         ['aspas "x" e \\', 'linha\nnova', '9', 'nada'])
+        self.assertEqual(executar_closures(PROGRAMAS['inteiro_longo']),
+                         ['1' + '0' * 5000, '-1' + '0' * 4999 + '1'])
+
+    def test_variaveis_globais_devolvidas(self):
+        globais = compile_program(Parser('var a = 2; func f() { a = a + 1; } f();').parse()).run()
+        self.assertEqual(globais, {'a': 3})
+
+    def test_funcao_chamada_antes_da_declaracao(self):
+        self.assertEqual(executar_closures('print(dobro(4)); func dobro(n) { return n * 2; }'),
+                         ['8'])
+
+    def test_erros_com_posicao(self):
+        casos = {
+            'var a = 1;\nprint(a / 0);': (2, 9, 'divisão por zero'),
+            'print(1 + "a");': (1, 9, "operação '+' inválida para inteiro e texto"),
+            'x = 1;': (1, 1, "variável 'x' não declarada"),
+            'print(f(1));': (1, 7, "função 'f' não declarada"),
+            'func f(a) { return a; }\nprint(f());': (2, 7, "função 'f' espera 1 argumento(s), recebeu 0"),
+        }
+        for source, (linha, coluna, mensagem) in casos.items():
+            for executar in (executar_closures, executar_walker):
+                with self.subTest(source=source, executor=executar.__name__):
+                    with self.assertRaises(NocSysRuntimeError) as ctx:
+                        executar(source)
+                    self.assertEqual((ctx.exception.line, ctx.exception.column,
+                                      ctx.exception.message), (linha, coluna, mensagem))
+
+    def test_erros_de_compilacao(self):
+        with self.assertRaises(NocSysRuntimeError):
+            compile_program(Parser('func f() {} func f() {}').parse())
+
+    def test_erros_so_quando_executados(self):
+        for source, esperado in ERROS_EM_EXECUCAO.items():
+            for executar in (executar_closures, executar_walker):
+                with self.subTest(source=source, executor=executar.__name__):
+                    self.assertEqual(saida_e_erro(executar, source), esperado)
+
+    def test_recursao_profunda(self):
+        source = 'func soma(n) { if (n == 0) { return 0; } return n + soma(n - 1); } print(soma(5000));'
+        self.assertEqual(executar_closures(source), ['12502500'])
+
+
+if __name__ == '__main__':
+    unittest.main()
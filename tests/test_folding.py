@@ -0,0 +1,125 @@
+# tests/test_folding.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser
+from src.parser.ast import Program, PrintStmt, LiteralExpr, VarExpr, BinaryExpr, UnaryExpr
+from src.optimizer import fold_constants
+from src.optimizer.folding import variable_types
+from src.executor import transpile
+from src.executor.closures import compile_program
+from src.executor.walker import TreeWalker
+from src.executor.bytecode import compile_module
+from src.executor.vm import VM
+from src.executor.runtime import NocSysRuntimeError
+from test_executor import PROGRAMAS
+
+CONSTANTES = '''
+    print(2 * 3 + 4 ** 2 - 10 / 4); print(-(-3)); print(-(-true)); print(+2.5);
+    print(7 // 2 * 1.0); print("a" + "b\\"c" + "\\n"); print("ab" * 3); print(1 < 2 == true);
+    print(0x10 - 16); print(-0.0 + 0); print(-0.0 - 0); print(2 ** -1); print(true + true);
+    var i = 0; var s = "x"; var b = true; var r = -0.0;
+    while (i < 3) { i = i + 1; s = s + "y"; }
+    print(i + 0); print(0 + i); print(i * 1); print(s * 1); print(1 * s); print(- -i);
+    print(i // 1); print(i ** 1); print(b + 0); print(- -b); print(r + 0); print(+b); print(r - 0);
+'''
+
+
+def executores():
+    def walker(program, saida):
+        TreeWalker(saida.append).run(program)
+
+    def closures(program, saida):
+        compile_program(program, saida.append).run()
+
+    def vm(program, saida):
+        VM(compile_module(program), saida.append).run()
+
+    def python(program, saida):
+        transpile.execute(transpile.compile_program(program), saida.append)
+
+    return {'walker': walker, 'closures': closures, 'vm': vm, 'python': python}
+
+
+def executar(executor, program):
+    saida = []
+    try:
+        executor(program, saida)
+    except NocSysRuntimeError as erro:
+        saida.append((erro.message, erro.line, erro.column))
+    return saida
+
+
+class TestFolding(unittest.TestCase):
+
+    def test_mesma_saida_em_todos_os_backends(self):
+        programas = dict(PROGRAMAS, constantes=CONSTANTES)
+        for nome, source in programas.items():
+            original = Parser(source).parse()
+            dobrado, _ = fold_constants(original)
+            for backend, executor in executores().items():
+                with self.subTest(programa=nome, backend=backend):
+                    self.assertEqual(executar(executor, dobrado), executar(executor, original))
+
+    def test_subarvores_constantes_viram_literais(self):
+        program, stats = fold_constants(Parser(
+            'print(2 * 3 + 4 ** 2 - 10 / 4); print("a" + "b"); print(-(-3)); print(1 < 2);').parse())
+        valores = [statement.value.value for statement in program.declarations]
+        self.assertEqual(valores, [19.5, '"ab"', 3, True])
+        self.assertEqual(stats.folded, 9)
+        self.assertEqual(stats.eliminated, 16)
+
+    def test_erros_ficam_para_a_execucao(self):
+        casos = {
+            'print(1 / 0);': ('divisão por zero', 1, 9),
+            'print(2 + (1 // 0));': ('divisão por zero', 1, 14),
+            'print("a" - 1);': ("operação '-' inválida para texto e inteiro", 1, 11),
+            'print((0 - 8) ** 0.5);': ("resultado complexo em '**'", 1, 15),
+            'print(-"a");': ("operação '-' inválida para texto", 1, 7),
+        }
+        for source, esperado in casos.items():
+            program, _ = fold_constants(Parser(source).parse())
+            for backend, executor in executores().items():
+                with self.subTest(source=source, backend=backend):
+                    self.assertEqual(executar(executor, program), [esperado])
+
+    def test_identidades_dependem_do_tipo(self):
+        program, stats = fold_constants(Parser(
+            'var i = 0; var b = true; var s = "a";'
+            'print(i + 0); print(b + 0); print(s + 0); print(s * 1); print(- -i); print(- -b);'
+            'func f(x) { return x * 1; }').parse())
+        prints = [decl.value for decl in program.declarations if type(decl) is PrintStmt]
+        self.assertEqual([type(expr) for expr in prints],
+                         [VarExpr, BinaryExpr, BinaryExpr, VarExpr, VarExpr, UnaryExpr])
+        self.assertEqual(stats.identities, 4)
+
+    def test_tipos_das_variaveis(self):
+        tipos = variable_types(Parser(
+            'var i = 0; var j = i; var k; var t = 1.5; t = t * 2;'
+            'while (i < 10) { i = i + 1; } j <-> k; func f(p) { var q = p; }').parse())
+        self.assertEqual(tipos['i'], {int})
+        self.assertEqual(tipos['t'], {float})
+        self.assertEqual(tipos['j'], {int, type(None)})
+        self.assertEqual(tipos['j'], tipos['k'])
+        self.assertEqual(len(tipos['q']), 5)
+
+    def test_resultados_grandes_nao_sao_dobrados(self):
+        program, stats = fold_constants(Parser('print(2 ** 100000); print("ab" * 10000);').parse())
+        self.assertEqual(stats.folded, 0)
+        self.assertTrue(all(type(decl.value) is BinaryExpr for decl in program.declarations))
+
+    def test_ast_original_nao_muda(self):
+        original = Parser('var a = 1 + 2; print(a * 1);').parse()
+        copia = Parser('var a = 1 + 2; print(a * 1);').parse()
+        dobrado, _ = fold_constants(original)
+        self.assertEqual(original, copia)
+        self.assertIsInstance(dobrado, Program)
+        self.assertEqual(dobrado.declarations[0].init_expr, LiteralExpr(3))
+
+
+if __name__ == '__main__':
+    unittest.main()
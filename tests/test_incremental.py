@@ -0,0 +1,116 @@
+# tests/test_incremental.py
+import unittest
+import random
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser
+from src.parser.incremental import TextEdit, parse, reparse
+
+FONTE = '''func f(a) {
+    var b = a * 2;
+    print("linha
+quebrada");
+    return b;
+}
+var x = f(1); var y = 2;
+print(x <-> y);
+'''
+
+
+class TestReparse(unittest.TestCase):
+
+    def _reparse(self, source, edit):
+        program = parse(source)
+        new_program, new_source = reparse(program, source, edit)
+        self.assertEqual(new_source, edit.apply(source))
+        self.assertEqual(new_program, Parser(new_source).parse())
+        self.assertEqual([(s.start, s.end) for s in new_program.spans],
+                         [(s.start, s.end) for s in parse(new_source).spans])
+        return program, new_program
+
+    def test_reaproveita_declaracoes_fora_da_edicao(self):
+        pos = FONTE.index('2;')
+        antigo, novo = self._reparse(FONTE, TextEdit(pos, pos + 1, '30'))
+        self.assertIsNot(novo.declarations[0], antigo.declarations[0])
+        for i in (1, 2, 3):
+            self.assertIs(novo.declarations[i], antigo.declarations[i])
+
+    def test_quebra_de_linha_desloca_linhas_e_colunas(self):
+        pos = FONTE.index('var b')
+        antigo, novo = self._reparse(FONTE, TextEdit(pos, pos, '\n\n'))
+        self.assertIs(novo.declarations[3], antigo.declarations[3])
+        self.assertEqual(novo.declarations[3].value.op.line, 10)
+
+    def test_mesma_linha_da_edicao(self):
+        pos = FONTE.index('f(1)') + 2
+        antigo, novo = self._reparse(FONTE, TextEdit(pos, pos + 1, '1000'))
+        self.assertIs(novo.declarations[2], antigo.declarations[2])
+        self.assertEqual(novo.declarations[2].name.column, 22)
+
+    def test_edicao_que_junta_e_separa_declaracoes(self):
+        fim_da_funcao = FONTE.index('}\nvar x')
+        # Apagar o '}' final faz a função engolir o resto: o parse completo falha igual
+        with self.assertRaises(SyntaxError):
+            reparse(parse(FONTE), FONTE, TextEdit(fim_da_funcao, fim_da_funcao + 1, ''))
+        # Inserir uma declaração nova entre as existentes
+        pos = FONTE.index('var y')
+        self._reparse(FONTE, TextEdit(pos, pos, 'var z = 3;\n'))
+        # Juntar duas declarações numa só
+        pos = FONTE.index('; var y = 2')
+        self._reparse(FONTE, TextEdit(pos, pos + len('; var y = 2'), ' + y'))
+
+    def test_else_novo_depois_de_if_reaproveitado(self):
+        source = 'if (a) { print(1); } \nvar z = 2;\n'
+        pos = source.index('\n')
+        antigo, novo = self._reparse(source, TextEdit(pos, pos, ' else { print(2); }'))
+        self.assertIsNotNone(novo.declarations[0].else_branch)
+        # Edição longe do lookahead: o if continua reaproveitado
+        pos = source.index('2;')
+        antigo, novo = self._reparse(source, TextEdit(pos, pos + 1, '3'))
+        self.assertIs(novo.declarations[0], antigo.declarations[0])
+
+    def test_else_novo_depois_de_if_aninhado(self):
+        fontes = (
+            'while (a) if (b) print(1); \nvar z = 2;\n',
+            'if (a) print(0); else if (b) print(1); \nvar z = 2;\n',
+            'if (a) print(0); else while (b) if (c) print(1); \nvar z = 2;\n',
+        )
+        for source in fontes:
+            with self.subTest(source=source):
+                pos = source.index('\n')
+                self._reparse(source, TextEdit(pos, pos, ' else print(3);'))
+
+    def test_program_sem_trechos_faz_parse_completo(self):
+        program = Parser(FONTE).parse()
+        novo, source = reparse(program, FONTE, TextEdit(0, 0, 'var w = 0;'))
+        self.assertEqual(novo, Parser(source).parse())
+        self.assertIsNotNone(novo.spans)
+
+    def test_edicoes_aleatorias_iguais_ao_parse_completo(self):
+        rnd = random.Random(7)
+        source = FONTE * 3
+        program = parse(source)
+        aplicadas = 0
+        for _ in range(400):
+            start = rnd.randrange(len(source) + 1)
+            end = min(len(source), start + rnd.choice((0, 0, 1, 3)))
+            text = rnd.choice(('', ' ', '\n', 'x', '7', ';', '}', '{', '(', 'var ', 'print(1);'))
+            edit = TextEdit(start, end, text)
+            try:
+                esperado = Parser(edit.apply(source)).parse()
+            except SyntaxError:
+                with self.assertRaises(SyntaxError):
+                    reparse(program, source, edit)
+                continue
+            program, source = reparse(program, source, edit)
+            self.assertEqual(program, esperado)
+            aplicadas += 1
+        self.assertGreater(aplicadas, 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
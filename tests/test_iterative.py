@@ -0,0 +1,112 @@
+# tests/test_iterative.py
+import unittest
+import sys
+import os
+import time
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer.buffer import TokenBuffer
+from src.parser.parser import Parser, ParserError
+from src.parser.iterative import IterativeParser
+from src.parser.ast import Block, IfStmt, UnaryExpr, CallExpr, BinaryExpr, VarExpr, LiteralExpr
+
+EXEMPLO = '''func calcular_area(raio) {
+    var pi = 3.14159;
+    var area = pi * raio * raio;
+    if (area >= 100.0) { print("grande"); } else if (area == 0) ; else { x <-> y; }
+    while (area > 1) { area = area // 2 - -1 ** 2; }
+    return f(area, g(1, (2 + 3)), 0x1F) + -raio;
+}
+print(calcular_area(10));
+'''
+
+PROFUNDIDADE = 100_000
+
+
+def parse(source):
+    return IterativeParser(tokens=TokenBuffer.from_source(source)).parse()
+
+
+def descer(node, proximo):
+    """Segue `proximo` até o fim e retorna (profundidade, nó final) sem recursão."""
+    depth = 0
+    while True:
+        filho = proximo(node)
+        if filho is None:
+            return depth, node
+        node = filho
+        depth += 1
+
+
+class TestIterativeParser(unittest.TestCase):
+
+    def test_mesma_ast_que_o_parser_recursivo(self):
+        self.assertEqual(IterativeParser(EXEMPLO).parse(), Parser(EXEMPLO).parse())
+
+    def test_mesma_ast_em_aninhamento_moderado(self):
+        fonte = "var x = " + "(" * 200 + "- " * 200 + "a" + ")" * 200 + ";" + "{" * 200 + "}" * 200
+        self.assertEqual(IterativeParser(fonte).parse(), Parser(fonte).parse())
+
+    def test_mesmos_erros(self):
+        for fonte in ("var x = 1 + ;", "{ print(1) }", "if (a { }", "var = 2;"):
+            with self.subTest(fonte=fonte):
+                with self.assertRaises(ParserError) as esperado:
+                    Parser(fonte).parse()
+                with self.assertRaises(ParserError) as obtido:
+                    IterativeParser(fonte).parse()
+                self.assertEqual(str(obtido.exception), str(esperado.exception))
+
+
+class TestAninhamentoProfundo(unittest.TestCase):
+
+    def test_parenteses(self):
+        fonte = "var x = " + "(" * PROFUNDIDADE + "1" + ")" * PROFUNDIDADE + ";"
+        self.assertEqual(parse(fonte).declarations[0].init_expr.value, 1)
+
+    def test_menos_unario(self):
+        fonte = "var x = " + "- " * PROFUNDIDADE + "x;"
+        expr = parse(fonte).declarations[0].init_expr
+        depth, folha = descer(expr, lambda n: n.right if isinstance(n, UnaryExpr) else None)
+        self.assertEqual(depth, PROFUNDIDADE)
+        self.assertIsInstance(folha, VarExpr)
+
+    def test_potencia_associa_a_direita(self):
+        fonte = "var x = " + "2 ** " * PROFUNDIDADE + "2;"
+        expr = parse(fonte).declarations[0].init_expr
+        depth, folha = descer(expr, lambda n: n.right if isinstance(n, BinaryExpr) else None)
+        self.assertEqual(depth, PROFUNDIDADE)
+        self.assertIsInstance(folha, LiteralExpr)
+
+    def test_blocos(self):
+        fonte = "{" * PROFUNDIDADE + "print(1);" + "}" * PROFUNDIDADE
+        bloco = parse(fonte).declarations[0]
+        depth, folha = descer(bloco, lambda n: n.statements[0] if isinstance(n, Block) else None)
+        self.assertEqual(depth, PROFUNDIDADE)
+
+    def test_ifs_aninhados(self):
+        fonte = "if (a) " * PROFUNDIDADE + "print(1);"
+        stmt = parse(fonte).declarations[0]
+        depth, _ = descer(stmt, lambda n: n.then_branch.statements[0] if isinstance(n, IfStmt) else None)
+        self.assertEqual(depth, PROFUNDIDADE)
+
+    def test_chamadas(self):
+        fonte = "var x = " + "f(" * PROFUNDIDADE + ")" * PROFUNDIDADE + ";"
+        expr = parse(fonte).declarations[0].init_expr
+        depth, _ = descer(expr, lambda n: n.args[0] if isinstance(n, CallExpr) and n.args else None)
+        self.assertEqual(depth, PROFUNDIDADE - 1)
+
+    def test_escala_linear(self):
+        def tempo(n):
+            buffer = TokenBuffer.from_source("var x = " + "(" * n + "1" + ")" * n + ";")
+            inicio = time.perf_counter()
+            IterativeParser(tokens=buffer).parse()
+            return time.perf_counter() - inicio
+
+        # 8x mais aninhamento: linear fica perto de 8, quadrático ficaria perto de 64
+        self.assertLess(tempo(80_000) / tempo(10_000), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+# tests/test_lexer.py
+import unittest
+import sys
+import os
+import time
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer.lexer import Lexer
+from src.lexer.tokens import TokenType
+from src.parser.parser import Parser, ParserError
+
+EXEMPLO = '''func calcular_area(raio) {
+    var pi = 3.14159;
+    var area = pi * raio * raio;
+    if (area >= 100.0) { print("Area \\"grande\\""); } else { x <-> y; }
+    return 0x1F + 0;
+}
+'''
+
+
+def tipos_e_valores(tokens):
+    return [(t.type, t.value, t.line, t.column) for t in tokens]
+
+
+class TestLexer(unittest.TestCase):
+
+    def test_scanner_igual_aos_afds_separados(self):
+        for fonte in (EXEMPLO, 'var x² = 1;', 'var _x١ = 1;', 'var área_² = x١ + ação;'):
+            with self.subTest(fonte=fonte):
+                novo = Lexer(fonte).get_all_tokens()
+                antigo = Lexer(fonte, use_scanner=False).get_all_tokens()
+                self.assertEqual(tipos_e_valores(novo), tipos_e_valores(antigo))
+
+    def test_keyword_e_match_mais_longo(self):
+        tokens = Lexer("var variavel <-> <= 0xFF 3.14").get_all_tokens()
+        self.assertEqual(
+            [(t.type, t.value) for t in tokens],
+            [('KEYWORD', 'var'), ('IDENTIFIER', 'variavel'), ('SWAP', '<->'),
+             ('LESS_EQUAL', '<='), ('HEXADECIMAL', '0xFF'), ('FLOAT', '3.14'),
+             ('EOF', 'EOF')],
+        )
+
+    def test_caracteres_nao_ascii(self):
+        tokens = Lexer('var ação = "olá €";').get_all_tokens()
+        self.assertEqual(
+            [(t.type, t.value) for t in tokens[:4]],
+            [('KEYWORD', 'var'), ('IDENTIFIER', 'ação'), ('ASSIGN', '='), ('STRING', '"olá €"')],
+        )
+        with self.assertRaises(SyntaxError):
+            Lexer("x = €;").get_all_tokens()
+
+    def test_caractere_invalido(self):
+        with self.assertRaises(SyntaxError):
+            Lexer("var x = @;").get_all_tokens()
+
+    def test_string_com_quebra_de_linha(self):
+        fonte = 'print("a\nbc");\n y'
+        for use_scanner in (True, False):
+            tokens = Lexer(fonte, use_scanner=use_scanner).get_all_tokens()
+            self.assertEqual([(t.value, t.line, t.column) for t in tokens[3:]],
+                             [(')', 2, 4), (';', 2, 5), ('y', 3, 2), ('EOF', 3, 3)])
+
+    def test_tipos_inteiros(self):
+        tokens = Lexer('var x = (a * 2);').get_all_tokens()
+        self.assertEqual(
+            [t.kind for t in tokens],
+            [TokenType.KW_VAR, TokenType.IDENTIFIER, TokenType.ASSIGN, TokenType.LPAREN,
+             TokenType.IDENTIFIER, TokenType.MULTIPLY, TokenType.INTEGER, TokenType.RPAREN,
+             TokenType.SEMICOLON, TokenType.EOF],
+        )
+
+    def test_erro_do_parser_descreve_o_tipo_esperado(self):
+        with self.assertRaises(ParserError) as ctx:
+            Parser("var x = 1").parse()
+        self.assertIn("esperado SYMBOL(';')", str(ctx.exception))
+
+
+class TestLexerEscala(unittest.TestCase):
+    """O tempo de lexing deve crescer linearmente com o tamanho da entrada."""
+
+    def _tempo(self, source, use_scanner):
+        melhor = None
+        for _ in range(3):
+            inicio = time.perf_counter()
+            Lexer(source, use_scanner=use_scanner).get_all_tokens()
+            decorrido = time.perf_counter() - inicio
+            melhor = decorrido if melhor is None else min(melhor, decorrido)
+        return melhor
+
+    def _razao(self, use_scanner):
+        pequeno = EXEMPLO * 100
+        grande = EXEMPLO * 800
+        return self._tempo(grande, use_scanner) / self._tempo(pequeno, use_scanner)
+
+    def test_escala_linear(self):
+        # 8x mais entrada: linear fica perto de 8, quadrático ficaria perto de 64
+        for use_scanner in (True, False):
+            with self.subTest(use_scanner=use_scanner):
+                self.assertLess(self._razao(use_scanner), 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
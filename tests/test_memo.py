@@ -0,0 +1,129 @@
+# tests/test_memo.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser
+from src.optimizer import pure_functions
+from src.executor.closures import compile_program
+from src.executor.memo import LRUCache, MISSING, memo_key
+from src.executor.runtime import NocSysRuntimeError
+from test_executor import PROGRAMAS, executar_closures
+
+FIB = 'func fib(n) {{ if (n < 2) {{ return n; }} return fib(n - 1) + fib(n - 2); }} print(fib({n}));'
+
+
+def executar_memoizado(source, tamanho=128):
+    saida = []
+    program = compile_program(Parser(source).parse(), saida.append, memoize=tamanho)
+    program.run()
+    return saida, program.caches
+
+
+class TestPureza(unittest.TestCase):
+
+    def puras(self, source):
+        return pure_functions(Parser(source).parse())
+
+    def test_funcoes_puras(self):
+        self.assertEqual(self.puras(
+            'func quadrado(x) { var y = x * x; return y; }'
+            'func soma(a, b) { { var t = a; a = t + b; } return quadrado(a); }'
+            'func troca(a, b) { a <-> b; return a; }'
+            'func fib(n) { if (n < 2) { return n; } return fib(n - 1) + fib(n - 2); }'),
+            {'quadrado', 'soma', 'troca', 'fib'})
+
+    def test_funcoes_impuras(self):
+        self.assertEqual(self.puras(
+            'var g = 1;'
+            'func escreve(x) { print(x); return x; }'
+            'func le_global(x) { return x + g; }'
+            'func muda_global(x) { g = x; return x; }'
+            'func troca_global(x) { x <-> g; return x; }'
+            'func chama_impura(x) { return escreve(x); }'
+            'func chama_inexistente(x) { return nada(x); }'
+            'func local_depois(x) { g = 2; var g = 3; return g; }'
+            'func mutua_a(n) { if (n == 0) { return escreve(0); } return mutua_b(n - 1); }'
+            'func mutua_b(n) { return mutua_a(n); }'),
+            set())
+
+    def test_recursao_mutua_pura(self):
+        self.assertEqual(self.puras(
+            'func par(n) { if (n == 0) { return true; } return impar(n - 1); }'
+            'func impar(n) { if (n == 0) { return false; } return par(n - 1); }'),
+            {'par', 'impar'})
+
+    def test_nome_repetido_nao_e_analisado(self):
+        self.assertEqual(self.puras('func f() { return 1; } func f() { return 2; }'), set())
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_descarta_o_menos_usado(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIs(cache.get('b'), MISSING)
+        self.assertEqual((cache.get('a'), cache.get('c')), (1, 3))
+        self.assertEqual((len(cache), cache.hits, cache.misses), (2, 3, 1))
+
+    def test_tamanho_invalido(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+
+    def test_chaves_distinguem_tipos(self):
+        chaves = {memo_key((1,)), memo_key((1.0,)), memo_key((True,)),
+                  memo_key((0.0,)), memo_key((-0.0,)), memo_key(('1',))}
+        self.assertEqual(len(chaves), 6)
+        self.assertEqual(memo_key((1, 'a')), (1, 'a'))
+
+
+class TestMemoizacao(unittest.TestCase):
+
+    def test_mesma_saida_que_sem_cache(self):
+        for nome, source in PROGRAMAS.items():
+            with self.subTest(programa=nome):
+                saida, _ = executar_memoizado(source)
+                self.assertEqual(saida, executar_closures(source))
+
+    def test_fibonacci_linear(self):
+        saida, caches = executar_memoizado(FIB.format(n=200))
+        self.assertEqual(saida, ['280571172992510140037611932413038677189525'])
+        cache = caches['fib']
+        self.assertEqual((cache.misses, cache.hits), (201, 198))
+
+    def test_tamanho_configuravel(self):
+        _, caches = executar_memoizado(FIB.format(n=20), tamanho=2)
+        self.assertEqual(len(caches['fib']), 2)
+        self.assertEqual(caches['fib'].maxsize, 2)
+
+    def test_funcoes_impuras_nao_usam_cache(self):
+        saida, caches = executar_memoizado(
+            'var n = 0; func conta(x) { n = n + x; return n; }'
+            'func eco(x) { print(x); return x; }'
+            'print(conta(1)); print(conta(1)); eco(2); eco(2);')
+        self.assertEqual(saida, ['1', '2', '2', '2'])
+        self.assertEqual(caches, {})
+
+    def test_argumentos_de_tipos_diferentes(self):
+        saida, caches = executar_memoizado(
+            'func id(x) { return x; } print(id(1)); print(id(1.0)); print(id(true));'
+            'print(id(0.0)); print(id(-0.0)); print(id(1));')
+        self.assertEqual(saida, ['1', '1.0', 'true', '0.0', '-0.0', '1'])
+        self.assertEqual((caches['id'].hits, caches['id'].misses), (1, 5))
+
+    def test_erros_nao_sao_guardados(self):
+        source = 'func inv(x) { return 1 / x; } print(inv(2)); print(inv(0));'
+        program = compile_program(Parser(source).parse(), lambda texto: None, memoize=8)
+        with self.assertRaises(NocSysRuntimeError):
+            program.run()
+        self.assertEqual(len(program.caches['inv']), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# tests/test_parallel.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer.lexer import Lexer
+from src.lexer.parallel import split_points, segments, lex_parallel, get_all_tokens_parallel
+
+UNIDADE = '''func f_{i}(a) {{
+    var s = "texto com
+quebra e \\" aspas \\\\";
+    print(s <-> a);
+    return a * {i};
+}}
+'''
+
+FONTE = ''.join(UNIDADE.format(i=i) for i in range(60)) + 'print("fim");'
+
+
+class TestLexerParalelo(unittest.TestCase):
+
+    def test_cortes_ficam_fora_de_strings(self):
+        for parts in (2, 3, 7, 50):
+            points = split_points(FONTE, parts)
+            self.assertEqual(points, sorted(set(points)))
+            for point in points:
+                self.assertEqual(FONTE[point - 1], '\n')
+                # tokens sequenciais: nenhuma string atravessa o corte
+                self.assertIn(point, self._inicios_de_linha_fora_de_string())
+
+    def _inicios_de_linha_fora_de_string(self):
+        lexer = Lexer(FONTE)
+        dentro = set()
+        while True:
+            token_type, start, end, _, _ = lexer.next_span()
+            if token_type == 'EOF':
+                break
+            if token_type == 'STRING':
+                dentro.update(range(start + 1, end))
+        return {i + 1 for i, c in enumerate(FONTE) if c == '\n' and i + 1 not in dentro}
+
+    def test_linhas_iniciais_dos_segmentos(self):
+        for start, _, line in segments(FONTE, 5):
+            self.assertEqual(line, FONTE.count('\n', 0, start) + 1)
+
+    def test_mesmos_tokens_que_o_lexer(self):
+        esperado = Lexer(FONTE).get_all_tokens()
+        for workers in (1, 2, 3):
+            with self.subTest(workers=workers):
+                self.assertEqual(get_all_tokens_parallel(FONTE, workers, min_segment_size=64),
+                                 esperado)
+
+    def test_string_sem_fim_nao_gera_cortes(self):
+        fonte = 'var a = 1;\n' * 20 + 'var s = "aberta\n' + 'var b = 2;\n' * 20
+        points = split_points(fonte, 8)
+        self.assertTrue(all(p <= fonte.index('"') for p in points))
+        with self.assertRaises(SyntaxError):
+            Lexer(fonte).get_all_tokens()
+        with self.assertRaises(SyntaxError):
+            lex_parallel(fonte, 2, min_segment_size=16)
+
+    def test_erro_com_mesma_posicao(self):
+        fonte = 'var a = 1;\n' * 50 + 'var b = 1 @ 2;\n' + 'var c = 3;\n' * 50
+        with self.assertRaises(SyntaxError) as sequencial:
+            Lexer(fonte).get_all_tokens()
+        with self.assertRaises(SyntaxError) as paralelo:
+            lex_parallel(fonte, 3, min_segment_size=16)
+        self.assertEqual(str(paralelo.exception), str(sequencial.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# tests/test_parser.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser, ParserError
+from src.parser.ast import BinaryExpr, UnaryExpr, LiteralExpr, VarExpr, CallExpr
+
+
+def expr(source: str):
+    """Expressão inicial da declaração `var _ = <source>;`."""
+    return Parser(f"var _ = {source};").parse().declarations[0].init_expr
+
+
+def forma(node):
+    """Árvore de expressão como tuplas aninhadas, para comparar estrutura."""
+    if isinstance(node, BinaryExpr):
+        return (node.op.value, forma(node.left), forma(node.right))
+    if isinstance(node, UnaryExpr):
+        return (node.op.value, forma(node.right))
+    if isinstance(node, LiteralExpr):
+        return node.value
+    if isinstance(node, VarExpr):
+        return node.name.value
+    if isinstance(node, CallExpr):
+        return (node.callee.value, [forma(arg) for arg in node.args])
+    raise TypeError(node)
+
+
+class TestExpressoes(unittest.TestCase):
+
+    def test_precedencia_e_associatividade(self):
+        self.assertEqual(forma(expr("1 + 2 * 3 - 4")), ('-', ('+', 1, ('*', 2, 3)), 4))
+        self.assertEqual(forma(expr("a - b - c")), ('-', ('-', 'a', 'b'), 'c'))
+        self.assertEqual(forma(expr("2 ** 3 ** 2")), ('**', 2, ('**', 3, 2)))
+        self.assertEqual(forma(expr("-x ** 2")), ('-', ('**', 'x', 2)))
+        self.assertEqual(forma(expr("-x * y")), ('*', ('-', 'x'), 'y'))
+        self.assertEqual(forma(expr("(a + b) // f(c, 1)")),
+                         ('//', ('+', 'a', 'b'), ('f', ['c', 1])))
+
+    def test_todos_os_operadores_relacionais(self):
+        for op in ('<', '<=', '>', '>=', '==', '!=', '<->'):
+            with self.subTest(op=op):
+                self.assertEqual(forma(expr(f"a + 1 {op} b * 2")),
+                                 (op, ('+', 'a', 1), ('*', 'b', 2)))
+
+    def test_literais(self):
+        self.assertEqual(forma(expr("0x1F + 1.5")), ('+', 31, 1.5))
+        self.assertEqual(forma(expr("true")), True)
+        self.assertEqual(forma(expr("false")), False)
+
+    def test_expressao_como_statement(self):
+        stmt = Parser("x <-> y;").parse().declarations[0]
+        self.assertEqual(forma(stmt.expr), ('<->', 'x', 'y'))
+
+    def test_cadeia_longa_sem_recursao(self):
+        # Operadores de mesma precedência são consumidos em laço, não em recursão
+        chain = " + ".join(["1"] * 5000)
+        node = expr(chain)
+        self.assertEqual(node.op.value, '+')
+
+    def test_expressao_invalida(self):
+        with self.assertRaises(ParserError):
+            Parser("var x = 1 + ;").parse()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+# tests/test_regex.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer.regex import RegexError
+from src.lexer.spec import build_spec_dfa, spec_scanner
+from src.lexer.lexer import Lexer
+
+
+class TestRegex(unittest.TestCase):
+
+    def test_operadores_de_regex(self):
+        dfa = build_spec_dfa([('A', r'a(b|c)*d?'), ('NUM', r'[0-9]+'), ('NAO_X', r'[^x\n]')])
+        self.assertEqual(dfa.run("abcbcd"), ('A', 'abcbcd'))
+        self.assertEqual(dfa.run("acb!"), ('A', 'acb'))
+        self.assertEqual(dfa.run("2024x"), ('NUM', '2024'))
+        self.assertEqual(dfa.run("é"), ('NAO_X', 'é'))
+        self.assertEqual(dfa.run("x"), (None, None))
+
+    def test_prioridade_pela_ordem_das_regras(self):
+        dfa = build_spec_dfa([('SE', r'if'), ('ID', r'[a-z]+')])
+        self.assertEqual(dfa.run("if"), ('SE', 'if'))
+        self.assertEqual(dfa.run("iff"), ('ID', 'iff'))
+
+    def test_regex_invalida(self):
+        for pattern in ('(ab', 'a|*', '[z-a]'):
+            with self.assertRaises(RegexError):
+                build_spec_dfa([('X', pattern)])
+
+    def test_novos_operadores_no_lexer(self):
+        tokens = Lexer("a ** b // c != d ?? e |> f => g").get_all_tokens()
+        self.assertEqual(
+            [t.type for t in tokens if t.type != 'IDENTIFIER'],
+            ['POWER', 'FLOOR_DIV', 'NOT_EQUAL', 'NULL_COALESCING', 'PIPE', 'ARROW', 'EOF'],
+        )
+
+    def test_especificacao_compilada_uma_vez(self):
+        self.assertIs(Lexer("x").scanner, Lexer("y").scanner)
+        self.assertIs(spec_scanner(), Lexer("z").scanner)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+# tests/test_resolver.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser
+from src.parser.ast import VarDecl, VarExpr, FuncDecl, Block
+from src.optimizer import resolve_scopes
+from src.optimizer.nodes import children
+from test_executor import PROGRAMAS
+
+
+def resolver(source):
+    program = Parser(source).parse()
+    return program, resolve_scopes(program)
+
+
+def referencias(program):
+    """VarDecl e VarExpr em pré-ordem, como (nome, nó)."""
+    encontrados = []
+    stack = [program]
+    while stack:
+        node = stack.pop()
+        if type(node) is VarDecl:
+            encontrados.append((node.name.value, node))
+        elif type(node) is VarExpr:
+            encontrados.append((node.name.value, node))
+        stack.extend(reversed(children(node)))
+    return encontrados
+
+
+class TestResolver(unittest.TestCase):
+
+    def posicoes(self, source):
+        program, resolution = resolver(source)
+        return [(nome, resolution.location(node)) for nome, node in referencias(program)]
+
+    def test_profundidade_e_slot(self):
+        self.assertEqual(self.posicoes(
+            'var a = 1; var b = 2;'
+            '{ var c = a; { var d = c + b; a = d; } }'),
+            [('a', (0, 0)), ('b', (0, 1)),
+             ('c', (0, 0)), ('a', (1, 0)),
+             ('d', (0, 0)), ('c', (1, 0)), ('b', (2, 1)), ('a', (2, 0)), ('d', (0, 0))])
+
+    def test_funcoes(self):
+        program, resolution = resolver(
+            'func f(x, y) { var z = x; { var w = y + g; return w + z; } }'
+            'var g = 10;')
+        self.assertEqual([(nome, resolution.location(node)) for nome, node in referencias(program)],
+                         [('z', (0, 0)), ('x', (1, 0)),
+                          ('w', (0, 0)), ('y', (2, 1)), ('g', (3, 0)),
+                          ('w', (0, 0)), ('z', (1, 0)),
+                          ('g', (0, 0))])
+        funcao = program.declarations[0]
+        self.assertEqual(list(resolution.scope(funcao).slots), ['x', 'y'])
+        self.assertEqual(list(resolution.scope(funcao.body).slots), ['z'])
+        self.assertEqual(resolution.scope(program).kind, 'programa')
+        self.assertEqual(resolution.undeclared, [])
+
+    def test_declaracao_vale_depois_do_inicializador(self):
+        self.assertEqual(self.posicoes('var x = 1; { var x = x + 1; }'),
+                         [('x', (0, 0)), ('x', (0, 0)), ('x', (1, 0))])
+
+    def test_redeclaracao_reaproveita_o_slot(self):
+        program, resolution = resolver('var a = 1; var b = 2; var a = 3;')
+        self.assertEqual([resolution.location(decl) for decl in program.declarations],
+                         [(0, 0), (0, 1), (0, 0)])
+        self.assertEqual(len(resolution.scope(program)), 2)
+        self.assertEqual(resolution.shadowed, [])
+
+    def test_nao_declarados(self):
+        program, resolution = resolver(
+            'print(x); var x = 1;'
+            'func f() { y = 2; return z + x + nada(); }'
+            '{ var local = 1; } func g() { return local; }')
+        self.assertEqual([(t.value, t.line, t.column) for t in resolution.undeclared],
+                         [('x', 1, 7), ('y', 1, 32), ('z', 1, 46), ('local', 1, 100)])
+        self.assertEqual([t.value for t in resolution.undeclared_functions], ['nada'])
+
+    def test_sombreados(self):
+        program, resolution = resolver(
+            'var x = 1;\n'
+            'func f(x) { { var x = 2; } var y = x; { var y = 3; } }\n'
+            '{ var x = 4; }')
+        pares = [((novo.value, novo.line, novo.column), (antigo.line, antigo.column))
+                 for novo, antigo in resolution.shadowed]
+        self.assertEqual(pares, [
+            (('x', 3, 7), (1, 5)),    # bloco do topo sombreia a global
+            (('x', 2, 8), (1, 5)),    # parâmetro sombreia a global
+            (('x', 2, 19), (2, 8)),   # bloco sombreia o parâmetro
+            (('y', 2, 45), (2, 32)),  # bloco interno sombreia o do corpo
+        ])
+
+    def test_parametros_repetidos(self):
+        program, resolution = resolver('func f(a, a) { return a; }')
+        funcao = program.declarations[0]
+        self.assertEqual(len(resolution.scope(funcao)), 2)
+        self.assertEqual(self.posicoes('func f(a, a) { return a; }'), [('a', (1, 1))])
+
+    def test_programas_validos_resolvem_tudo(self):
+        for nome, source in PROGRAMAS.items():
+            with self.subTest(programa=nome):
+                program, resolution = resolver(source)
+                self.assertEqual(resolution.undeclared, [])
+                self.assertEqual(resolution.undeclared_functions, [])
+                for _, node in referencias(program):
+                    self.assertIsNotNone(resolution.location(node))
+                stack = [program]
+                while stack:
+                    node = stack.pop()
+                    if type(node) in (FuncDecl, Block):
+                        self.assertIsNotNone(resolution.scope(node))
+                    stack.extend(children(node))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# tests/test_stream.py
+import unittest
+import sys
+import os
+import io
+import mmap
+import tempfile
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.lexer.lexer import Lexer
+from src.lexer.stream import StreamingLexer, stream_tokens
+from src.lexer.spec import spec_scanner
+
+FONTE = '''func área(raio) {
+    var identificador_bem_comprido_que_cruza_blocos = "string longa com \\"aspas\\" e acentuação ção";
+    x <-> y; a <= b; c != d ** 2;
+    return 0x1F + 3.14159;
+}
+'''
+
+
+def resumo(tokens):
+    return [(t.type, t.value, t.line, t.column) for t in tokens]
+
+
+class TestStreamingLexer(unittest.TestCase):
+
+    def test_mesmos_tokens_com_qualquer_tamanho_de_bloco(self):
+        esperado = resumo(Lexer(FONTE).get_all_tokens())
+        dados = FONTE.encode('utf-8')
+        for chunk_size in (1, 2, 3, 5, 7, 64, 4096):
+            with self.subTest(chunk_size=chunk_size):
+                tokens = stream_tokens(io.BytesIO(dados), chunk_size=chunk_size)
+                self.assertEqual(resumo(tokens), esperado)
+
+    def test_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(FONTE.encode('utf-8') * 50)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tokens = resumo(StreamingLexer(mm, chunk_size=100))
+        self.assertEqual(tokens, resumo(Lexer(FONTE * 50).get_all_tokens()))
+
+    def test_memoria_limitada_pelo_maior_token(self):
+        lexer = StreamingLexer(io.BytesIO(b'var x = 1;\n' * 10000), chunk_size=64)
+        maior = 0
+        for _ in lexer:
+            maior = max(maior, len(lexer.buffer))
+        self.assertLess(maior, 3 * 64)
+
+    def test_token_longo_lido_uma_vez(self):
+        fonte = 'var s = "' + 'x' * 20000 + '"; print(s);'
+        scanner = spec_scanner()
+        lidos = []
+
+        class Contador:
+            def advance(self, text, pos=0, state=None):
+                resultado = scanner.advance(text, pos, state)
+                lidos.append(resultado[3] - pos)
+                return resultado
+
+        tokens = StreamingLexer(io.BytesIO(fonte.encode('utf-8')), chunk_size=16,
+                                scanner=Contador())
+        self.assertEqual(resumo(tokens), resumo(Lexer(fonte).get_all_tokens()))
+        self.assertLess(sum(lidos), 2 * len(fonte))
+
+    def test_erro_lexico(self):
+        with self.assertRaises(SyntaxError):
+            list(stream_tokens(io.BytesIO(b'var x = @;'), chunk_size=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+# tests/test_tailcall.py
+import unittest
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser
+from src.executor.bytecode import Op, compile_module
+from src.executor.closures import compile_program
+from src.executor.runtime import NocSysRuntimeError
+from test_executor import executar_closures
+from test_vm import executar_vm
+
+PROFUNDIDADE = 1_000_000
+
+CONTA = '''
+func conta(n, acc) {{ if (n == 0) {{ return acc; }} return conta(n - 1, acc + 1); }}
+print(conta({n}, 0));
+'''
+
+PAR_IMPAR = '''
+func par(n) {{ if (n == 0) {{ return true; }} return impar(n - 1); }}
+func impar(n) {{ if (n == 0) {{ return false; }} return par(n - 1); }}
+print(par({n})); print(impar({n}));
+'''
+
+
+class TestChamadaEmCauda(unittest.TestCase):
+
+    def test_recursao_direta_de_um_milhao(self):
+        self.assertEqual(executar_closures(CONTA.format(n=PROFUNDIDADE)), [str(PROFUNDIDADE)])
+
+    def test_recursao_mutua_de_um_milhao(self):
+        self.assertEqual(executar_closures(PAR_IMPAR.format(n=PROFUNDIDADE)), ['true', 'false'])
+
+    def test_vm_recursao_de_um_milhao(self):
+        self.assertEqual(executar_vm(CONTA.format(n=PROFUNDIDADE)), [str(PROFUNDIDADE)])
+
+    def test_vm_emite_tail_call(self):
+        module = compile_module(Parser(PAR_IMPAR.format(n=3)).parse())
+        for function in module.functions:
+            ops = [Op(op) for op in function.code[::2]]
+            self.assertIn(Op.TAIL_CALL, ops)
+            self.assertEqual(ops.count(Op.CALL), 0)
+
+    def test_chamadas_fora_da_cauda_continuam_normais(self):
+        source = ('func soma(n) { if (n == 0) { return 0; } return n + soma(n - 1); }'
+                  'func f(n) { var r = soma(n); return r; } print(f(100));')
+        module = compile_module(Parser(source).parse())
+        for function in module.functions:
+            self.assertNotIn(Op.TAIL_CALL, [Op(op) for op in function.code[::2]])
+        self.assertEqual(executar_closures(source), ['5050'])
+
+    def test_cauda_dentro_de_laco_e_blocos(self):
+        source = '''
+            func ate(n, limite) {
+                while (true) {
+                    { if (n >= limite) { return n; } }
+                    n = n + 1;
+                    if (n - n // 1000 * 1000 == 0) { return ate(n + 1, limite); }
+                }
+            }
+            func id(x) { return x; }
+            func nada() { return; }
+            func tres(a, b, c) { return id(a + b + c); }
+            print(ate(0, 5000)); print(tres(1, 2, 3)); print(nada());
+        '''
+        esperado = ['5001', '6', 'nada']
+        self.assertEqual(executar_closures(source), esperado)
+        self.assertEqual(executar_vm(source), esperado)
+
+    def test_erros_na_chamada_em_cauda(self):
+        casos = {
+            'func f() { return g(); } f();': "função 'g' não declarada",
+            'func f() { return f(1); } f();': "função 'f' espera 0 argumento(s), recebeu 1",
+            'func f(n) { return g(n - 1); } func g(n) { return 1 / n; } f(1);': 'divisão por zero',
+        }
+        for source, mensagem in casos.items():
+            for executar in (executar_closures, executar_vm):
+                with self.subTest(source=source, executor=executar.__name__):
+                    with self.assertRaises(NocSysRuntimeError) as ctx:
+                        executar(source)
+                    self.assertEqual(ctx.exception.message, mensagem)
+
+    def test_com_memoizacao(self):
+        source = ('func passo(n, acc) { if (n == 0) { return acc; } return passo(n - 1, acc + n); }'
+                  'print(passo(3000, 0)); print(passo(3000, 0));')
+        saida = []
+        compiled = compile_program(Parser(source).parse(), saida.append, memoize=16)
+        compiled.run()
+        self.assertEqual(saida, ['4501500', '4501500'])
+        self.assertEqual(compiled.caches['passo'].hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# tests/test_transpile.py
+import unittest
+from unittest import mock
+import tempfile
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser
+from src.executor import transpile
+from src.executor.transpile import compile_program, execute, to_python_source, load_cached
+from src.executor.runtime import NocSysRuntimeError
+from test_executor import PROGRAMAS, ERROS_EM_EXECUCAO, executar_closures, saida_e_erro
+
+
+def executar_python(source, saida=None):
+    saida = [] if saida is None else saida
+    execute(compile_program(Parser(source).parse()), saida.append)
+    return saida
+
+
+class TestTranspile(unittest.TestCase):
+
+    def test_mesma_saida_que_as_closures(self):
+        for nome, source in PROGRAMAS.items():
+            with self.subTest(programa=nome):
+                self.assertEqual(executar_python(source), executar_closures(source))
+
+    def test_nomes_sem_colisao(self):
+        codigo = to_python_source(Parser(
+            'var print_ = 1; var x = 2;'
+            'func f(x) { { var x = 3; } return x; }'
+            '{ var x = 4; } func x_() { return x; }'
+        ).parse())
+        for nome in ('v_print_', 'v_x', 'v3_x', 'b1_x', 'def f_f(v_x)', 'def f_x_()'):
+            self.assertIn(nome, codigo)
+
+    def test_globais_devolvidas(self):
+        globais = execute(compile_program(Parser(
+            'var a = 2; func f() { a = a + 1; } f(); { var b = 1; }').parse()))
+        self.assertEqual(globais, {'a': 3})
+
+    def test_erros_com_posicao_do_token(self):
+        casos = {
+            'var a = 1;\nprint(a / 0);': (2, 9, 'divisão por zero'),
+            'func f(x) { return -x; }\nprint(f("a"));': (1, 20, "operação '-' inválida para texto"),
+            'print("a" < 1);': (1, 11, "operação '<' inválida para texto e inteiro"),
+            'print((0 - 8) ** 0.5);': (1, 15, "resultado complexo em '**'"),
+            'func g() { y = 2; }\ng();': (1, 12, "variável 'y' não declarada"),
+            'var a = 1; a <-> b;': (1, 18, "variável 'b' não declarada"),
+            'print(f(1));': (1, 7, "função 'f' não declarada"),
+            'print("a" * 1.5);': (1, 11, "operação '*' inválida para texto e real"),
+            'var s = "a";\nprint(s * s);': (2, 9, "operação '*' inválida para texto e texto"),
+        }
+        for source, esperado in casos.items():
+            with self.subTest(source=source):
+                with self.assertRaises(NocSysRuntimeError) as ctx:
+                    executar_python(source)
+                erro = ctx.exception
+                self.assertEqual((erro.line, erro.column, erro.message), esperado)
+
+    def test_erro_do_print_nao_vira_erro_de_operador(self):
+        def saida(texto):
+            raise ValueError(texto)
+        with self.assertRaises(ValueError) as ctx:
+            execute(compile_program(Parser('print(10 ** 5000);').parse()), saida)
+        self.assertEqual(str(ctx.exception), '1' + '0' * 5000)
+
+    def test_erros_so_quando_executados(self):
+        for source, esperado in ERROS_EM_EXECUCAO.items():
+            with self.subTest(source=source):
+                self.assertEqual(saida_e_erro(executar_python, source), esperado)
+
+    def test_recursao_profunda(self):
+        source = ('func soma(n) { if (n == 0) { return 0; } return n + soma(n - 1); }'
+                  'print(soma(20000));')
+        self.assertEqual(executar_python(source), ['200010000'])
+
+
+class TestCacheDeCodigo(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._env = os.environ.get('NOCSYS_CACHE_DIR')
+        os.environ['NOCSYS_CACHE_DIR'] = self._dir.name
+        transpile._memory_cache.clear()
+
+    def tearDown(self):
+        if self._env is None:
+            del os.environ['NOCSYS_CACHE_DIR']
+        else:
+            os.environ['NOCSYS_CACHE_DIR'] = self._env
+        transpile._memory_cache.clear()
+        self._dir.cleanup()
+
+    def test_cache_em_memoria_e_em_disco(self):
+        source = PROGRAMAS['fibonacci']
+        codigo = load_cached(source)
+        self.assertIs(load_cached(source), codigo)
+        transpile._memory_cache.clear()
+        with mock.patch('src.parser.parser.Parser', side_effect=AssertionError("parse")):
+            do_disco = load_cached(source)
+        self.assertEqual(do_disco.co_code, codigo.co_code)
+        saida = []
+        execute(do_disco, saida.append)
+        self.assertEqual(saida, executar_closures(source))
+
+    def test_arquivo_corrompido_e_regerado(self):
+        source = 'print(1);'
+        load_cached(source)
+        transpile._memory_cache.clear()
+        with open(transpile.cache_path(transpile.source_key(source)), 'r+b') as f:
+            f.seek(-4, os.SEEK_END)
+            f.write(b'\x00' * 4)
+        saida = []
+        execute(load_cached(source), saida.append)
+        self.assertEqual(saida, ['1'])
+
+
+if __name__ == '__main__':
+    unittest.main()
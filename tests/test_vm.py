@@ -0,0 +1,127 @@
+# tests/test_vm.py
+import unittest
+from unittest import mock
+import tempfile
+import sys
+import os
+
+# Adiciona a raiz do projeto ao path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.parser.parser import Parser
+from src.executor.bytecode import Module, Op, compile_module, load_cached, cache_path, source_key
+from src.executor.runtime import NocSysRuntimeError
+from src.executor.vm import VM
+from test_executor import PROGRAMAS, ERROS_EM_EXECUCAO, executar_closures, saida_e_erro
+
+
+def executar_vm(source, saida=None, serializar=False):
+    module = compile_module(Parser(source).parse())
+    if serializar:
+        module = Module.loads(module.dumps())
+    saida = [] if saida is None else saida
+    VM(module, saida.append).run()
+    return saida
+
+
+class TestVM(unittest.TestCase):
+
+    def test_mesma_saida_que_as_closures(self):
+        for nome, source in PROGRAMAS.items():
+            for serializar in (False, True):
+                with self.subTest(programa=nome, serializar=serializar):
+                    self.assertEqual(executar_vm(source, serializar=serializar), executar_closures(source))
+
+    def test_slots_e_constantes_por_funcao(self):
+        module = compile_module(Parser(
+            'func f(a, b) { var c = a + 1; { var c = 2; } return c + 1; } var g = f(1, 2);'
+        ).parse())
+        f = module.functions[0]
+        self.assertEqual((f.nparams, f.nlocals), (2, 4))
+        self.assertEqual(f.constants, [1, 2])
+        self.assertEqual(f.code.typecode, 'i')
+        self.assertIn(Op.DECLARE_GLOBAL.name, ' '.join(module.main.disassemble()))
+        self.assertEqual(module.global_names, ['g'])
+
+    def test_recursao_sem_pilha_do_python(self):
+        source = ('func soma(n) { if (n == 0) { return 0; } return n + soma(n - 1); }'
+                  'print(soma(100000));')
+        self.assertEqual(executar_vm(source), ['5000050000'])
+
+    def test_limite_de_recursao(self):
+        source = 'func f(n) { return 1 + f(n + 1); } print(f(0));'
+        with self.assertRaises(NocSysRuntimeError) as ctx:
+            executar_vm(source)
+        self.assertEqual(ctx.exception.message, "limite de recursão excedido")
+
+    def test_erro_do_print_nao_vira_erro_de_operador(self):
+        def saida(texto):
+            raise ValueError(texto)
+        vm = VM(compile_module(Parser('print(10 ** 5000);').parse()), saida)
+        with self.assertRaises(ValueError) as ctx:
+            vm.run()
+        self.assertEqual(str(ctx.exception), '1' + '0' * 5000)
+
+    def test_erros_com_posicao(self):
+        casos = {
+            'var a = 1;\nprint(a / 0);': (2, 9),
+            'func f(x) { return -x; }\nprint(f("a"));': (1, 20),
+            'x = 1;': (1, 1),
+            'print(y);': (1, 7),
+            'func f(a) { return a; }\nprint(f());': (2, 7),
+        }
+        for source, posicao in casos.items():
+            with self.subTest(source=source):
+                with self.assertRaises(NocSysRuntimeError) as ctx:
+                    executar_vm(source)
+                self.assertEqual((ctx.exception.line, ctx.exception.column), posicao)
+
+    def test_erros_so_quando_executados(self):
+        for source, esperado in ERROS_EM_EXECUCAO.items():
+            with self.subTest(source=source):
+                self.assertEqual(saida_e_erro(executar_vm, source), esperado)
+
+    def test_contador_de_instrucoes(self):
+        vm = VM(compile_module(Parser('var i = 0; while (i < 10) { i = i + 1; }').parse()), print)
+        vm.run()
+        # 2 da declaração, 10 voltas de 9 (teste, corpo, JUMP), 4 do teste final e RETURN_NONE
+        self.assertEqual(vm.instructions, 2 + 10 * 9 + 4 + 1)
+
+    def test_modulo_corrompido(self):
+        data = bytearray(compile_module(Parser('print(1);').parse()).dumps())
+        data[-1] ^= 0xFF
+        with self.assertRaises(ValueError):
+            Module.loads(bytes(data))
+
+
+class TestCacheDeBytecode(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self._env = os.environ.get('NOCSYS_CACHE_DIR')
+        os.environ['NOCSYS_CACHE_DIR'] = self._dir.name
+
+    def tearDown(self):
+        if self._env is None:
+            del os.environ['NOCSYS_CACHE_DIR']
+        else:
+            os.environ['NOCSYS_CACHE_DIR'] = self._env
+        self._dir.cleanup()
+
+    def test_segunda_carga_pula_lexer_e_parser(self):
+        source = PROGRAMAS['fibonacci']
+        original = load_cached(source)
+        self.assertTrue(os.path.exists(cache_path(source_key(source))))
+        with mock.patch('src.parser.parser.Parser', side_effect=AssertionError("parse")):
+            carregado = load_cached(source)
+        self.assertEqual(carregado.dumps(), original.dumps())
+        saida = []
+        VM(carregado, saida.append).run()
+        self.assertEqual(saida, executar_closures(source))
+
+    def test_source_diferente_nao_reaproveita(self):
+        self.assertNotEqual(source_key('print(1);'), source_key('print(2);'))
+
+
+if __name__ == '__main__':
+    unittest.main()